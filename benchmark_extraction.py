@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark the HTML extraction backends over the cached documentation corpus.
+Reports pages/second per backend for category pages (block-dir-item extraction)
+and node pages (paragraphs/tables/code), and checks each backend against the
+full BeautifulSoup output.
+"""
+
+import argparse
+import time
+import logging
+from pathlib import Path
+from typing import Callable, List
+
+from html_extract import available_backends, extract_dir_items, extract_page_content
+from page_store import iter_cached_documents
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def load_html_blocks(cache_dir: Path, limit: int = 0) -> List[List[str]]:
+    """Load the markdown content_html blocks of every cached page (one list per page)."""
+    pages = []
+    for _, data in iter_cached_documents(cache_dir):
+        blocks = [b['content_html'] for b in data.get('blocks', [])
+                  if b.get('type') == 'markdown' and b.get('content_html')]
+        if blocks:
+            pages.append(blocks)
+        if limit and len(pages) >= limit:
+            break
+    return pages
+
+
+def time_backend(pages: List[List[str]], extract: Callable, backend: str, repeat: int):
+    """Return (best seconds per full pass, outputs of the last pass)."""
+    best = float('inf')
+    outputs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [[extract(html, backend) for html in blocks] for blocks in pages]
+        best = min(best, time.perf_counter() - start)
+    return best, outputs
+
+
+def run_suite(label: str, pages: List[List[str]], extract: Callable, repeat: int):
+    if not pages:
+        logger.info(f"\n{label}: no cached pages found, skipping")
+        return
+
+    logger.info(f"\n{label}: {len(pages)} pages")
+    baseline = None
+    for backend in ['soup'] + [b for b in available_backends() if b != 'soup']:
+        elapsed, outputs = time_backend(pages, extract, backend, repeat)
+        if baseline is None:
+            baseline = (elapsed, outputs)
+        speedup = baseline[0] / elapsed if elapsed > 0 else 0.0
+        parity = 'match' if outputs == baseline[1] else 'MISMATCH'
+        logger.info(f"   {backend:<9} {len(pages) / elapsed:>9.1f} pages/s  "
+                    f"({elapsed * 1000:.0f} ms, {speedup:.1f}x vs soup, output {parity})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark HTML extraction backends on the cache')
+    parser.add_argument('--cache-dir', default='cache', help='Category page cache')
+    parser.add_argument('--detailed-cache-dir', default='detailed_cache', help='Node page cache')
+    parser.add_argument('--limit', type=int, default=0, help='Max pages per corpus (0 = all)')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes per backend (best is kept)')
+
+    args = parser.parse_args()
+
+    logger.info("⏱️  HTML extraction benchmark")
+    logger.info(f"   Backends: {', '.join(available_backends())}")
+
+    run_suite('Category pages (block-dir-item)',
+              load_html_blocks(Path(args.cache_dir), args.limit), extract_dir_items, args.repeat)
+    run_suite('Node pages (paragraphs/tables/code)',
+              load_html_blocks(Path(args.detailed_cache_dir), args.limit), extract_page_content, args.repeat)
+
+
+if __name__ == '__main__':
+    main()
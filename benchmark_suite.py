@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Offline benchmark suite for the extraction and merge pipeline.
+Runs only against local data (cache/, detailed_cache/ and the checked-in
+ue_blueprint_*.json files) inside a scratch copy of the working files, so the
+merge scripts that rewrite their inputs never touch the real databases.
+
+For every stage it reports the best wall time over --repeat runs, per-page and
+per-node cost, and peak Python memory (tracemalloc, measured in a separate
+pass), and compares against a stored baseline:
+
+    python benchmark_suite.py --save-baseline     # record benchmark_baseline.json
+    python benchmark_suite.py                     # compare against it
+    python benchmark_suite.py --check             # exit 1 on a regression
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import logging
+import os
+import platform
+import runpy
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+REPO_DIR = Path(__file__).resolve().parent
+if str(REPO_DIR) not in sys.path:
+    sys.path.insert(0, str(REPO_DIR))
+
+from page_store import iter_cached_documents
+from parsed_cache import iter_parsed_pages
+from phase1_5_extract_functions import Phase15FunctionExtractor
+from phase2_detailed_scraper import parse_node_details
+from quick_extract_from_cache import extract_nodes_from_document
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = 'benchmark_baseline.json'
+
+# Checked-in databases the merge scripts read (and some rewrite in place)
+DATA_FILES = [
+    'ue_blueprint_nodes.json',
+    'ue_blueprint_nodes_phase1.json',
+    'ue_blueprint_functions_phase1_5.json',
+    'ue_blueprint_nodes_merged.json',
+]
+
+# Current rebuild order: cache -> Phase 1 -> Phase 1.5 -> merged webapp database
+REBUILD_SCRIPTS = [
+    'extract_categories.py',
+    'add_transformation_functions.py',
+    'merge_all_nodes.py',
+    'make_transformation_spawnable.py',
+]
+
+MERGE_SCRIPTS = [
+    'merge_databases.py',
+    'add_transformation_functions.py',
+    'merge_all_nodes.py',
+    'make_transformation_spawnable.py',
+]
+
+
+class Workspace:
+    """Scratch directory with the caches linked in and fresh copies of the data files.
+
+    cache/ is a real directory whose entries link to the source cache, except
+    parsed/: the parsed-page cache is the workspace's own, so timed passes never
+    write into (or read hits from) the repo's parsed cache.
+    """
+
+    def __init__(self, source: Path):
+        self.source = source
+        self.root = Path(tempfile.mkdtemp(prefix='blueprint-bench-'))
+        if (source / 'cache').exists():
+            (self.root / 'cache').mkdir()
+            for entry in (source / 'cache').iterdir():
+                if entry.name != 'parsed':
+                    os.symlink(entry.resolve(), self.root / 'cache' / entry.name)
+        if (source / 'detailed_cache').exists():
+            os.symlink((source / 'detailed_cache').resolve(), self.root / 'detailed_cache')
+
+    def reset(self):
+        """Restore the data files (merge scripts rewrite some of them)."""
+        for name in DATA_FILES:
+            if (self.source / name).exists():
+                shutil.copy2(self.source / name, self.root / name)
+
+    def reset_cold(self):
+        """reset() and empty the workspace's parsed-page cache."""
+        self.reset()
+        shutil.rmtree(self.root / 'cache' / 'parsed', ignore_errors=True)
+
+    def reset_warm(self):
+        """reset() with every cached page already in the workspace's parsed-page cache."""
+        self.reset()
+        for _ in iter_parsed_pages(self.root / 'cache'):
+            pass
+
+    def node_count(self, name: str) -> int:
+        path = self.root / name
+        if not path.exists():
+            return 0
+        with open(path, 'r', encoding='utf-8') as f:
+            return len(json.load(f).get('nodes', []))
+
+    @contextlib.contextmanager
+    def active(self):
+        """cwd in the workspace, script output and INFO logs silenced."""
+        previous = Path.cwd()
+        os.chdir(self.root)
+        logging.disable(logging.INFO)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                yield
+        finally:
+            logging.disable(logging.NOTSET)
+            os.chdir(previous)
+
+    def cleanup(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+
+def run_script(name: str):
+    # Scripts with their own argparse must not see the suite's arguments
+    argv = sys.argv
+    sys.argv = [str(REPO_DIR / name)]
+    try:
+        runpy.run_path(str(REPO_DIR / name), run_name='__main__')
+    finally:
+        sys.argv = argv
+
+
+def measure(run: Callable, setup: Optional[Callable], repeat: int,
+            memory: bool) -> Tuple[float, Optional[float]]:
+    """Return (best seconds, peak MB or None). setup runs before every pass, untimed."""
+    best = float('inf')
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+
+    peak_mb = None
+    if memory:
+        if setup:
+            setup()
+        tracemalloc.start()
+        try:
+            run()
+            peak_mb = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+        finally:
+            tracemalloc.stop()
+    return best, peak_mb
+
+
+def build_stages(workspace: Workspace) -> List[Dict]:
+    """Each stage: name, run(), optional setup(), page and node counts (or a skip reason)."""
+    category_pages = [data for _, data in iter_cached_documents(workspace.source / 'cache')]
+    detail_pages = [data for _, data in iter_cached_documents(workspace.source / 'detailed_cache')]
+    no_cache = 'no cached category pages' if not category_pages else None
+
+    stages = []
+
+    def add_parsed_cache_stage(stage: Dict):
+        # Stages that read through the parsed-page cache are timed cold (empty
+        # cache, every page parsed) and warm (every page already cached)
+        stages.append({**stage, 'setup': workspace.reset_cold})
+        stages.append({**stage, 'name': f"{stage['name']} (warm)", 'setup': workspace.reset_warm})
+
+    def extract_categories():
+        return [extract_nodes_from_document(data) for data in category_pages]
+
+    stages.append({
+        'name': 'extract_nodes_from_category',
+        'run': extract_categories,
+        'pages': len(category_pages),
+        'nodes': sum(len(nodes) for nodes in extract_categories()),
+        'skip': no_cache,
+    })
+
+    def parse_details():
+        return [parse_node_details(data) for data in detail_pages]
+
+    stages.append({
+        'name': 'parse_node_details',
+        'run': parse_details,
+        'pages': len(detail_pages),
+        'nodes': len(detail_pages),
+        'skip': None if detail_pages else 'no cached node pages',
+    })
+
+    def single_pass_run():
+        with workspace.active():
+            run_script('extract_categories.py')
+
+    add_parsed_cache_stage({
+        'name': 'extract_categories',
+        'run': single_pass_run,
+        'pages': len(category_pages),
+        'output': 'ue_blueprint_nodes_phase1.json',
+        'skip': no_cache,
+    })
+
+    def phase15_run():
+        with workspace.active():
+            Phase15FunctionExtractor().run()
+
+    add_parsed_cache_stage({
+        'name': 'Phase15FunctionExtractor.run',
+        'run': phase15_run,
+        'pages': len(category_pages),
+        'output': 'ue_blueprint_functions_phase1_5.json',
+        'skip': no_cache,
+    })
+
+    for script in MERGE_SCRIPTS:
+        def merge(script=script):
+            with workspace.active():
+                run_script(script)
+
+        stages.append({
+            'name': script[:-3],
+            'run': merge,
+            'setup': workspace.reset,
+            'pages': 0,
+            'output': 'ue_blueprint_nodes_merged.json' if 'merge' in script or 'spawnable' in script
+                      else 'ue_blueprint_functions_phase1_5.json',
+        })
+
+    def rebuild():
+        with workspace.active():
+            for script in REBUILD_SCRIPTS:
+                run_script(script)
+
+    add_parsed_cache_stage({
+        'name': 'end_to_end_rebuild',
+        'run': rebuild,
+        'pages': len(category_pages),
+        'output': 'ue_blueprint_nodes_merged.json',
+        'skip': no_cache,
+    })
+    return stages
+
+
+def run_suite(stages: List[Dict], workspace: Workspace, repeat: int, memory: bool) -> Dict[str, Dict]:
+    results = {}
+    for stage in stages:
+        if stage.get('skip'):
+            logger.info(f"   {stage['name']:<38} skipped ({stage['skip']})")
+            continue
+
+        seconds, peak_mb = measure(stage['run'], stage.get('setup'), repeat, memory)
+        nodes = stage.get('nodes')
+        if nodes is None:
+            nodes = workspace.node_count(stage['output'])
+        results[stage['name']] = {
+            'seconds': round(seconds, 6),
+            'peak_mb': round(peak_mb, 3) if peak_mb is not None else None,
+            'pages': stage['pages'],
+            'nodes': nodes,
+        }
+    return results
+
+
+def format_delta(current: Optional[float], base: Optional[float]) -> str:
+    if not base or current is None:
+        return '      -'
+    return f"{(current - base) / base * 100:+6.1f}%"
+
+
+def report(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """Log the results table; return the names of stages slower or heavier than the baseline allows."""
+    regressions = []
+    logger.info(f"\n{'stage':<38} {'time':>9} {'ms/page':>8} {'us/node':>8} {'peak MB':>8} "
+                f"{'Δtime':>7} {'Δmem':>7}")
+    for name, r in results.items():
+        per_page = f"{r['seconds'] * 1000 / r['pages']:.3f}" if r['pages'] else '-'
+        per_node = f"{r['seconds'] * 1e6 / r['nodes']:.1f}" if r['nodes'] else '-'
+        peak = f"{r['peak_mb']:.1f}" if r['peak_mb'] is not None else '-'
+        base = baseline.get(name, {})
+        logger.info(f"{name:<38} {r['seconds'] * 1000:>7.1f}ms {per_page:>8} {per_node:>8} "
+                    f"{peak:>8} {format_delta(r['seconds'], base.get('seconds'))} "
+                    f"{format_delta(r['peak_mb'], base.get('peak_mb'))}")
+
+        limit = 1 + threshold / 100
+        if base.get('seconds') and r['seconds'] > base['seconds'] * limit:
+            regressions.append(f"{name} time")
+        if base.get('peak_mb') and r['peak_mb'] is not None and r['peak_mb'] > base['peak_mb'] * limit:
+            regressions.append(f"{name} memory")
+    return regressions
+
+
+def merge_baseline(baseline: Dict[str, Dict], results: Dict[str, Dict]) -> Dict[str, Dict]:
+    """New baseline: these results over the old one (keeping old memory figures on --no-memory runs)."""
+    merged = dict(baseline)
+    for name, r in results.items():
+        merged[name] = {**baseline.get(name, {}), **{k: v for k, v in r.items() if v is not None}}
+    return merged
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Offline benchmark suite for the extraction and merge pipeline')
+    parser.add_argument('--data-dir', default=str(REPO_DIR),
+                        help='Directory with cache/, detailed_cache/ and ue_blueprint_*.json')
+    parser.add_argument('--repeat', type=int, default=3, help='Timed passes per stage (best is kept)')
+    parser.add_argument('--stages', nargs='*', help='Only run these stages')
+    parser.add_argument('--no-memory', action='store_true', help='Skip the tracemalloc pass')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='Baseline results file')
+    parser.add_argument('--save-baseline', action='store_true', help='Store these results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='Percent slowdown / memory growth counted as a regression')
+    parser.add_argument('--check', action='store_true', help='Exit with status 1 on any regression')
+
+    args = parser.parse_args()
+
+    workspace = Workspace(Path(args.data_dir).resolve())
+    try:
+        stages = build_stages(workspace)
+        if args.stages:
+            stages = [s for s in stages if s['name'] in args.stages]
+
+        logger.info("⏱️  Blueprint pipeline benchmark")
+        logger.info(f"   Data: {workspace.source}  (scratch copy: {workspace.root})")
+        logger.info(f"   Repeat: {args.repeat}, memory: {'off' if args.no_memory else 'tracemalloc'}\n")
+
+        results = run_suite(stages, workspace, args.repeat, not args.no_memory)
+    finally:
+        workspace.cleanup()
+
+    baseline_file = Path(args.baseline)
+    baseline = {}
+    if baseline_file.exists():
+        with open(baseline_file, 'r', encoding='utf-8') as f:
+            baseline = json.load(f).get('stages', {})
+
+    regressions = report(results, baseline, args.threshold)
+
+    if args.save_baseline:
+        with open(baseline_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'recordedAt': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'stages': merge_baseline(baseline, results),
+            }, f, indent=2)
+        logger.info(f"\n💾 Saved baseline to {baseline_file}")
+    elif not baseline:
+        logger.info(f"\n💡 No baseline at {baseline_file} - run with --save-baseline to record one")
+
+    if regressions:
+        logger.info(f"\n⚠️  Regressions beyond {args.threshold:.0f}%: {', '.join(regressions)}")
+        if args.check:
+            sys.exit(1)
+    elif baseline:
+        logger.info(f"\n✅ No regressions beyond {args.threshold:.0f}%")
+
+
+if __name__ == '__main__':
+    main()
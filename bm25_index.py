@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+BM25 retrieval over the node catalog, for picking the few dozen nodes that are
+relevant to a natural-language request (e.g. the nodes to describe in an LLM
+prompt) without looping over every node in Python.
+
+Each node is a document made of its displayName (counted NAME_WEIGHT times),
+category, description, Phase 2 detailedDescription and input/output parameter
+names, split into words the way node_search.py splits names (so
+"GetActorLocation" and "get actor location" share terms).
+
+At build time every (node, term) BM25 weight
+
+    idf(term) * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / average length))
+
+is precomputed into a sparse term x node matrix (CSR), saved with the term list
+and the canSpawn flags in ue_blueprint_nodes_bm25.npz. A query then sums the
+matrix rows of its terms and takes the top k with argpartition.
+
+    python bm25_index.py                                     # build the index
+    python bm25_index.py --query "rotate the actor to face the player" -k 20
+    python bm25_index.py --benchmark                         # ms per top-k query
+"""
+
+import argparse
+import json
+import logging
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, NamedTuple
+
+import numpy as np
+from scipy import sparse
+
+from node_search import split_words
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+# Okapi BM25 parameters
+K1 = 1.2
+B = 0.75
+
+# A term in the node name counts this many times
+NAME_WEIGHT = 3
+
+TEXT_FIELDS = ['category', 'description', 'detailedDescription']
+
+# Words too common in requests to say anything about a node
+STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'how', 'i', 'if', 'in', 'into',
+    'is', 'it', 'its', 'me', 'my', 'of', 'on', 'or', 'so', 'that', 'the', 'their', 'then', 'this',
+    'to', 'want', 'when', 'which', 'with',
+}
+
+
+class Hit(NamedTuple):
+    score: float
+    id: int
+
+
+def node_terms(node: Dict) -> Counter:
+    """Term frequencies of a node's document."""
+    terms = Counter()
+    for word in split_words(node.get('displayName')):
+        terms[word] += NAME_WEIGHT
+    for field in TEXT_FIELDS:
+        terms.update(split_words(node.get(field)))
+    for pin in (node.get('inputs') or []) + (node.get('outputs') or []):
+        terms.update(split_words(pin.get('name')))
+    for word in STOP_WORDS.intersection(terms):
+        del terms[word]
+    return terms
+
+
+def query_terms(text: str) -> List[str]:
+    return [word for word in split_words(text) if word not in STOP_WORDS]
+
+
+def apply_details(nodes: List[Dict], details_file: Path) -> int:
+    """Copy Phase 2 details (detailedDescription, inputs, outputs) onto nodes by URL."""
+    with open(details_file, 'r', encoding='utf-8') as f:
+        detailed = {node['url']: node for node in json.load(f).get('nodes', []) if node.get('hasDetailedInfo')}
+
+    applied = 0
+    for node in nodes:
+        extra = detailed.get(node.get('url'))
+        if not extra:
+            continue
+        for field in ('detailedDescription', 'inputs', 'outputs'):
+            if extra.get(field) and not node.get(field):
+                node[field] = extra[field]
+        applied += 1
+    return applied
+
+
+class BM25Index:
+    """Precomputed BM25 weights (terms x nodes) with vectorised top-k queries."""
+
+    def __init__(self, weights: sparse.csr_matrix, terms: List[str], spawnable: np.ndarray):
+        self.weights = weights
+        self.terms = terms
+        self.term_ids = {term: i for i, term in enumerate(terms)}
+        self.spawnable = spawnable
+
+    @classmethod
+    def build(cls, nodes: List[Dict], k1: float = K1, b: float = B) -> 'BM25Index':
+        documents = [node_terms(node) for node in nodes]
+        term_ids = {}
+        rows, cols, counts = [], [], []
+        for node_id, terms in enumerate(documents):
+            for term, count in terms.items():
+                rows.append(term_ids.setdefault(term, len(term_ids)))
+                cols.append(node_id)
+                counts.append(count)
+
+        rows = np.array(rows, dtype=np.int32)
+        cols = np.array(cols, dtype=np.int32)
+        tf = np.array(counts, dtype=np.float32)
+
+        lengths = np.array([sum(terms.values()) for terms in documents], dtype=np.float32)
+        average = lengths.mean() if len(lengths) else 1.0
+        node_count = len(nodes)
+        document_frequency = np.bincount(rows, minlength=len(term_ids)).astype(np.float32)
+        idf = np.log1p((node_count - document_frequency + 0.5) / (document_frequency + 0.5))
+
+        norm = k1 * (1 - b + b * lengths[cols] / max(average, 1e-9))
+        data = idf[rows] * tf * (k1 + 1) / (tf + norm)
+        weights = sparse.csr_matrix((data.astype(np.float32), (rows, cols)),
+                                    shape=(len(term_ids), node_count))
+
+        terms = sorted(term_ids, key=term_ids.get)
+        spawnable = np.array([bool(node.get('canSpawn')) for node in nodes], dtype=bool)
+        return cls(weights, terms, spawnable)
+
+    def save(self, path):
+        np.savez_compressed(
+            path,
+            version=np.array(INDEX_VERSION),
+            data=self.weights.data,
+            indices=self.weights.indices,
+            indptr=self.weights.indptr,
+            shape=np.array(self.weights.shape),
+            terms=np.array(self.terms, dtype=str),
+            spawnable=self.spawnable,
+        )
+
+    @classmethod
+    def load(cls, path='ue_blueprint_nodes_bm25.npz') -> 'BM25Index':
+        with np.load(path, allow_pickle=False) as archive:
+            if int(archive['version']) != INDEX_VERSION:
+                raise ValueError(f"unsupported BM25 index version {int(archive['version'])}")
+            weights = sparse.csr_matrix((archive['data'], archive['indices'], archive['indptr']),
+                                        shape=tuple(archive['shape']))
+            return cls(weights, archive['terms'].tolist(), archive['spawnable'])
+
+    @property
+    def node_count(self) -> int:
+        return self.weights.shape[1]
+
+    def scores(self, text: str) -> np.ndarray:
+        """BM25 score of every node for a request (repeated query words count repeatedly)."""
+        counts = Counter(self.term_ids[w] for w in query_terms(text) if w in self.term_ids)
+        if not counts:
+            return np.zeros(self.node_count, dtype=np.float32)
+        rows = np.fromiter(counts, dtype=np.int32)
+        factors = np.fromiter(counts.values(), dtype=np.float32)
+        return self.weights[rows].T @ factors
+
+    def top_k(self, text: str, k: int = 30, spawnable_only: bool = False) -> List[Hit]:
+        """The k best-scoring nodes for a request, best first (nodes scoring 0 are left out)."""
+        scores = self.scores(text)
+        if spawnable_only:
+            scores = np.where(self.spawnable, scores, 0)
+        candidates = np.flatnonzero(scores)
+        if len(candidates) > k:
+            candidates = candidates[np.argpartition(-scores[candidates], k - 1)[:k]]
+        # Ties broken by node id, so results are stable across runs
+        best = candidates[np.lexsort((candidates, -scores[candidates]))]
+        return [Hit(round(float(scores[i]), 4), int(i)) for i in best]
+
+
+def benchmark(index: BM25Index, nodes: List[Dict], count: int = 300, k: int = 30, seed: int = 0):
+    """Time top-k retrieval for request-like queries built from node descriptions."""
+    rng = np.random.default_rng(seed)
+    described = [node for node in nodes if node.get('description')]
+    queries = [described[i]['description'] for i in rng.integers(0, len(described), count)]
+
+    index.top_k(queries[0], k)
+    start = time.perf_counter()
+    for q in queries:
+        index.top_k(q, k)
+    elapsed = time.perf_counter() - start
+    logger.info(f"⏱️  {count} queries over {index.node_count} nodes: "
+                f"{elapsed * 1000 / count:.3f} ms/query (top {k})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='BM25 retrieval index over the node catalog')
+    parser.add_argument('--input', default='ue_blueprint_nodes_merged.json', help='Merged node database')
+    parser.add_argument('--details', default='ue_blueprint_nodes_phase2.json',
+                        help='Phase 2 results to take detailedDescription and parameters from (if present)')
+    parser.add_argument('--output', default='ue_blueprint_nodes_bm25.npz', help='Index file to write')
+    parser.add_argument('--query', help='Show the top matches for a request (loads an existing index)')
+    parser.add_argument('-k', type=int, default=20, help='Number of results')
+    parser.add_argument('--spawnable', action='store_true', help='Only spawnable nodes')
+    parser.add_argument('--benchmark', action='store_true', help='Time top-k queries')
+
+    args = parser.parse_args()
+
+    input_file = Path(args.input)
+    if not input_file.exists():
+        logger.error(f"❌ {input_file} not found! Run merge_all_nodes.py first.")
+        return
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        nodes = json.load(f)['nodes']
+
+    output_file = Path(args.output)
+    if args.query and output_file.exists():
+        index = BM25Index.load(output_file)
+        if index.node_count != len(nodes):
+            logger.error(f"❌ {output_file} is out of date ({index.node_count} nodes); rebuild it first.")
+            return
+    else:
+        details_file = Path(args.details)
+        if details_file.exists():
+            logger.info(f"📖 Phase 2 details for {apply_details(nodes, details_file)} nodes from {details_file}")
+
+        start = time.perf_counter()
+        index = BM25Index.build(nodes)
+        elapsed = time.perf_counter() - start
+        index.save(output_file)
+        logger.info(f"📐 Indexed {index.node_count} nodes ({len(index.terms)} terms, "
+                    f"{index.weights.nnz} postings) in {elapsed * 1000:.0f} ms")
+        logger.info(f"💾 Saved {output_file} ({output_file.stat().st_size / 1024:.0f} KB)")
+
+    if args.benchmark:
+        benchmark(index, nodes)
+
+    if args.query:
+        start = time.perf_counter()
+        hits = index.top_k(args.query, args.k, args.spawnable)
+        elapsed = time.perf_counter() - start
+        logger.info(f"\n🔎 '{args.query}' ({elapsed * 1000:.2f} ms)")
+        for hit in hits:
+            node = nodes[hit.id]
+            spawn = '' if node.get('canSpawn') else ' (search only)'
+            logger.info(f"   {hit.score:7.3f}  {node.get('displayName')} [{node.get('category')}]{spawn}")
+
+
+if __name__ == '__main__':
+    main()
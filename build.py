@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Incremental build of the node databases from the page cache.
+
+The rebuild scripts are modelled as stages with declared inputs and outputs.
+Each stage's inputs (data files, cache pages and the script's own source and
+local modules) are fingerprinted by content; a stage whose fingerprints match
+those recorded after its last successful run, and whose outputs exist, is
+skipped. Stages whose dependencies are done run in parallel.
+
+File hashes are cached in .build_state.json by (size, mtime), so a no-op
+rebuild only stats the inputs, and a changed file reruns only the stages
+downstream of it. A stage that rewrites its output with identical content
+stops the rebuild there.
+
+    python build.py                 # build everything that is out of date
+    python build.py merge_all_nodes # one stage (and what it depends on)
+    python build.py --dry-run       # show what would run
+    python build.py --force         # rerun every stage
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import Dict, List, Optional
+
+REPO_DIR = Path(__file__).resolve().parent
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+STATE_FILE = '.build_state.json'
+
+# Cached category pages: the packed store and any not-yet-migrated legacy files
+CACHE_PAGES = ['cache/store/index.jsonl', 'cache/store/seg-*.pack', 'cache/*.json']
+
+# Current rebuild order (merge_databases.py is the legacy Phase 1 merge and
+# writes the same merged file, so it is not part of the graph).
+# 'after' orders stages that share a file; a stage listing a file as both
+# input and output rewrites it in place.
+STAGES = [
+    {
+        'name': 'extract_categories',
+        'script': 'extract_categories.py',
+        'modules': ['html_extract.py', 'page_store.py', 'parsed_cache.py', 'quick_extract_from_cache.py',
+                    'phase1_5_extract_functions.py'],
+        'inputs': CACHE_PAGES,
+        'outputs': ['ue_blueprint_nodes_phase1.json', 'ue_blueprint_functions_phase1_5.json'],
+        'after': [],
+    },
+    {
+        'name': 'add_transformation_functions',
+        'script': 'add_transformation_functions.py',
+        'inputs': ['ue_blueprint_functions_phase1_5.json'],
+        'outputs': ['ue_blueprint_functions_phase1_5.json'],
+        'after': ['extract_categories'],
+    },
+    {
+        'name': 'merge_all_nodes',
+        'script': 'merge_all_nodes.py',
+        'modules': ['merge_engine.py', 'node_search.py', 'node_journal.py'],
+        'inputs': ['ue_blueprint_nodes.json', 'ue_blueprint_functions_phase1_5.json'],
+        'outputs': ['ue_blueprint_nodes_merged.json'],
+        'after': ['add_transformation_functions'],
+    },
+    {
+        'name': 'make_transformation_spawnable',
+        'script': 'make_transformation_spawnable.py',
+        'modules': ['pin_types.py'],
+        'inputs': ['ue_blueprint_nodes_merged.json'],
+        'outputs': ['ue_blueprint_nodes_merged.json'],
+        'after': ['merge_all_nodes'],
+    },
+    {
+        'name': 'search_index',
+        'script': 'search_index.py',
+        'inputs': ['ue_blueprint_nodes_merged.json'],
+        'outputs': ['ue_blueprint_nodes_search.json'],
+        'after': ['make_transformation_spawnable'],
+    },
+    {
+        'name': 'shard_database',
+        'script': 'shard_database.py',
+        'inputs': ['ue_blueprint_nodes_merged.json'],
+        'outputs': ['ue_blueprint_nodes_shards/manifest.json'],
+        'after': ['make_transformation_spawnable'],
+    },
+    {
+        'name': 'columnar_nodes',
+        'script': 'columnar_nodes.py',
+        'inputs': ['ue_blueprint_nodes_merged.json'],
+        'outputs': ['ue_blueprint_nodes_columnar.json'],
+        'after': ['make_transformation_spawnable'],
+    },
+    {
+        'name': 'bm25_index',
+        'script': 'bm25_index.py',
+        'modules': ['node_search.py'],
+        'inputs': ['ue_blueprint_nodes_merged.json', 'ue_blueprint_nodes_phase2.json'],
+        'outputs': ['ue_blueprint_nodes_bm25.npz'],
+        'after': ['make_transformation_spawnable'],
+    },
+]
+
+
+class BuildState:
+    """Per-file hash cache and per-stage fingerprints from the last successful runs."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.lock = threading.Lock()
+        self.files = {}
+        self.stages = {}
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.files = data.get('files', {})
+                self.stages = data.get('stages', {})
+            except (OSError, json.JSONDecodeError):
+                logger.warning(f"⚠️  Ignoring unreadable {path.name}; every stage will run")
+
+    def file_hash(self, path: Path, key: str) -> str:
+        """Content hash of a file, reusing the cached hash while size and mtime are unchanged."""
+        stat = path.stat()
+        with self.lock:
+            cached = self.files.get(key)
+        if cached and cached[0] == stat.st_size and cached[1] == stat.st_mtime_ns:
+            return cached[2]
+
+        digest = hashlib.sha1()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        with self.lock:
+            self.files[key] = [stat.st_size, stat.st_mtime_ns, digest.hexdigest()]
+        return digest.hexdigest()
+
+    def record(self, name: str, inputs: Dict[str, str], seconds: float):
+        with self.lock:
+            self.stages[name] = {
+                'inputs': inputs,
+                'builtAt': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'seconds': round(seconds, 3),
+            }
+            self.save()
+
+    def save(self):
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'files': self.files, 'stages': self.stages}, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+
+class Builder:
+    def __init__(self, data_dir: Path, stages: List[Dict], jobs: int, force: bool = False):
+        self.data_dir = data_dir
+        self.stages = {stage['name']: stage for stage in stages}
+        self.jobs = jobs
+        self.force = force
+        self.state = BuildState(data_dir / STATE_FILE)
+
+    def select(self, targets: Optional[List[str]]) -> List[str]:
+        """Stage names needed for targets (all stages by default), in declaration order."""
+        if not targets:
+            return list(self.stages)
+        unknown = [t for t in targets if t not in self.stages]
+        if unknown:
+            raise SystemExit(f"Unknown stage(s): {', '.join(unknown)} (see --list)")
+
+        needed = set()
+        todo = list(targets)
+        while todo:
+            name = todo.pop()
+            if name not in needed:
+                needed.add(name)
+                todo.extend(self.stages[name]['after'])
+        return [name for name in self.stages if name in needed]
+
+    def fingerprint(self, stage: Dict) -> Optional[Dict[str, str]]:
+        """Hash of every input file and of the stage's code, or None if no input exists."""
+        hashes = {}
+        for pattern in stage['inputs']:
+            for path in sorted(self.data_dir.glob(pattern)):
+                key = path.relative_to(self.data_dir).as_posix()
+                hashes[key] = self.state.file_hash(path, key)
+        if not hashes:
+            return None
+
+        for name in [stage['script']] + stage.get('modules', []):
+            hashes[f"code:{name}"] = self.state.file_hash(REPO_DIR / name, f"code:{name}")
+        return hashes
+
+    def outputs_exist(self, stage: Dict) -> bool:
+        return all((self.data_dir / name).exists() for name in stage['outputs'])
+
+    def check(self, name: str) -> str:
+        """'run', 'fresh' or 'no-input' for a stage, given the files as they are now."""
+        stage = self.stages[name]
+        inputs = self.fingerprint(stage)
+        if inputs is None:
+            return 'no-input'
+        if self.force or not self.outputs_exist(stage):
+            return 'run'
+        recorded = self.state.stages.get(name, {}).get('inputs')
+        return 'fresh' if recorded == inputs else 'run'
+
+    def run_stage(self, name: str) -> str:
+        stage = self.stages[name]
+        status = self.check(name)
+        if status == 'fresh':
+            logger.info(f"   ✓ {name} (up to date)")
+            return status
+        if status == 'no-input':
+            logger.warning(f"   ⚠️  {name}: inputs missing, keeping existing outputs")
+            return status
+
+        logger.info(f"   ▶ {name} ({stage['script']})")
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, str(REPO_DIR / stage['script'])],
+                                cwd=self.data_dir, capture_output=True, text=True)
+        seconds = time.perf_counter() - start
+        if result.returncode != 0:
+            tail = (result.stderr or result.stdout).strip().splitlines()[-15:]
+            raise RuntimeError(f"{stage['script']} exited with status {result.returncode}\n      "
+                               + '\n      '.join(tail))
+
+        # Recorded after the run, so in-place rewrites count as the stage's own result
+        self.state.record(name, self.fingerprint(stage), seconds)
+        logger.info(f"   ✅ {name} ({seconds:.2f}s)")
+        return 'ran'
+
+    def build(self, names: List[str]) -> Dict[str, str]:
+        """Run the stages, each as soon as its dependencies are done. Returns name -> outcome."""
+        outcomes = {}
+        pending = list(names)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.jobs) as pool:
+            while pending or running:
+                for name in list(pending):
+                    after = [dep for dep in self.stages[name]['after'] if dep in names]
+                    if any(outcomes.get(dep) in ('failed', 'blocked') for dep in after):
+                        outcomes[name] = 'blocked'
+                        pending.remove(name)
+                    elif all(dep in outcomes for dep in after):
+                        running[pool.submit(self.run_stage, name)] = name
+                        pending.remove(name)
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        outcomes[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"   ❌ {name}: {e}")
+                        outcomes[name] = 'failed'
+        return outcomes
+
+    def plan(self, names: List[str]) -> Dict[str, str]:
+        """What build() would do, without running anything."""
+        plan = {}
+        for name in names:
+            upstream = [plan.get(dep) for dep in self.stages[name]['after']]
+            if 'run' in upstream:
+                plan[name] = 'run'              # its inputs are about to change
+            else:
+                plan[name] = self.check(name)
+        return plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Incrementally rebuild the blueprint node databases')
+    parser.add_argument('targets', nargs='*', help='Stages to build (default: all)')
+    parser.add_argument('--data-dir', default=str(REPO_DIR),
+                        help='Directory with cache/ and the ue_blueprint_*.json files')
+    parser.add_argument('-j', '--jobs', type=int, default=os.cpu_count() or 2,
+                        help='Stages to run in parallel')
+    parser.add_argument('--force', action='store_true', help='Rerun stages even if up to date')
+    parser.add_argument('--dry-run', action='store_true', help='Show what would run')
+    parser.add_argument('--list', action='store_true', help='List the stages and exit')
+
+    args = parser.parse_args()
+
+    if args.list:
+        for stage in STAGES:
+            after = f"  (after {', '.join(stage['after'])})" if stage['after'] else ''
+            logger.info(f"   {stage['name']:<30} {stage['script']}{after}")
+            logger.info(f"      {', '.join(stage['inputs'])} -> {', '.join(stage['outputs'])}")
+        return
+
+    builder = Builder(Path(args.data_dir).resolve(), STAGES, max(1, args.jobs), args.force)
+    names = builder.select(args.targets)
+
+    if args.dry_run:
+        for name, status in builder.plan(names).items():
+            logger.info(f"   {status:<9} {name}")
+        return
+
+    logger.info(f"🔨 Building {len(names)} stage(s) in {builder.data_dir}")
+    start = time.perf_counter()
+    outcomes = builder.build(names)
+    elapsed = time.perf_counter() - start
+
+    ran = [n for n, o in outcomes.items() if o == 'ran']
+    failed = [n for n, o in outcomes.items() if o in ('failed', 'blocked')]
+    logger.info(f"\n📊 {len(ran)} ran, {sum(o == 'fresh' for o in outcomes.values())} up to date, "
+                f"{len(failed)} failed or blocked ({elapsed:.2f}s)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
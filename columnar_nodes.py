@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Compact columnar encoding of the merged node database.
+
+The merged database repeats the documentation URL prefix, the category and
+type strings and a set of booleans on every record. The columnar form stores
+each field as one column instead:
+
+- displayName, description: string columns; a description equal to the
+  node's displayName is stored as null
+- url:                      slugs relative to a shared base URL
+- category, type:           indexes into per-column string tables
+- hasDetailedInfo, canSpawn,
+  isPure:                   bitsets (base64, one bit per node)
+- shapes:                   each node's key order, as an index into a table
+                            of distinct key lists
+- extras:                   any other field (spawn data, inputs, outputs,
+                            Phase 2 details), or a value that does not fit
+                            its column, per node
+
+Decoding reproduces the original records exactly, key order included.
+ColumnarNodes reads single columns or rows without materialising every node.
+
+    python columnar_nodes.py                 # encode ue_blueprint_nodes_merged.json
+    python columnar_nodes.py --verify        # + check the round trip
+    python columnar_nodes.py --benchmark     # size and decode time vs the JSON
+"""
+
+import argparse
+import base64
+import gzip
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+FORMAT = 'blueprint-nodes-columnar'
+FORMAT_VERSION = 1
+
+URL_BASE = 'https://dev.epicgames.com/documentation/en-us/unreal-engine/BlueprintAPI/'
+
+STRING_COLUMNS = ['displayName', 'description', 'url']
+TABLE_COLUMNS = ['category', 'type']
+FLAG_COLUMNS = ['hasDetailedInfo', 'canSpawn', 'isPure']
+
+
+def pack_bits(bits: List[bool]) -> str:
+    packed = bytearray((len(bits) + 7) // 8)
+    for i, bit in enumerate(bits):
+        if bit:
+            packed[i >> 3] |= 1 << (i & 7)
+    return base64.b64encode(bytes(packed)).decode('ascii')
+
+
+def unpack_bits(text: str, count: int) -> List[bool]:
+    packed = base64.b64decode(text)
+    return [bool(packed[i >> 3] >> (i & 7) & 1) for i in range(count)]
+
+
+def _columnar(field: str, value) -> bool:
+    """Whether a node's value for field can be stored in the field's column."""
+    if field in FLAG_COLUMNS:
+        return isinstance(value, bool)
+    if field == 'url':
+        return isinstance(value, str) and value.startswith(URL_BASE)
+    return isinstance(value, str) and (field in STRING_COLUMNS or field in TABLE_COLUMNS)
+
+
+def encode(data: Dict) -> Dict:
+    """Columnar form of a merged database document."""
+    nodes = data['nodes']
+    count = len(nodes)
+
+    shapes = []
+    shape_ids = {}
+    shape_column = []
+    strings = {field: [None] * count for field in STRING_COLUMNS}
+    tables = {field: [] for field in TABLE_COLUMNS}
+    table_ids = {field: {} for field in TABLE_COLUMNS}
+    table_columns = {field: [0] * count for field in TABLE_COLUMNS}
+    flags = {field: [False] * count for field in FLAG_COLUMNS}
+    extras = {}
+
+    for row, node in enumerate(nodes):
+        shape = tuple(node)
+        if shape not in shape_ids:
+            shape_ids[shape] = len(shapes)
+            shapes.append(list(shape))
+        shape_column.append(shape_ids[shape])
+
+        for field, value in node.items():
+            if not _columnar(field, value):
+                extras.setdefault(str(row), {})[field] = value
+            elif field in FLAG_COLUMNS:
+                flags[field][row] = value
+            elif field in TABLE_COLUMNS:
+                ids = table_ids[field]
+                if value not in ids:
+                    ids[value] = len(tables[field])
+                    tables[field].append(value)
+                table_columns[field][row] = ids[value]
+            elif field == 'url':
+                strings['url'][row] = value[len(URL_BASE):]
+            elif field == 'description' and value == node.get('displayName'):
+                strings['description'][row] = None
+            else:
+                strings[field][row] = value
+
+    return {
+        'format': FORMAT,
+        'formatVersion': FORMAT_VERSION,
+        'header': {key: value for key, value in data.items() if key != 'nodes'},
+        'headerOrder': list(data),
+        'count': count,
+        'urlBase': URL_BASE,
+        'shapes': shapes,
+        'strings': tables,
+        'columns': {
+            'shape': shape_column,
+            **strings,
+            **table_columns,
+            **{field: pack_bits(bits) for field, bits in flags.items()},
+        },
+        'extras': extras,
+    }
+
+
+class ColumnarNodes:
+    """Reader for the columnar form: single columns, single rows, or the full document."""
+
+    def __init__(self, document: Dict):
+        if document.get('format') != FORMAT:
+            raise ValueError('not a columnar node database')
+        if document.get('formatVersion') != FORMAT_VERSION:
+            raise ValueError(f"unsupported columnar format version {document.get('formatVersion')}")
+        self.document = document
+        self.count = document['count']
+        self.columns = document['columns']
+        self.shapes = [tuple(shape) for shape in document['shapes']]
+        self.extras = document['extras']
+        self._flags = {}
+
+    @classmethod
+    def load(cls, path) -> 'ColumnarNodes':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls(json.load(f))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def flags(self, field: str) -> List[bool]:
+        if field not in self._flags:
+            self._flags[field] = unpack_bits(self.columns[field], self.count)
+        return self._flags[field]
+
+    def value(self, row: int, field: str):
+        """One field of one node (raises KeyError if the node has no such field)."""
+        extra = self.extras.get(str(row))
+        if extra and field in extra:
+            return extra[field]
+        if field not in self.shapes[self.columns['shape'][row]]:
+            raise KeyError(field)
+        if field in FLAG_COLUMNS:
+            return self.flags(field)[row]
+        if field in TABLE_COLUMNS:
+            return self.document['strings'][field][self.columns[field][row]]
+        if field == 'url':
+            return self.document['urlBase'] + self.columns['url'][row]
+        if field == 'description':
+            text = self.columns['description'][row]
+            return self.value(row, 'displayName') if text is None else text
+        return self.columns[field][row]
+
+    def column(self, field: str) -> List:
+        """A field for every node (None where a node lacks it)."""
+        values = []
+        for row in range(self.count):
+            try:
+                values.append(self.value(row, field))
+            except KeyError:
+                values.append(None)
+        return values
+
+    def __getitem__(self, row: int) -> Dict:
+        if not 0 <= row < self.count:
+            raise IndexError(row)
+        return {field: self.value(row, field) for field in self.shapes[self.columns['shape'][row]]}
+
+    def __iter__(self) -> Iterator[Dict]:
+        """All nodes, decoded a column at a time (much faster than row by row)."""
+        names = self.columns['displayName']
+        base = self.document['urlBase']
+        columns = {
+            'displayName': names,
+            'url': [base + slug if slug is not None else None for slug in self.columns['url']],
+            'description': [name if text is None else text
+                            for text, name in zip(self.columns['description'], names)],
+        }
+        for field in TABLE_COLUMNS:
+            table = self.document['strings'][field]
+            columns[field] = [table[i] for i in self.columns[field]]
+        for field in FLAG_COLUMNS:
+            columns[field] = self.flags(field)
+
+        # Per shape, the column each field comes from (None: only ever in extras)
+        sources = [[columns.get(field) for field in shape] for shape in self.shapes]
+        for row, shape_id in enumerate(self.columns['shape']):
+            shape = self.shapes[shape_id]
+            extra = self.extras.get(str(row))
+            if extra:
+                yield {field: extra[field] if field in extra else column[row]
+                       for field, column in zip(shape, sources[shape_id])}
+            else:
+                yield dict(zip(shape, [column[row] for column in sources[shape_id]]))
+
+    def to_document(self) -> Dict:
+        """The original database document."""
+        header = self.document['header']
+        return {key: (list(self) if key == 'nodes' else header[key]) for key in self.document['headerOrder']}
+
+
+def decode(document: Dict) -> Dict:
+    return ColumnarNodes(document).to_document()
+
+
+def file_sizes(path: Path) -> Dict[str, int]:
+    raw = path.read_bytes()
+    return {'bytes': len(raw), 'gzip': len(gzip.compress(raw, 6))}
+
+
+def best_time(run, repeat: int) -> float:
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark(input_file: Path, output_file: Path, repeat: int = 5):
+    """Compare size and decode time of the pretty JSON, compact JSON and columnar files."""
+    with open(input_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    compact_file = output_file.with_name(output_file.stem + '.compact.json')
+    with open(compact_file, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+
+    def load(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    rows = [
+        ('merged JSON (indent=2)', input_file, lambda: load(input_file)),
+        ('merged JSON (compact)', compact_file, lambda: load(compact_file)),
+        ('columnar (all nodes)', output_file, lambda: decode(load(output_file))),
+        ('columnar (names only)', output_file, lambda: ColumnarNodes.load(output_file).column('displayName')),
+    ]
+
+    logger.info(f"\n{'format':<26} {'size KB':>8} {'gzip KB':>8} {'decode ms':>10}")
+    for name, path, run in rows:
+        sizes = file_sizes(path)
+        seconds = best_time(run, repeat)
+        logger.info(f"{name:<26} {sizes['bytes'] / 1024:>8.1f} {sizes['gzip'] / 1024:>8.1f} {seconds * 1000:>10.2f}")
+    compact_file.unlink()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Columnar encoding of the merged node database')
+    parser.add_argument('--input', default='ue_blueprint_nodes_merged.json', help='Merged node database')
+    parser.add_argument('--output', default='ue_blueprint_nodes_columnar.json', help='Columnar file to write')
+    parser.add_argument('--verify', action='store_true', help='Check that decoding restores the input exactly')
+    parser.add_argument('--benchmark', action='store_true', help='Report size and decode time vs the JSON')
+
+    args = parser.parse_args()
+
+    input_file = Path(args.input)
+    if not input_file.exists():
+        logger.error(f"❌ {input_file} not found! Run merge_all_nodes.py first.")
+        return
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    document = encode(data)
+    output_file = Path(args.output)
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(document, f, ensure_ascii=False, separators=(',', ':'))
+
+    logger.info(f"🗜️  Encoded {document['count']} nodes: {input_file.stat().st_size / 1024:.0f} KB -> "
+                f"{output_file.stat().st_size / 1024:.0f} KB ({len(document['shapes'])} shapes, "
+                f"{len(document['extras'])} nodes with extra fields)")
+    logger.info(f"💾 Saved to {output_file}")
+
+    if args.verify:
+        restored = ColumnarNodes.load(output_file).to_document()
+        if json.dumps(restored, ensure_ascii=False) == json.dumps(data, ensure_ascii=False):
+            logger.info("✅ Round trip restores the input exactly")
+        else:
+            logger.error("❌ Round trip differs from the input")
+            raise SystemExit(1)
+
+    if args.benchmark:
+        benchmark(input_file, output_file)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Persistent, deduplicated priority frontier for recursive documentation crawls.
+Pages to visit live in SQLite rather than in Python recursion and in-memory
+sets, so memory stays flat however large the tree is and a crashed crawl
+resumes where it stopped.
+
+Pages are popped by (kind rank, depth, discovery order): pages hinted as
+index pages first, then shallower pages, so the tree's structure is
+discovered before its leaves are fetched. Pages within index_depth of the
+root (e.g. the BlueprintAPI category pages) start out hinted as index pages.
+A page's actual kind (index / leaf) is recorded once it has been parsed, and
+its queued siblings, which usually share it, are re-ranked: raised to index
+when it had children, lowered to leaf when it had none (a sibling already
+raised stays raised).
+
+Leaf pages whose node has been journaled are flagged, so a page parsed just
+before a crash is not journaled twice when the crawl resumes.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+QUEUED = 'queued'
+IN_FLIGHT = 'in_flight'
+DONE = 'done'
+FAILED = 'failed'
+
+KIND_RANK = {'index': 0, 'unknown': 1, 'leaf': 2}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS frontier (
+    seq           INTEGER PRIMARY KEY AUTOINCREMENT,
+    path          TEXT NOT NULL UNIQUE,
+    depth         INTEGER NOT NULL,
+    category_path TEXT NOT NULL DEFAULT '',
+    kind          TEXT NOT NULL DEFAULT 'unknown',
+    rank          INTEGER NOT NULL DEFAULT 1,
+    state         TEXT NOT NULL DEFAULT 'queued',
+    attempts      INTEGER NOT NULL DEFAULT 0,
+    updated_at    TEXT,
+    last_error    TEXT,
+    parent        TEXT NOT NULL DEFAULT '',
+    journaled     INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_frontier_queue ON frontier(state, rank, depth, seq);
+CREATE INDEX IF NOT EXISTS idx_frontier_parent ON frontier(parent, state);
+"""
+
+# Columns added since the first schema version
+ADDED_COLUMNS = {'parent': "TEXT NOT NULL DEFAULT ''", 'journaled': 'INTEGER NOT NULL DEFAULT 0'}
+
+
+class ListFrontier:
+    """In-memory frontier (depth-first, no dedup): the default for CrawlPipeline."""
+
+    def __init__(self):
+        self.items = []
+
+    def push(self, items: Iterable[Tuple]):
+        # Reverse so pop() keeps discovery order
+        self.items.extend(reversed(list(items)))
+
+    def pop(self) -> Optional[Tuple]:
+        return self.items.pop() if self.items else None
+
+    def complete(self, item: Tuple, children: Iterable[Tuple]):
+        self.push(children)
+
+    def fail(self, item: Tuple, error: str = ''):
+        pass
+
+
+class CrawlFrontier:
+    """SQLite-backed crawl frontier.
+
+    Items are (path, depth, category_path) tuples, as used by CrawlPipeline.
+    complete() records a page's children and marks it done in one
+    transaction, so a checkpoint never loses or duplicates discovered work.
+    """
+
+    def __init__(self, db_path, max_depth: Optional[int] = None, index_depth: int = 1,
+                 max_attempts: int = 3):
+        self.db_path = Path(db_path)
+        self.max_depth = max_depth
+        self.index_depth = index_depth
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            self._migrate()
+            self.conn.executescript(SCHEMA)
+
+    def _migrate(self):
+        """Add the columns of newer versions to a frontier created by an older one."""
+        columns = {row[1] for row in self.conn.execute('PRAGMA table_info(frontier)')}
+        if columns:
+            for column, definition in ADDED_COLUMNS.items():
+                if column not in columns:
+                    self.conn.execute(f'ALTER TABLE frontier ADD COLUMN {column} {definition}')
+
+    def close(self):
+        self.conn.close()
+
+    def reset(self):
+        """Forget all crawl state (start over)."""
+        with self.conn:
+            self.conn.execute('DELETE FROM frontier')
+
+    def resume(self) -> int:
+        """Requeue pages that were in flight when the last run stopped. Returns pages still to do."""
+        with self.conn:
+            self.conn.execute('UPDATE frontier SET state = ? WHERE state = ?', (QUEUED, IN_FLIGHT))
+        return self.counts()[QUEUED]
+
+    def kind_hint(self, depth: int) -> str:
+        return 'index' if depth <= self.index_depth else 'unknown'
+
+    def _insert(self, items: Iterable[Tuple], parent: str = ''):
+        stamp = time.strftime('%Y-%m-%d %H:%M:%S')
+        rows = [(path, depth, category_path, self.kind_hint(depth), KIND_RANK[self.kind_hint(depth)], stamp, parent)
+                for path, depth, category_path in items
+                if self.max_depth is None or depth <= self.max_depth]
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO frontier (path, depth, category_path, kind, rank, updated_at, parent) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)', rows)
+
+    def push(self, items: Iterable[Tuple]):
+        """Queue pages not seen before (already known paths are ignored)."""
+        with self.conn:
+            self._insert(items)
+
+    def pop(self) -> Optional[Tuple]:
+        """Take the highest-priority queued page, marking it in flight."""
+        with self.conn:
+            row = self.conn.execute(
+                'SELECT seq, path, depth, category_path FROM frontier WHERE state = ? '
+                'ORDER BY rank, depth, seq LIMIT 1', (QUEUED,)).fetchone()
+            if row is None:
+                return None
+            self.conn.execute('UPDATE frontier SET state = ?, attempts = attempts + 1 WHERE seq = ?',
+                              (IN_FLIGHT, row[0]))
+        return row[1], row[2], row[3]
+
+    def complete(self, item: Tuple, children: Iterable[Tuple]):
+        """Mark a page done, queue its children and re-rank its queued siblings, atomically."""
+        children = list(children)
+        kind = 'index' if children else 'leaf'
+        with self.conn:
+            self._insert(children, parent=item[0])
+            self.conn.execute(
+                'UPDATE frontier SET state = ?, kind = ?, updated_at = ? WHERE path = ?',
+                (DONE, kind, time.strftime('%Y-%m-%d %H:%M:%S'), item[0]))
+            # An index page raises every queued sibling; a leaf only lowers those still unranked
+            self.conn.execute(
+                f"UPDATE frontier SET rank = ? WHERE state = ? AND rank {'>' if children else '='} ? "
+                "AND parent != '' AND parent = (SELECT parent FROM frontier WHERE path = ?)",
+                (KIND_RANK[kind], QUEUED, KIND_RANK['index' if children else 'unknown'], item[0]))
+
+    def mark_journaled(self, path: str):
+        """Record that a leaf page's node has been written to the journal."""
+        with self.conn:
+            self.conn.execute('UPDATE frontier SET journaled = 1 WHERE path = ?', (path,))
+
+    def is_journaled(self, path: str) -> bool:
+        row = self.conn.execute('SELECT journaled FROM frontier WHERE path = ?', (path,)).fetchone()
+        return bool(row and row[0])
+
+    def fail(self, item: Tuple, error: str = ''):
+        """Requeue a page for another attempt, or give up after max_attempts."""
+        with self.conn:
+            self.conn.execute(
+                'UPDATE frontier SET state = CASE WHEN attempts >= ? THEN ? ELSE ? END, '
+                'updated_at = ?, last_error = ? WHERE path = ?',
+                (self.max_attempts, FAILED, QUEUED, time.strftime('%Y-%m-%d %H:%M:%S'), error, item[0]))
+
+    def counts(self) -> Dict[str, int]:
+        counts = {QUEUED: 0, IN_FLIGHT: 0, DONE: 0, FAILED: 0}
+        for state, count in self.conn.execute('SELECT state, COUNT(*) FROM frontier GROUP BY state'):
+            counts[state] = count
+        return counts
+
+    def kinds(self) -> Dict[str, int]:
+        return dict(self.conn.execute(
+            'SELECT kind, COUNT(*) FROM frontier WHERE state = ? GROUP BY kind', (DONE,)).fetchall())
+
+    def failed_paths(self) -> List[str]:
+        return [row[0] for row in self.conn.execute('SELECT path FROM frontier WHERE state = ?', (FAILED,))]
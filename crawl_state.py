@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+SQLite-backed crawl state for the Phase 2 scraper.
+One row per node URL with its status, attempt count, timestamps and last
+error. Each update is its own small transaction, so a crash never loses
+more than the node in flight and never leaves a half-written progress file.
+
+Run directly for a quick progress report:
+
+    python crawl_state.py              # counts by status
+    python crawl_state.py --failed     # failed URLs with their last error
+"""
+
+import argparse
+import json
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+DEFAULT_DB = 'phase2_state.db'
+
+PENDING = 'pending'
+COMPLETED = 'completed'
+FAILED = 'failed'
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS urls (
+    url          TEXT PRIMARY KEY,
+    status       TEXT NOT NULL DEFAULT 'pending',
+    attempts     INTEGER NOT NULL DEFAULT 0,
+    first_seen   TEXT,
+    last_attempt TEXT,
+    completed_at TEXT,
+    last_error   TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_urls_status ON urls(status);
+"""
+
+
+def now() -> str:
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+
+class CrawlState:
+    """Per-URL crawl status stored in an embedded SQLite database."""
+
+    def __init__(self, db_path=DEFAULT_DB):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path))
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def is_empty(self) -> bool:
+        return self.conn.execute('SELECT 1 FROM urls LIMIT 1').fetchone() is None
+
+    def import_json_progress(self, progress_file: Path) -> int:
+        """Import a legacy phase2_progress.json (completed/failed URL lists)."""
+        with open(progress_file, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        stamp = data.get('lastUpdate') or now()
+        rows = [(url, COMPLETED, stamp, stamp, stamp) for url in data.get('completed', [])]
+        rows += [(url, FAILED, stamp, stamp, None) for url in data.get('failed', [])]
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR REPLACE INTO urls (url, status, attempts, first_seen, last_attempt, completed_at) '
+                'VALUES (?, ?, 1, ?, ?, ?)', rows)
+        return len(rows)
+
+    def add_pending(self, urls: Iterable[str]):
+        """Register URLs we know about; existing rows are left untouched."""
+        stamp = now()
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO urls (url, first_seen) VALUES (?, ?)',
+                ((url, stamp) for url in urls))
+
+    def mark_completed(self, url: str):
+        stamp = now()
+        with self.conn:
+            self.conn.execute(
+                'INSERT INTO urls (url, status, attempts, first_seen, last_attempt, completed_at) '
+                'VALUES (?, ?, 1, ?, ?, ?) '
+                'ON CONFLICT(url) DO UPDATE SET status = excluded.status, attempts = attempts + 1, '
+                'last_attempt = excluded.last_attempt, completed_at = excluded.completed_at, last_error = NULL',
+                (url, COMPLETED, stamp, stamp, stamp))
+
+    def mark_failed(self, url: str, error: str = ''):
+        stamp = now()
+        with self.conn:
+            self.conn.execute(
+                'INSERT INTO urls (url, status, attempts, first_seen, last_attempt, last_error) '
+                'VALUES (?, ?, 1, ?, ?, ?) '
+                'ON CONFLICT(url) DO UPDATE SET status = excluded.status, attempts = attempts + 1, '
+                'last_attempt = excluded.last_attempt, last_error = excluded.last_error',
+                (url, FAILED, stamp, stamp, error))
+
+    def status(self, url: str) -> Optional[str]:
+        row = self.conn.execute('SELECT status FROM urls WHERE url = ?', (url,)).fetchone()
+        return row[0] if row else None
+
+    def urls_with_status(self, status: str) -> Set[str]:
+        return {row[0] for row in self.conn.execute('SELECT url FROM urls WHERE status = ?', (status,))}
+
+    def counts(self) -> Dict[str, int]:
+        counts = {PENDING: 0, COMPLETED: 0, FAILED: 0}
+        for status, count in self.conn.execute('SELECT status, COUNT(*) FROM urls GROUP BY status'):
+            counts[status] = count
+        return counts
+
+    def backlog(self, limit: int = 0) -> List[str]:
+        """URLs still to scrape (pending first, then failed), in registration order."""
+        query = ("SELECT url FROM urls WHERE status != 'completed' "
+                 "ORDER BY status = 'failed', rowid")
+        if limit:
+            query += f' LIMIT {int(limit)}'
+        return [row[0] for row in self.conn.execute(query)]
+
+    def failures(self, limit: int = 0) -> List[Tuple[str, int, str, str]]:
+        """(url, attempts, last_attempt, last_error) for failed URLs, most recent first."""
+        query = ("SELECT url, attempts, last_attempt, last_error FROM urls "
+                 "WHERE status = 'failed' ORDER BY last_attempt DESC")
+        if limit:
+            query += f' LIMIT {int(limit)}'
+        return self.conn.execute(query).fetchall()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show Phase 2 crawl progress')
+    parser.add_argument('--db', default=DEFAULT_DB, help='Crawl state database')
+    parser.add_argument('--failed', action='store_true', help='List failed URLs with their last error')
+    parser.add_argument('--limit', type=int, default=20, help='Max URLs to list (0 = all)')
+
+    args = parser.parse_args()
+
+    if not Path(args.db).exists():
+        print(f"No crawl state at {args.db} yet - run phase2_detailed_scraper.py first")
+        return
+
+    state = CrawlState(args.db)
+    try:
+        counts = state.counts()
+        total = sum(counts.values())
+        print(f"Completed: {counts[COMPLETED]}/{total}  "
+              f"Failed: {counts[FAILED]}  Pending: {counts[PENDING]}")
+
+        if args.failed:
+            for url, attempts, last_attempt, error in state.failures(args.limit):
+                print(f"  {last_attempt}  x{attempts}  {url}  {error or ''}")
+    finally:
+        state.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+"""
+Diff two node databases (e.g. two builds of ue_blueprint_nodes_merged.json).
+Nodes are matched by URL; nodes whose URL changed but whose class identity
+(className + functionName) did not are reported as changed, not as a
+remove/add pair. Both files are streamed and the diff is linear: only a
+fingerprint per node is held for the old file, and full records only for
+nodes that actually changed.
+
+The structured changelog lists added / removed / changed nodes (with
+per-field old and new values) and the affected categories, so downstream
+steps can rebuild only what changed.
+
+Usage:
+    python diff_nodes.py old.json new.json                  # summary
+    python diff_nodes.py old.json new.json -o changes.json  # + changelog
+    python diff_nodes.py --synthetic 100000                 # scale check
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from node_journal import iter_document_records, write_document
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def url_key(node: Dict) -> Optional[str]:
+    url = node.get('url')
+    return url.split('?', 1)[0].rstrip('/') if url else None
+
+
+def class_key(node: Dict) -> Optional[str]:
+    if node.get('className') and node.get('functionName'):
+        return f"{node['className']}::{node['functionName']}"
+    return None
+
+
+def node_key(node: Dict) -> str:
+    """Identity of a node: URL, else class identity, else name within its category."""
+    return url_key(node) or class_key(node) or f"{node.get('category', '')}/{node.get('displayName', '')}"
+
+
+def fingerprint(text: str) -> bytes:
+    """Digest of a node's source text. Builds come from the same writer, so equal nodes
+    have equal text; formatting-only differences are caught by the field comparison."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=16).digest()
+
+
+def keyed_nodes(path) -> Iterator[Tuple[str, str, Dict]]:
+    """Stream (key, source text, node); repeated keys get a '#n' suffix so every node stays addressable."""
+    seen = {}
+    for text, node in iter_document_records(path, with_text=True):
+        key = node_key(node)
+        count = seen.get(key, 0)
+        seen[key] = count + 1
+        yield (key if count == 0 else f"{key}#{count}"), text, node
+
+
+def field_changes(old: Dict, new: Dict) -> Dict[str, Dict]:
+    changes = {}
+    for field in list(old) + [f for f in new if f not in old]:
+        if old.get(field, ...) != new.get(field, ...):
+            change = {}
+            if field in old:
+                change['old'] = old[field]
+            if field in new:
+                change['new'] = new[field]
+            changes[field] = change
+    return changes
+
+
+def diff_databases(old_path, new_path) -> Dict:
+    """Return the changelog between two node database files."""
+    # Pass 1: fingerprint every old node (key -> (digest, class identity))
+    old_index = {key: (fingerprint(text), class_key(node))
+                 for key, text, node in keyed_nodes(old_path)}
+
+    # Pass 2: stream the new file against it
+    added = {}
+    changed_new = {}
+    unchanged = 0
+    seen = set()
+    for key, text, node in keyed_nodes(new_path):
+        entry = old_index.get(key)
+        if entry is None:
+            added[key] = node
+            continue
+        seen.add(key)
+        if entry[0] == fingerprint(text):
+            unchanged += 1
+        else:
+            changed_new[key] = node
+
+    removed_keys = [key for key in old_index if key not in seen]
+
+    # Re-pair URL moves: a removed and an added node with the same class identity
+    removed_by_class = {}
+    for key in removed_keys:
+        identity = old_index[key][1]
+        if identity:
+            removed_by_class.setdefault(identity, key)
+    moved = {}
+    for key, node in list(added.items()):
+        old_key = removed_by_class.pop(class_key(node) or '', None)
+        if old_key:
+            moved[old_key] = key
+            changed_new[old_key] = added.pop(key)
+    removed_keys = [key for key in removed_keys if key not in moved]
+
+    # Pass 3: fetch old records only for changed and removed nodes
+    wanted = set(changed_new) | set(removed_keys)
+    old_nodes = {key: node for key, _, node in keyed_nodes(old_path) if key in wanted} if wanted else {}
+
+    changed = []
+    categories = set()
+    for key, node in changed_new.items():
+        old = old_nodes[key]
+        fields = field_changes(old, node)
+        if not fields and key not in moved:
+            unchanged += 1          # same values, different formatting
+            continue
+        entry = {'key': moved.get(key, key), 'fields': fields}
+        if key in moved:
+            entry['previousKey'] = key
+        changed.append(entry)
+        categories.update(c for c in (old.get('category'), node.get('category')) if c)
+
+    removed = [old_nodes[key] for key in removed_keys]
+    categories.update(n.get('category') for n in added.values() if n.get('category'))
+    categories.update(n.get('category') for n in removed if n.get('category'))
+
+    return {
+        'old': str(old_path),
+        'new': str(new_path),
+        'summary': {
+            'added': len(added),
+            'removed': len(removed),
+            'changed': len(changed),
+            'unchanged': unchanged,
+        },
+        'affectedCategories': sorted(categories),
+        'added': list(added.values()),
+        'removed': removed,
+        'changed': changed,
+    }
+
+
+def log_changelog(changelog: Dict, limit: int = 10):
+    summary = changelog['summary']
+    logger.info(f"📊 {summary['added']} added, {summary['removed']} removed, "
+                f"{summary['changed']} changed, {summary['unchanged']} unchanged")
+    if changelog['affectedCategories']:
+        logger.info(f"   Affected categories: {len(changelog['affectedCategories'])}")
+
+    for node in changelog['added'][:limit]:
+        logger.info(f"   + {node.get('displayName')} ({node.get('category')})")
+    for node in changelog['removed'][:limit]:
+        logger.info(f"   - {node.get('displayName')} ({node.get('category')})")
+    for entry in changelog['changed'][:limit]:
+        logger.info(f"   ~ {entry['key']}: {', '.join(entry['fields'])}")
+
+
+def make_synthetic(count: int, directory: Path, seed: int = 0) -> Tuple[Path, Path]:
+    """Write an old/new pair of count-node databases with ~1% added, removed and changed."""
+    rng = random.Random(seed)
+
+    def node(i: int) -> Dict:
+        return {
+            'displayName': f"Synthetic Node {i}",
+            'category': f"Category {i % 97}",
+            'description': f"Does synthetic thing number {i}.",
+            'url': f"https://dev.epicgames.com/documentation/en-us/unreal-engine/BlueprintAPI/Synthetic/Node{i}",
+            'type': 'topic',
+            'hasDetailedInfo': False,
+            'canSpawn': i % 10 == 0,
+        }
+
+    def new_nodes():
+        for i in range(count):
+            roll = rng.random()
+            if roll < 0.01:
+                continue                                  # removed
+            n = node(i)
+            if roll < 0.02:
+                n['description'] += ' (edited)'           # changed
+            elif roll < 0.03:
+                n['canSpawn'] = not n['canSpawn']         # flipped
+            yield n
+        for i in range(count, count + count // 100):
+            yield node(i)                                 # added
+
+    old_path, new_path = directory / 'old.json', directory / 'new.json'
+    write_document(old_path, {'version': 'synthetic', 'nodes': (node(i) for i in range(count))})
+    write_document(new_path, {'version': 'synthetic', 'nodes': new_nodes()})
+    return old_path, new_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Diff two blueprint node databases')
+    parser.add_argument('old', nargs='?', help='Old database (e.g. a previous ue_blueprint_nodes_merged.json)')
+    parser.add_argument('new', nargs='?', default='ue_blueprint_nodes_merged.json', help='New database')
+    parser.add_argument('-o', '--output', help='Write the structured changelog (JSON) here')
+    parser.add_argument('--synthetic', type=int, metavar='N',
+                        help='Diff two generated N-node databases and report timing')
+
+    args = parser.parse_args()
+
+    if args.synthetic:
+        with tempfile.TemporaryDirectory() as tmp:
+            old_path, new_path = make_synthetic(args.synthetic, Path(tmp))
+            start = time.perf_counter()
+            changelog = diff_databases(old_path, new_path)
+            elapsed = time.perf_counter() - start
+        logger.info(f"⏱️  Diffed 2 x {args.synthetic} synthetic nodes in {elapsed * 1000:.0f} ms")
+        log_changelog(changelog, limit=0)
+        return
+
+    if not args.old:
+        parser.error('an old database is required (or --synthetic N)')
+
+    start = time.perf_counter()
+    changelog = diff_databases(args.old, args.new)
+    elapsed = time.perf_counter() - start
+
+    logger.info(f"🔍 {args.old} -> {args.new} ({elapsed * 1000:.1f} ms)")
+    log_changelog(changelog)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(changelog, f, indent=2, ensure_ascii=False)
+        logger.info(f"\n💾 Changelog saved to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
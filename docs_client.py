@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Shared HTTP client for the Unreal Engine documentation API.
+One pooled cloudscraper session per process (keep-alive, consistent headers and
+timeouts), adaptive pacing via rate_controller, and one document.json cache layout.
+
+Documents are cached in a packed page store (see page_store.py) under
+<cache_dir>/store/; legacy per-file JSON caches are still read as a fallback.
+That store holds the base engine version; pages of other versions are kept
+under <cache_dir>/store/v<version>/ as deltas against it. A client based on
+another version keeps its pages in separate directories (see store_dir()).
+Cache entries keep the response validators (ETag / Last-Modified), so refresh
+mode can revalidate with conditional requests and an unchanged page costs a
+304 instead of a download and re-parse.
+"""
+
+import cloudscraper
+import json
+import re
+import threading
+import time
+import logging
+from pathlib import Path
+from typing import Dict, NamedTuple, Optional
+from requests.adapters import HTTPAdapter
+
+from page_store import PageStore, VersionedPageStore
+from rate_controller import get_with_backoff
+
+logger = logging.getLogger(__name__)
+
+BASE_API_URL = 'https://dev.epicgames.com/community/api/documentation'
+DEFAULT_VERSION = '5.5'
+DEFAULT_TIMEOUT = 30
+POOL_SIZE = 16
+
+DEFAULT_HEADERS = {
+    'Referer': 'https://dev.epicgames.com/',
+    'Origin': 'https://dev.epicgames.com',
+    'DNT': '1',
+    'Sec-Ch-Ua': '"Google Chrome";v="120", "Chromium";v="120", "Not_A Brand";v="24"',
+    'Sec-Ch-Ua-Mobile': '?0',
+    'Sec-Ch-Ua-Platform': '"Windows"',
+}
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide pooled cloudscraper session, creating it once."""
+    global _session
+    with _session_lock:
+        if _session is None:
+            session = cloudscraper.create_scraper(
+                browser={'browser': 'chrome', 'platform': 'windows', 'desktop': True}
+            )
+            session.headers.update(DEFAULT_HEADERS)
+            adapter = HTTPAdapter(pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+            _session = session
+        return _session
+
+
+def extract_path_from_url(url: str) -> str:
+    """Extract the documentation path from a URL."""
+    match = re.search(r'/documentation/([\w-]+/[\w-]+/[\w-].*?)(?:\?|$)', url)
+    return match.group(1) if match else ''
+
+
+def get_cache_path(path: str, cache_dir: Path) -> Path:
+    """Get cache file path for a given documentation path."""
+    safe_name = path.replace('/', '_').replace('-', '_')
+    return cache_dir / f"{safe_name}.json"
+
+
+class FetchResult(NamedTuple):
+    """A fetched document plus where it came from.
+
+    status is one of 'cached', 'fetched', 'not_modified' (304 on refresh) or 'error'.
+    """
+    data: Dict
+    status: str
+
+
+def store_dir(cache_dir, version: str, base_version: str = DEFAULT_VERSION) -> Path:
+    """Page store directory of a version: full pages for the base version, else deltas.
+
+    With the default base these are <cache_dir>/store and <cache_dir>/store/v<version>.
+    Other bases get their own directories, so no store mixes full pages of two
+    versions or deltas against two bases.
+    """
+    root = Path(cache_dir) / 'store'
+    if base_version == DEFAULT_VERSION:
+        return root if version == base_version else root / f"v{version}"
+    if version == base_version:
+        return root / f"v{version}-base"
+    return root / f"v{version}-on-v{base_version}"
+
+
+class DocsClient:
+    """Fetches document.json pages through the shared session and cache.
+
+    With refresh=True, cached pages are revalidated with conditional requests
+    instead of being trusted forever. Clients for several versions in one run
+    should share base_store, so pages one client stores in the base version are
+    seen (as delta bases) by the others.
+    """
+
+    def __init__(self, version=DEFAULT_VERSION, cache_dir='cache', timeout=DEFAULT_TIMEOUT,
+                 refresh=False, base_version=DEFAULT_VERSION, base_store: Optional[PageStore] = None):
+        self.version = version
+        self.base_version = base_version
+        self.timeout = timeout
+        self.refresh = refresh
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(exist_ok=True)
+        self.store = base_store if base_store is not None else PageStore(store_dir(cache_dir, base_version, base_version))
+        if version != base_version:
+            self.store = VersionedPageStore(store_dir(cache_dir, version, base_version), base=self.store)
+        self.session = get_session()
+        # Counters are updated from the fetch threads of an AsyncFetchEngine
+        self._counter_lock = threading.Lock()
+        self.request_count = 0
+        self.not_modified_count = 0
+
+    def api_url(self, path: str) -> str:
+        """Build the document.json URL for a documentation path."""
+        return f"{BASE_API_URL}/document.json?path={path}&application_version={self.version}"
+
+    @property
+    def is_base_version(self) -> bool:
+        return self.version == self.base_version
+
+    def cache_path(self, path: str) -> Path:
+        """Legacy per-file cache location (read-only fallback for unmigrated caches)."""
+        return get_cache_path(path, self.cache_dir)
+
+    def has_legacy_file(self, path: str) -> bool:
+        # Legacy per-file caches were never versioned; treat them as the base version
+        return self.is_base_version and self.cache_path(path).exists()
+
+    def is_cached(self, path: str) -> bool:
+        return path in self.store or self.has_legacy_file(path)
+
+    def load_cached(self, path: str) -> Optional[Dict]:
+        """Return the cached document for a path, if present."""
+        data = self.store.get(path)
+        if data is not None:
+            return data
+
+        if self.has_legacy_file(path):
+            with open(self.cache_path(path), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return None
+
+    def load_validators(self, path: str) -> Dict:
+        """Return the stored ETag / Last-Modified for a cached path."""
+        if path in self.store:
+            return self.store.get_meta(path)
+
+        meta_path = self.cache_path(path).with_suffix('.meta')
+        if self.is_base_version and meta_path.exists():
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        return {}
+
+    def save_cached(self, path: str, data: Dict, response=None):
+        meta = self.validators_from(response) if response is not None else {}
+        self.store.put(path, data, meta=meta)
+
+    def validators_from(self, response, previous: Optional[Dict] = None) -> Dict:
+        previous = previous or {}
+        return {
+            'etag': response.headers.get('ETag') or previous.get('etag'),
+            'lastModified': response.headers.get('Last-Modified') or previous.get('lastModified'),
+            'validatedAt': time.strftime('%Y-%m-%d %H:%M:%S'),
+        }
+
+    def save_validators(self, path: str, response, previous: Optional[Dict] = None):
+        validators = self.validators_from(response, previous)
+        if path not in self.store:
+            # Legacy entry: move it into the store along with its validators
+            self.store.put(path, self.load_cached(path), meta=validators)
+        else:
+            self.store.update_meta(path, validators)
+
+    def conditional_headers(self, validators: Dict) -> Dict:
+        """Build If-None-Match / If-Modified-Since headers from stored validators."""
+        headers = {}
+        if validators.get('etag'):
+            headers['If-None-Match'] = validators['etag']
+        if validators.get('lastModified'):
+            headers['If-Modified-Since'] = validators['lastModified']
+        return headers
+
+    def fetch_document(self, path: str, use_cache=True, paced=False,
+                       refresh: Optional[bool] = None) -> FetchResult:
+        """Fetch a document from cache or the API.
+
+        Pass paced=True when the caller already waited on the host's rate
+        controller (e.g. inside AsyncFetchEngine). In refresh mode a cached
+        page is revalidated; a 304 returns the cached data with status
+        'not_modified' so callers can skip re-parsing it.
+        """
+        refresh = self.refresh if refresh is None else refresh
+        have_cached = use_cache and self.is_cached(path)
+
+        validators = {}
+        if have_cached:
+            if not refresh:
+                return FetchResult(self.load_cached(path), 'cached')
+            validators = self.load_validators(path)
+
+        url = self.api_url(path)
+        with self._counter_lock:
+            self.request_count += 1
+
+        try:
+            response = get_with_backoff(self.session, url, timeout=self.timeout, paced=paced,
+                                        headers=self.conditional_headers(validators))
+            if response.status_code == 304 and have_cached:
+                with self._counter_lock:
+                    self.not_modified_count += 1
+                self.save_validators(path, response, validators)
+                return FetchResult(self.load_cached(path), 'not_modified')
+
+            data = response.json()
+            self.save_cached(path, data, response)
+            return FetchResult(data, 'fetched')
+
+        except Exception as e:
+            logger.error(f"  ✗ Error fetching {path}: {e}")
+            return FetchResult({}, 'error')
+
+    def fetch_json(self, path: str, use_cache=True, paced=False) -> Dict:
+        """Fetch a document from cache or the API. Returns {} on failure."""
+        return self.fetch_document(path, use_cache=use_cache, paced=paced).data
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Phase 1 + Phase 1.5 in one pass: parse every cached category page once, across
+a process pool, and write both
+
+    ue_blueprint_nodes_phase1.json          (nodes and byCategory counts)
+    ue_blueprint_functions_phase1_5.json    (BlueprintAPI functions, unique by URL)
+
+quick_extract_from_cache.py and phase1_5_extract_functions.py each decoded and
+parsed the whole cache serially; they differ only in how a block-dir-item
+becomes an entry, so one parse of each page feeds both. Workers receive the
+raw (still compressed) payloads, so decoding happens in parallel too. The
+outputs match the two scripts run one after the other.
+
+Parsed pages are kept in the parsed-page cache (parsed_cache.py); pages already
+in it are sent to the workers without their payload and are not parsed again.
+
+    python extract_categories.py                # one worker per core
+    python extract_categories.py --workers 4
+"""
+
+import argparse
+import json
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from pathlib import Path
+from typing import List, NamedTuple, Optional
+
+from page_store import CachedPayload, iter_cached_payloads
+from parsed_cache import ParsedPageCache
+import phase1_5_extract_functions as phase15
+import quick_extract_from_cache as phase1
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PHASE1_FILE = 'ue_blueprint_nodes_phase1.json'
+PHASE15_FILE = 'ue_blueprint_functions_phase1_5.json'
+
+# Pages sent to a worker at a time
+CHUNK_SIZE = 16
+# Chunks submitted but not yet consumed, per worker (bounds the payloads held in memory)
+CHUNKS_PER_WORKER = 4
+
+
+class PageResult(NamedTuple):
+    name: str
+    nodes: List[dict]
+    functions: List[dict]
+    blueprint_api: bool
+    cached: bool = False
+    error: Optional[str] = None
+
+
+def extract_page(cache: ParsedPageCache, task: CachedPayload) -> PageResult:
+    """Phase 1 nodes and Phase 1.5 functions of one cached page (runs in a worker)."""
+    try:
+        hits = cache.hits
+        page = cache.get_payload(task)
+        title = page.get('title', 'Unknown')
+        blueprint_api = phase15.is_blueprint_category(page)
+        nodes, functions = [], []
+        for block in page['blocks']:
+            if block['type'] != 'markdown' or not block.get('size'):
+                continue
+            for item in block['items']:
+                node = phase1.node_from_item(item, title)
+                if node:
+                    nodes.append(node)
+                if blueprint_api:
+                    function_entry = phase15.function_from_item(item, title)
+                    if function_entry:
+                        functions.append(function_entry)
+        return PageResult(task.name, nodes, functions, blueprint_api, cache.hits > hits)
+    except Exception as e:
+        return PageResult(task.name, [], [], False, error=str(e))
+
+
+def extract_chunk(cache: ParsedPageCache, tasks: List[CachedPayload]) -> List[PageResult]:
+    return [extract_page(cache, task) for task in tasks]
+
+
+def extract_pages(cache_dir: Path, workers: int):
+    """Yield a PageResult per cached page, in cache order.
+
+    Chunks are submitted as results are consumed, never more than
+    CHUNKS_PER_WORKER per worker ahead, so payloads are read from the cache
+    only as fast as the workers get through them.
+    """
+    cache = ParsedPageCache(cache_dir / 'parsed')
+    tasks = iter_cached_payloads(cache_dir, skip=cache.__contains__)
+    if workers <= 1:
+        yield from map(partial(extract_page, cache), tasks)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        while True:
+            chunk = list(islice(tasks, CHUNK_SIZE))
+            if chunk:
+                pending.append(pool.submit(extract_chunk, cache, chunk))
+            if pending and (not chunk or len(pending) >= workers * CHUNKS_PER_WORKER):
+                yield from pending.popleft().result()
+            elif not chunk:
+                break
+
+
+def write_json(filename: str, output: dict):
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Extract Phase 1 nodes and Phase 1.5 functions in one pass')
+    parser.add_argument('--cache', default='cache', help='Category page cache directory')
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1, help='Parser processes')
+
+    args = parser.parse_args()
+
+    cache_dir = Path(args.cache)
+    if not cache_dir.exists():
+        logger.error("❌ Cache directory not found!")
+        return
+
+    logger.info("🚀 Extracting nodes and functions from cached category pages")
+    logger.info(f"   Cache directory: {cache_dir} ({args.workers} workers)\n")
+
+    all_nodes, all_functions = [], []
+    node_categories = function_categories = pages = cached = errors = 0
+    start = time.perf_counter()
+
+    for result in extract_pages(cache_dir, args.workers):
+        pages += 1
+        cached += result.cached
+        if result.error:
+            logger.error(f"  ✗ Error processing {result.name}: {result.error}")
+            errors += 1
+            continue
+        if result.nodes:
+            all_nodes.extend(result.nodes)
+            node_categories += 1
+            logger.info(f"  ✓ {result.name}: {len(result.nodes)} nodes")
+        if result.blueprint_api:
+            all_functions.extend(result.functions)
+            function_categories += 1
+
+    elapsed = time.perf_counter() - start
+    logger.info(f"\n📂 Parsed {pages} cached pages in {elapsed:.2f}s "
+                f"({pages / max(elapsed, 1e-9):.0f} pages/s, {cached} from the parsed-page cache)")
+
+    phase1_output = phase1.build_output(all_nodes, node_categories)
+    write_json(PHASE1_FILE, phase1_output)
+    phase1.log_summary(phase1_output, PHASE1_FILE)
+
+    phase15_output = phase15.build_output(all_functions, function_categories)
+    write_json(PHASE15_FILE, phase15_output)
+    logger.info(f"\n✅ Phase 1.5: {phase15_output['totalFunctions']} unique functions "
+                f"({len(all_functions)} found in {function_categories} categories)")
+    logger.info(f"   Saved to: {PHASE15_FILE}")
+
+    if errors:
+        logger.error(f"\n❌ {errors} page(s) failed and are missing from the outputs")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Pluggable HTML extraction backends for documentation content_html blocks.
+The scripts only need a few known shapes (block-dir-item attributes, <p> text,
+parameter tables, code blocks), so there is no need to build a full
+BeautifulSoup tree over every page:
+
+- lxml:     lxml's C parser, iterating only the tags we need (fastest)
+- strainer: BeautifulSoup with a SoupStrainer partial parse
+- soup:     full BeautifulSoup('html.parser') tree (original behaviour)
+
+The default is lxml when installed, falling back to soup. Override with the
+BLUEPRINT_HTML_BACKEND environment variable.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+BACKENDS = ('lxml', 'strainer', 'soup')
+CONTENT_TAGS = ['p', 'table', 'pre', 'code']
+SECTION_TAGS = ('h3', 'h4')
+COUNTED_TAGS = ('h1', 'h2', 'h3', 'h4', 'p', 'table', 'block-dir-item')
+
+
+def available_backends() -> List[str]:
+    return [b for b in BACKENDS if b != 'lxml' or etree is not None]
+
+
+def get_backend(name: Optional[str] = None) -> str:
+    """Resolve a backend name, honouring BLUEPRINT_HTML_BACKEND and lxml availability."""
+    name = name or os.environ.get('BLUEPRINT_HTML_BACKEND') or ('lxml' if etree is not None else 'soup')
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown HTML backend '{name}' (choose from {', '.join(BACKENDS)})")
+    if name == 'lxml' and etree is None:
+        return 'soup'
+    return name
+
+
+# --- lxml -------------------------------------------------------------------
+
+def _lxml_root(html: str):
+    parser = etree.HTMLParser(recover=True, remove_comments=True)
+    return etree.fromstring(f"<html><body>{html}</body></html>", parser)
+
+
+def _lxml_text(elem) -> str:
+    """Equivalent of BeautifulSoup's get_text(strip=True)."""
+    return ''.join(s.strip() for s in elem.itertext())
+
+
+def _lxml_dir_items(html: str) -> List[Dict]:
+    root = _lxml_root(html)
+    if root is None:
+        return []
+    return [dict(item.attrib) for item in root.iter('block-dir-item')]
+
+
+def _lxml_page_content(html: str) -> Dict:
+    root = _lxml_root(html)
+    content = {'paragraphs': [], 'tables': [], 'code': []}
+    if root is None:
+        return content
+
+    content['paragraphs'] = [_lxml_text(p) for p in root.iter('p')]
+    for table in root.iter('table'):
+        content['tables'].append([
+            ([_lxml_text(th) for th in row.iter('th')], [_lxml_text(td) for td in row.iter('td')])
+            for row in table.iter('tr')
+        ])
+    content['code'] = [_lxml_text(code) for code in root.iter('pre', 'code')]
+    return content
+
+
+def _lxml_sibling(elem) -> List:
+    if elem.tag == 'p':
+        return ['p', _lxml_text(elem)]
+    if elem.tag == 'table':
+        return ['table', [[_lxml_text(td) for td in row.iter('td')] for row in elem.iter('tr')]]
+    return [elem.tag, None]
+
+
+def _lxml_page_structure(html: str) -> Dict:
+    root = _lxml_root(html)
+    structure = {'items': [], 'sections': [], 'counts': dict.fromkeys(COUNTED_TAGS, 0)}
+    if root is None:
+        return structure
+
+    for elem in root.iter():
+        if elem.tag in structure['counts']:
+            structure['counts'][elem.tag] += 1
+        if elem.tag == 'block-dir-item':
+            structure['items'].append(dict(elem.attrib))
+        elif elem.tag in SECTION_TAGS:
+            siblings = []
+            for sibling in elem.itersiblings():
+                if not isinstance(sibling.tag, str):
+                    continue
+                if sibling.tag in SECTION_TAGS:
+                    break
+                siblings.append(_lxml_sibling(sibling))
+            structure['sections'].append({'tag': elem.tag, 'title': _lxml_text(elem), 'siblings': siblings})
+    return structure
+
+
+# --- BeautifulSoup (full tree or strained) ----------------------------------
+
+def _soup(html: str, only: Optional[List[str]] = None) -> BeautifulSoup:
+    if only is None:
+        return BeautifulSoup(html, 'html.parser')
+    return BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer(only))
+
+
+def _soup_dir_items(html: str, strained: bool) -> List[Dict]:
+    soup = _soup(html, ['block-dir-item'] if strained else None)
+    return [dict(item.attrs) for item in soup.find_all('block-dir-item')]
+
+
+def _soup_page_content(html: str, strained: bool) -> Dict:
+    soup = _soup(html, CONTENT_TAGS if strained else None)
+    content = {
+        'paragraphs': [p.get_text(strip=True) for p in soup.find_all('p')],
+        'tables': [],
+        'code': [code.get_text(strip=True) for code in soup.find_all(['pre', 'code'])],
+    }
+    for table in soup.find_all('table'):
+        content['tables'].append([
+            ([th.get_text(strip=True) for th in row.find_all('th')],
+             [td.get_text(strip=True) for td in row.find_all('td')])
+            for row in table.find_all('tr')
+        ])
+    return content
+
+
+def _soup_sibling(elem) -> List:
+    if elem.name == 'p':
+        return ['p', elem.get_text(strip=True)]
+    if elem.name == 'table':
+        return ['table', [[td.get_text(strip=True) for td in row.find_all('td')] for row in elem.find_all('tr')]]
+    return [elem.name, None]
+
+
+def _soup_page_structure(html: str) -> Dict:
+    soup = _soup(html)
+    structure = {
+        'items': [dict(item.attrs) for item in soup.find_all('block-dir-item')],
+        'sections': [],
+        'counts': {tag: len(soup.find_all(tag)) for tag in COUNTED_TAGS},
+    }
+    for header in soup.find_all(list(SECTION_TAGS)):
+        siblings = []
+        for sibling in header.find_next_siblings():
+            if sibling.name in SECTION_TAGS:
+                break
+            siblings.append(_soup_sibling(sibling))
+        structure['sections'].append({'tag': header.name, 'title': header.get_text(strip=True),
+                                      'siblings': siblings})
+    return structure
+
+
+# --- Public API -------------------------------------------------------------
+
+def extract_dir_items(html: str, backend: Optional[str] = None) -> List[Dict]:
+    """Return the attributes of every <block-dir-item> in document order."""
+    backend = get_backend(backend)
+    if backend == 'lxml':
+        return _lxml_dir_items(html)
+    return _soup_dir_items(html, strained=backend == 'strainer')
+
+
+def extract_page_content(html: str, backend: Optional[str] = None) -> Dict:
+    """Extract paragraph texts, tables and code blocks from a content_html block.
+
+    Returns {'paragraphs': [str], 'tables': [[(th_texts, td_texts), ...]], 'code': [str]}
+    where each table is its list of rows.
+    """
+    backend = get_backend(backend)
+    if backend == 'lxml':
+        return _lxml_page_content(html)
+    return _soup_page_content(html, strained=backend == 'strainer')
+
+
+def extract_page_structure(html: str, backend: Optional[str] = None) -> Dict:
+    """Everything the category-page scripts read from a content_html block, in one parse.
+
+    Returns {'items': [attrs], 'sections': [section], 'counts': {tag: n}} where
+    items are the block-dir-item attributes in document order, and each h3/h4
+    header is a section {'tag', 'title', 'siblings'}: the elements that follow
+    it up to the next h3/h4, as [tag, text] for <p>, [tag, rows of td texts]
+    for <table> and [tag, None] otherwise. The strainer backend parses the
+    full tree here, since sections need every sibling.
+    """
+    if get_backend(backend) == 'lxml':
+        return _lxml_page_structure(html)
+    return _soup_page_structure(html)
@@ -4,51 +4,38 @@ Investigate alternative approaches to get blueprint node data.
 """
 
 import json
-from bs4 import BeautifulSoup
 from pathlib import Path
 
+from page_store import iter_cached_payloads
+from parsed_cache import load_parsed_page
+
 # Check what we have in the cache
 cache_dir = Path('cache')
-cache_files = list(cache_dir.glob('*.json'))
+cached_pages = sum(1 for _ in iter_cached_payloads(cache_dir, skip=lambda sha1: True))
 
-print(f"=== Cached Files: {len(cache_files)} ===\n")
+print(f"=== Cached Pages: {cached_pages} ===\n")
 
 # Look at a successful category page more carefully
-actor_cache = cache_dir / 'en_us_unreal_engine_BlueprintAPI_Actor.json'
-if actor_cache.exists():
-    with open(actor_cache, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+page = load_parsed_page(cache_dir, 'en-us/unreal-engine/BlueprintAPI/Actor')
+if page:
 
     print("=== Detailed Analysis of Actor Category ===\n")
 
-    if 'blocks' in data:
-        for block in data['blocks']:
-            if 'content_html' in block:
-                html = block['content_html']
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Look at block-dir-item elements more carefully
-                items = soup.find_all('block-dir-item')
-
-                print(f"Found {len(items)} sub-items (blueprint nodes)\n")
-                print("=== First 3 items detailed: ===\n")
-
-                for i, item in enumerate(items[:3]):
-                    print(f"\nItem {i+1}: {item.get('page-name')}")
-                    print(f"  href: {item.get('href')}")
-                    print(f"  description: {item.get('description')}")
+    for block in page['blocks']:
+        if 'items' in block:
+            # Look at block-dir-item elements more carefully
+            items = block['items']
 
-                    # Check all attributes
-                    print(f"  All attributes: {item.attrs}")
+            print(f"Found {len(items)} sub-items (blueprint nodes)\n")
+            print("=== First 3 items detailed: ===\n")
 
-                    # Check if there's any embedded content
-                    if item.string:
-                        print(f"  Content: {item.string}")
+            for i, item in enumerate(items[:3]):
+                print(f"\nItem {i+1}: {item.get('page-name')}")
+                print(f"  href: {item.get('href')}")
+                print(f"  description: {item.get('description')}")
 
-                    # Check children
-                    children = list(item.children)
-                    if children:
-                        print(f"  Children: {children}")
+                # Check all attributes
+                print(f"  All attributes: {item}")
 
 print("\n\n=== Check blueprint_categories.json ===\n")
 with open('blueprint_categories.json', 'r', encoding='utf-8') as f:
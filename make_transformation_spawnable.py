@@ -8,6 +8,8 @@ import json
 from pathlib import Path
 import logging
 
+from pin_types import resolve_database
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -219,6 +221,9 @@ def main():
             updated_count += 1
             logger.info(f"   ✓ {display_name} -> spawnable")
 
+    # Resolve pin types once here, so spawning only looks them up
+    pin_outcomes = resolve_database(nodes)
+
     # Update counts
     spawnable_count = sum(1 for n in nodes if n.get('canSpawn', False))
 
@@ -234,6 +239,7 @@ def main():
     logger.info(f"   Updated: {updated_count} functions")
     logger.info(f"   Total spawnable: {spawnable_count}")
     logger.info(f"   Total nodes: {len(nodes)}")
+    logger.info("   Pin types: " + ', '.join(f"{count} {outcome}" for outcome, count in pin_outcomes.most_common()))
 
     logger.info(f"\n💾 Updated {merged_file}")
     logger.info(f"\n✅ Success! Open index.html and try spawning 'Set Actor Rotation' now!")
@@ -10,9 +10,14 @@ import json
 from pathlib import Path
 import logging
 
+from merge_engine import MergeEngine, Source, log_report
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Fields an old (spawnable) node contributes to the catalog node it matches
+SPAWN_FIELDS = {'className', 'canSpawn', 'inputs', 'outputs'}
+
 
 def main():
     logger.info("🔄 Merging all node databases\n")
@@ -39,42 +44,24 @@ def main():
         phase15_nodes = phase15_data['nodes']
     logger.info(f"📦 Loaded {len(phase15_nodes)} Phase 1.5 functions")
 
-    # Merge strategy:
-    # - Old nodes have className and can spawn
-    # - Phase 1.5 nodes are search-only (no className yet)
-    # - Deduplicate by URL, preferring old nodes if they have className
-
-    merged = {}
-
-    # Add Phase 1.5 nodes first
-    for node in phase15_nodes:
-        url = node.get('url', '')
-        if url:
-            merged[url] = node
-
-    # Override with old nodes if they have className (spawnable)
-    spawnable_count = 0
-    for node in old_nodes:
-        url = node.get('url', '')
-        if url and node.get('className'):
-            # This node can spawn - merge it in
-            if url in merged:
-                # Keep Phase 1.5 data but add spawn info
-                merged[url]['className'] = node['className']
-                merged[url]['canSpawn'] = True
-                if 'inputs' in node:
-                    merged[url]['inputs'] = node['inputs']
-                if 'outputs' in node:
-                    merged[url]['outputs'] = node['outputs']
-            else:
-                merged[url] = {**node, 'canSpawn': True}
-            spawnable_count += 1
-        elif url:
-            # No className, just add if not exists
-            if url not in merged:
-                merged[url] = {**node, 'canSpawn': False}
-
-    all_nodes = list(merged.values())
+    # Merge strategy (see merge_engine.py for how nodes are matched):
+    # - Phase 1.5 nodes are the catalog; they are search-only (no className yet)
+    # - Old nodes are matched by URL only (old nodes without one are skipped)
+    # - Old nodes with a className add spawn info (className, pins) to the catalog
+    #   node they match, taking precedence for those fields, or are added as spawnable
+    # - Old nodes without a className are added as search-only if their URL is new
+    old_with_url = [node for node in old_nodes if node.get('url')]
+    engine = MergeEngine()
+    engine.add_source(Source('phase1_5', phase15_nodes, priority=1))
+    engine.add_source(Source(
+        'old', ({**node, 'canSpawn': True} for node in old_with_url if node.get('className')),
+        priority=2, field_priority={field: 0 for field in SPAWN_FIELDS}, fields=SPAWN_FIELDS, match_names=False))
+    spawnable_count = engine.source_stats[-1]['records']
+    engine.add_source(Source(
+        'old_search_only', ({**node, 'canSpawn': False} for node in old_with_url if not node.get('className')),
+        priority=2, update=False, match_names=False))
+
+    all_nodes = engine.nodes()
 
     # Sort by category and name
     all_nodes.sort(key=lambda x: (x.get('category', ''), x.get('displayName', '')))
@@ -83,6 +70,7 @@ def main():
     logger.info(f"   Total nodes: {len(all_nodes)}")
     logger.info(f"   Spawnable nodes: {spawnable_count}")
     logger.info(f"   Search-only nodes: {len(all_nodes) - spawnable_count}")
+    log_report(engine.report())
 
     # Save merged database
     output = {
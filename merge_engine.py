@@ -0,0 +1,351 @@
+#!/usr/bin/env python3
+"""
+Merge node records from any number of sources into one record per node.
+
+Each record gets identity keys:
+- url:      hash of the normalised documentation URL slug (no scheme, host,
+            locale, query string, fragment or trailing slash; lower case)
+- function: hash of targetClass + functionName (K2_ prefix and case ignored)
+- name:     normalised name ("Get Actor Location" == "K2_GetActorLocation"),
+            within the record's category and across all categories
+
+A record joins the node that already holds its url or function key; failing
+that, the one node with its name (in its category first, then anywhere),
+provided the two do not have different URLs or functions and are of the same
+kind (documentation topic pages never match callable nodes by name). All
+lookups are dict lookups, so a merge is one linear pass over the records.
+A Source can be limited to URL and function matches, to creating nodes only,
+or to merging a subset of its fields into the nodes it matches.
+
+Per field, the value from the source with the best (lowest) priority wins,
+ties going to the record seen first; canSpawn and hasDetailedInfo are true if
+any source says so. Every value that loses to a different one, every
+ambiguous name and every record that matches two different nodes goes into
+the conflict report.
+
+    python merge_engine.py a.json b.json -o merged.json       # earlier files take precedence
+    python merge_engine.py a.json b.json -o merged.json --report conflicts.json
+    python merge_engine.py --benchmark 50000                  # merge a synthetic 50k-record source
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+from node_journal import iter_document_records
+from node_search import name_key
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Flags that are true if any source sets them
+ANY_FIELDS = {'canSpawn', 'hasDetailedInfo'}
+
+LOCALE_PATTERN = re.compile(r'^/documentation/[a-z]{2}-[a-z]{2}/')
+
+# Conflicts of each kind kept in the report (the counts are always complete)
+REPORT_LIMIT = 1000
+
+
+class Source(NamedTuple):
+    name: str
+    records: Iterable[Dict]
+    priority: int = 0
+    # Per-field priorities overriding the source's priority
+    field_priority: Optional[Dict[str, int]] = None
+    # Only these fields are merged into a node a record matches (None: all); new nodes take every field
+    fields: Optional[set] = None
+    # Whether records matching no existing node become new nodes
+    create: bool = True
+    # Whether records matching an existing node merge their fields into it
+    update: bool = True
+    # Whether records may match by name (else only by URL or function)
+    match_names: bool = True
+
+
+class Identity(NamedTuple):
+    url: Optional[str]
+    function: Optional[str]
+    scoped_name: Optional[str]
+    name: Optional[str]
+
+
+def digest(text: str) -> str:
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def url_slug(url: Optional[str]) -> Optional[str]:
+    """'https://dev.epicgames.com/documentation/en-us/unreal-engine/BlueprintAPI/X/Y/?a=1' ->
+    'unreal-engine/blueprintapi/x/y'."""
+    if not url:
+        return None
+    path = re.sub(r'^[a-z]+://[^/]+', '', url.strip(), flags=re.IGNORECASE)
+    path = re.split(r'[?#]', path, 1)[0].lower()
+    path = LOCALE_PATTERN.sub('/', path)
+    return path.strip('/') or None
+
+
+# Values that differ only in form are not conflicts (the higher-priority form is kept)
+EQUIVALENT = {'url': url_slug}
+
+
+def node_kind(record: Dict) -> str:
+    return 'topic' if record.get('type') == 'topic' else 'node'
+
+
+def identity(record: Dict) -> Identity:
+    slug = url_slug(record.get('url'))
+    function = None
+    if record.get('functionName') and record.get('targetClass'):
+        function = digest(f"{record['targetClass'].lower()}::{name_key(record['functionName'])}")
+    name = name_key(record.get('displayName') or record.get('functionName'))
+    if not name:
+        return Identity(slug and digest(slug), function, None, None)
+    kind = node_kind(record)
+    category = name_key(record.get('category'))
+    return Identity(slug and digest(slug), function,
+                    digest(f"{kind}/{category}/{name}"), digest(f"{kind}//{name}"))
+
+
+class Entity:
+    """One merged node: its fields, the priority each field's value came with, and its keys."""
+
+    __slots__ = ('id', 'fields', 'ranks', 'sources', 'url', 'function')
+
+    def __init__(self, key: Identity):
+        self.id = key.url and f"u:{key.url}" or key.function and f"f:{key.function}" or f"n:{key.scoped_name}"
+        self.fields = {}
+        self.ranks = {}
+        self.sources = []
+        self.url = key.url
+        self.function = key.function
+
+    def compatible(self, key: Identity) -> bool:
+        """Whether a record may be the same node (it has no URL or function that contradicts this one's)."""
+        return ((not key.url or not self.url or key.url == self.url) and
+                (not key.function or not self.function or key.function == self.function))
+
+
+def is_empty(value) -> bool:
+    return value is None or value == '' or value == [] or value == {}
+
+
+class MergeEngine:
+    """Merges sources one record at a time; see the module docstring for the rules."""
+
+    def __init__(self):
+        self.entities: List[Entity] = []
+        self.keys = {}      # url / function key -> entity
+        self.names = {}     # name key -> entities with that name
+        self.conflicts = {'field': [], 'ambiguousName': [], 'keyClash': [], 'unmatched': []}
+        self.conflict_counts = Counter()
+        self.source_stats = []
+
+    def conflict(self, kind: str, entry: Dict):
+        self.conflict_counts[kind] += 1
+        if len(self.conflicts[kind]) < REPORT_LIMIT:
+            self.conflicts[kind].append(entry)
+
+    def match(self, record: Dict, key: Identity, source: Source) -> Optional[Entity]:
+        strong = [self.keys[k] for k in (key.url, key.function) if k and k in self.keys]
+        if strong:
+            if len(strong) == 2 and strong[0] is not strong[1]:
+                self.conflict('keyClash', {'source': source.name, 'displayName': record.get('displayName'),
+                                           'url': strong[0].id, 'function': strong[1].id})
+            return strong[0]
+
+        if not source.match_names:
+            return None
+        for name in (key.scoped_name, key.name):
+            candidates = [e for e in self.names.get(name, ()) if e.compatible(key)]
+            if len(candidates) == 1:
+                return candidates[0]
+            if len(candidates) > 1:
+                self.conflict('ambiguousName', {'source': source.name, 'displayName': record.get('displayName'),
+                                                'candidates': [e.id for e in candidates]})
+                return None
+        return None
+
+    def register(self, entity: Entity, key: Identity):
+        for k in (key.url, key.function):
+            if k and self.keys.setdefault(k, entity) is not entity:
+                self.conflict('keyClash', {'key': k, 'entities': [self.keys[k].id, entity.id]})
+        entity.url = entity.url or key.url
+        entity.function = entity.function or key.function
+        for name in (key.scoped_name, key.name):
+            if name:
+                holders = self.names.setdefault(name, [])
+                if entity not in holders:
+                    holders.append(entity)
+
+    def merge_fields(self, entity: Entity, record: Dict, source: Source, new: bool = False):
+        fields, ranks = entity.fields, entity.ranks
+        overrides = source.field_priority or {}
+        for field, value in record.items():
+            if is_empty(value) or (not new and source.fields is not None and field not in source.fields):
+                continue
+            rank = overrides.get(field, source.priority)
+            if field not in fields:
+                fields[field] = value
+                ranks[field] = rank
+            elif field in ANY_FIELDS:
+                fields[field] = bool(fields[field] or value)
+            elif fields[field] == value:
+                ranks[field] = min(ranks[field], rank)
+            elif field in EQUIVALENT and EQUIVALENT[field](fields[field]) == EQUIVALENT[field](value):
+                if rank < ranks[field]:
+                    fields[field] = value
+                    ranks[field] = rank
+            else:
+                keep_new = rank < ranks[field]
+                kept, dropped = (value, fields[field]) if keep_new else (fields[field], value)
+                self.conflict('field', {'node': entity.id, 'displayName': fields.get('displayName'),
+                                        'field': field, 'kept': kept, 'dropped': dropped, 'source': source.name})
+                if keep_new:
+                    fields[field] = value
+                    ranks[field] = rank
+        entity.sources.append(source.name)
+
+    def add_source(self, source: Source):
+        stats = Counter()
+        for record in source.records:
+            stats['records'] += 1
+            key = identity(record)
+            entity = self.match(record, key, source)
+            if entity is None:
+                if not source.create:
+                    stats['unmatched'] += 1
+                    self.conflict('unmatched', {'source': source.name, 'displayName': record.get('displayName')})
+                    continue
+                entity = Entity(key)
+                self.entities.append(entity)
+                stats['created'] += 1
+                self.merge_fields(entity, record, source, new=True)
+            else:
+                stats['matched'] += 1
+                if not source.update:
+                    continue
+                self.merge_fields(entity, record, source)
+            self.register(entity, key)
+        self.source_stats.append({'name': source.name, **{k: stats[k] for k in
+                                                          ('records', 'matched', 'created', 'unmatched')}})
+
+    def nodes(self) -> List[Dict]:
+        """Merged records, in the order their nodes were first seen."""
+        return [entity.fields for entity in self.entities]
+
+    def report(self) -> Dict:
+        return {
+            'sources': self.source_stats,
+            'nodes': len(self.entities),
+            'conflictCounts': {kind: self.conflict_counts[kind] for kind in self.conflicts},
+            'conflicts': self.conflicts,
+        }
+
+
+def merge(sources: Iterable[Source]) -> MergeEngine:
+    engine = MergeEngine()
+    for source in sources:
+        engine.add_source(source)
+    return engine
+
+
+def log_report(report: Dict):
+    for stats in report['sources']:
+        logger.info(f"   {stats['name']}: {stats['records']} records, {stats['matched']} matched, "
+                    f"{stats['created']} new, {stats['unmatched']} unmatched")
+    counts = report['conflictCounts']
+    logger.info(f"   Conflicts: {counts['field']} field values, {counts['ambiguousName']} ambiguous names, "
+                f"{counts['keyClash']} key clashes, {counts['unmatched']} unmatched records")
+
+
+def synthetic_sources(count: int, base: List[Dict]) -> List[Source]:
+    """The base nodes, a count-record docs source, and a re-scrape of it with URL variants,
+    K2_ function names and changed descriptions (which should all merge, not duplicate)."""
+    def docs():
+        for i in range(count):
+            yield {
+                'displayName': f"Synthetic Node {i}",
+                'category': f"Category {i % 97}",
+                'description': f"Does synthetic thing number {i}.",
+                'url': f"https://dev.epicgames.com/documentation/en-us/unreal-engine/BlueprintAPI/Synthetic/Node{i}",
+                'type': 'function',
+                'hasDetailedInfo': False,
+                'canSpawn': False,
+            }
+
+    def rescrape():
+        for i in range(count):
+            if i % 3 == 0:
+                yield {'displayName': f"Synthetic Node {i}", 'category': f"Category {i % 97}",
+                       'url': f"https://dev.epicgames.com/documentation/en-US/unreal-engine/blueprintapi/"
+                              f"synthetic/node{i}/?application_version=5.5",
+                       'description': f"Does synthetic thing number {i} (rescraped)."}
+            else:
+                yield {'functionName': f"K2_SyntheticNode{i}", 'targetClass': '/Script/Synthetic.Thing',
+                       'className': 'K2Node_CallFunction', 'category': f"Category {i % 97}", 'canSpawn': True}
+
+    return [Source('base', base, priority=1), Source('docs', docs(), priority=1), Source('rescrape', rescrape(), priority=2)]
+
+
+def benchmark(count: int, base_file: Path):
+    base = json.loads(base_file.read_text(encoding='utf-8'))['nodes'] if base_file.exists() else []
+    start = time.perf_counter()
+    engine = merge(synthetic_sources(count, base))
+    elapsed = time.perf_counter() - start
+
+    records = sum(stats['records'] for stats in engine.source_stats)
+    duplicates = len(engine.entities) - len(base) - count
+    logger.info(f"⏱️  Merged {records} records into {len(engine.entities)} nodes in {elapsed:.2f}s "
+                f"({records / elapsed:,.0f} records/s)")
+    logger.info(f"   {'✅ no duplicates' if duplicates == 0 else f'❌ {duplicates} duplicate nodes'}")
+    log_report(engine.report())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Merge node databases by canonical identity')
+    parser.add_argument('sources', nargs='*', help='Node databases, highest precedence first')
+    parser.add_argument('-o', '--output', help='Merged database to write')
+    parser.add_argument('--report', help='Write the conflict report here')
+    parser.add_argument('--benchmark', type=int, metavar='COUNT',
+                        help='Merge the Phase 1.5 nodes with a synthetic COUNT-record source and its re-scrape')
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        benchmark(args.benchmark, Path('ue_blueprint_functions_phase1_5.json'))
+        return
+
+    missing = [path for path in args.sources if not Path(path).exists()]
+    if missing or not args.sources:
+        parser.error(f"missing sources: {', '.join(missing)}" if missing else 'no sources given')
+
+    start = time.perf_counter()
+    engine = merge(Source(Path(path).name, iter_document_records(path), priority=rank)
+                   for rank, path in enumerate(args.sources))
+    logger.info(f"🔗 Merged {len(args.sources)} sources into {len(engine.entities)} nodes "
+                f"in {time.perf_counter() - start:.2f}s")
+    report = engine.report()
+    log_report(report)
+
+    if args.output:
+        nodes = engine.nodes()
+        output = {'source': f"Merged: {', '.join(args.sources)}", 'totalNodes': len(nodes),
+                  'spawnableNodes': sum(1 for n in nodes if n.get('canSpawn')), 'nodes': nodes}
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+        logger.info(f"💾 Saved to {args.output}")
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        logger.info(f"📝 Conflict report saved to {args.report}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Migrate the legacy one-file-per-page caches (cache/*.json, detailed_cache/*.json
+and their .meta validator sidecars) into the packed page store.
+Legacy files are kept unless --delete is given; scripts read both layouts.
+"""
+
+import argparse
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+
+from page_store import PageStore, canonical_path, legacy_cache_name
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DOC_PREFIX = 'en-us/unreal-engine/'
+
+
+def guess_doc_path(data: Dict, stem: str) -> Optional[str]:
+    """Recover the documentation path a legacy cache file was saved under.
+
+    The old file name is lossy ('/' and '-' both became '_'), so the path is
+    taken from the document itself and checked against the file name.
+    """
+    candidates = []
+    for value in (data.get('path'), data.get('slug')):
+        if value:
+            value = canonical_path(value)
+            candidates.append(value)
+            if not value.startswith(DOC_PREFIX):
+                candidates.append(DOC_PREFIX + value)
+
+    for candidate in candidates:
+        if legacy_cache_name(candidate) == stem:
+            return candidate
+    return None
+
+
+def migrate_dir(cache_dir: Path, delete: bool = False) -> Dict[str, int]:
+    stats = {'migrated': 0, 'skipped': 0, 'unresolved': 0, 'bytes_before': 0, 'bytes_after': 0}
+    legacy_files = sorted(cache_dir.glob('*.json'))
+    if not legacy_files:
+        logger.info(f"   {cache_dir}/: no legacy cache files")
+        return stats
+
+    store = PageStore(cache_dir / 'store')
+    try:
+        for cache_file in legacy_files:
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except Exception as e:
+                logger.error(f"  ✗ Error reading {cache_file.name}: {e}")
+                stats['unresolved'] += 1
+                continue
+
+            path = guess_doc_path(data, cache_file.stem)
+            if path is None:
+                logger.warning(f"  ⚠️  Cannot recover doc path for {cache_file.name}, left in place")
+                stats['unresolved'] += 1
+                continue
+
+            meta_file = cache_file.with_suffix('.meta')
+            stats['bytes_before'] += cache_file.stat().st_size
+
+            if path in store:
+                stats['skipped'] += 1
+            else:
+                meta = {}
+                if meta_file.exists():
+                    with open(meta_file, 'r', encoding='utf-8') as f:
+                        meta = json.load(f)
+                store.put(path, data, meta=meta)
+                stats['migrated'] += 1
+
+            if delete:
+                cache_file.unlink()
+                if meta_file.exists():
+                    meta_file.unlink()
+    finally:
+        store.close()
+
+    stats['bytes_after'] = sum(f.stat().st_size for f in (cache_dir / 'store').iterdir())
+    return stats
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Migrate per-file JSON caches into the packed page store')
+    parser.add_argument('cache_dirs', nargs='*', default=['cache', 'detailed_cache'],
+                        help='Cache directories to migrate (default: cache detailed_cache)')
+    parser.add_argument('--delete', action='store_true',
+                        help='Delete legacy files once they are in the store')
+
+    args = parser.parse_args()
+
+    logger.info("📦 Migrating legacy caches into the packed page store")
+    for cache_dir in args.cache_dirs:
+        cache_dir = Path(cache_dir)
+        if not cache_dir.exists():
+            logger.info(f"   {cache_dir}/: not found, skipping")
+            continue
+
+        stats = migrate_dir(cache_dir, delete=args.delete)
+        if stats['migrated'] or stats['skipped']:
+            logger.info(f"✅ {cache_dir}/: {stats['migrated']} migrated, {stats['skipped']} already stored, "
+                        f"{stats['unresolved']} unresolved")
+            logger.info(f"   {stats['bytes_before'] / 1024 / 1024:.1f} MB of JSON -> "
+                        f"{stats['bytes_after'] / 1024 / 1024:.1f} MB packed")
+
+
+if __name__ == '__main__':
+    main()
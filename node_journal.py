@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Append-only JSONL journal for scraped node records, plus compaction into the
+ue_blueprint_nodes_*.json views.
+
+Scrapers append each record as it is produced (cost proportional to the new
+data, and a crash loses at most the line being written). Compaction streams
+the journal into the output document one record at a time, so neither side
+holds the full node list in memory. The written JSON is byte-identical to
+json.dump(document, f, indent=2, ensure_ascii=False).
+"""
+
+import json
+import os
+import re
+import logging
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class NodeJournal:
+    """Append-only JSON-lines journal of node records."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.handle = None
+        self.appended = 0
+
+    def reset(self):
+        """Start an empty journal (for runs that rebuild their output from scratch)."""
+        self.close()
+        self.path.write_text('', encoding='utf-8')
+
+    def reopen(self):
+        """Continue an existing journal (e.g. a resumed crawl); appended counts its records."""
+        self.appended = sum(1 for _ in self.scan())
+
+    def append(self, record: Dict):
+        if self.handle is None:
+            self.drop_torn_tail()
+            self.handle = open(self.path, 'a', encoding='utf-8')
+        self.handle.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.handle.flush()
+        self.appended += 1
+
+    def drop_torn_tail(self):
+        """Cut a partial last line (a crash mid-append) so the next record starts on its own line."""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r+b') as f:
+            end = f.seek(0, 2)
+            pos = end
+            while pos > 0:
+                start = max(0, pos - 4096)
+                f.seek(start)
+                newline = f.read(pos - start).rfind(b'\n')
+                if newline >= 0:
+                    pos = start + newline + 1
+                    break
+                pos = start
+            if pos < end:
+                logger.warning(f"⚠️  Dropping {end - pos} bytes of a torn last line in {self.path.name}")
+                f.truncate(pos)
+
+    def extend(self, records: Iterable[Dict]):
+        for record in records:
+            self.append(record)
+
+    def close(self):
+        if self.handle is not None:
+            self.handle.close()
+            self.handle = None
+
+    def __iter__(self) -> Iterator[Dict]:
+        for _, record in self.scan():
+            yield record
+
+    def scan(self) -> Iterator[Tuple[int, Dict]]:
+        """Yield (byte offset, record) for every complete line in the journal."""
+        if self.handle is not None:
+            self.handle.flush()
+        if not self.path.exists():
+            return
+        with open(self.path, 'rb') as f:
+            offset = 0
+            for line in f:
+                start, offset = offset, offset + len(line)
+                if not line.strip():
+                    continue
+                try:
+                    yield start, json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-append
+                    logger.warning(f"⚠️  Skipping unreadable journal line at byte {start} in {self.path.name}")
+
+    def read_at(self, offset: int) -> Dict:
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def latest_offsets(self, key: Callable[[Dict], str]) -> Tuple[Dict[str, int], int]:
+        """Map each record key to the offset of its latest record.
+
+        Only keys and offsets are held in memory. Also returns the number of
+        records scanned, so callers can tell how much is superseded.
+        """
+        offsets = {}
+        total = 0
+        for offset, record in self.scan():
+            offsets[key(record)] = offset
+            total += 1
+        return offsets, total
+
+    def prune(self, key: Callable[[Dict], str]) -> int:
+        """Rewrite the journal keeping only the latest record per key. Returns records kept."""
+        offsets, _ = self.latest_offsets(key)
+        keep = set(offsets.values())
+        self.close()
+
+        tmp_path = self.path.with_suffix(self.path.suffix + '.tmp')
+        with open(self.path, 'rb') as src, open(tmp_path, 'wb') as dst:
+            offset = 0
+            for line in src:
+                if offset in keep:
+                    dst.write(line)
+                offset += len(line)
+        os.replace(tmp_path, self.path)
+        return len(keep)
+
+
+def _indent(text: str, prefix: str) -> str:
+    return text.replace('\n', '\n' + prefix)
+
+
+def write_document(output_path, document: Dict, stream_key: str = 'nodes'):
+    """Write a JSON document whose stream_key value is an iterable of records.
+
+    The records are written one at a time (never materialised as a list).
+    The file is written to a temporary path and atomically replaced, so a
+    crash never leaves a half-written view.
+    """
+    output_path = Path(output_path)
+    tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('{')
+        for i, (key, value) in enumerate(document.items()):
+            f.write(('\n' if i == 0 else ',\n') + '  ' + json.dumps(key, ensure_ascii=False) + ': ')
+
+            if key != stream_key:
+                f.write(_indent(json.dumps(value, indent=2, ensure_ascii=False), '  '))
+                continue
+
+            empty = True
+            for record in value:
+                f.write('[\n    ' if empty else ',\n    ')
+                f.write(_indent(json.dumps(record, indent=2, ensure_ascii=False), '    '))
+                empty = False
+            f.write('[]' if empty else '\n  ]')
+        f.write('\n}' if document else '}')
+
+    os.replace(tmp_path, output_path)
+
+
+def compact(journal: NodeJournal, output_path, header: Dict, trailer: Optional[Dict] = None,
+            stream_key: str = 'nodes') -> int:
+    """Materialise a journal as a JSON view: header fields, the records, then trailer fields.
+
+    Returns the number of records written.
+    """
+    written = 0
+
+    def records():
+        nonlocal written
+        for record in journal:
+            written += 1
+            yield record
+
+    write_document(output_path, {**header, stream_key: records(), **(trailer or {})}, stream_key)
+    return written
+
+
+def iter_document_records(path, stream_key: str = 'nodes', chunk_size: int = 1 << 16,
+                          with_text: bool = False) -> Iterator:
+    """Stream the records of a JSON document's stream_key array without loading the file.
+
+    The counterpart of write_document(): works on any ue_blueprint_*.json
+    view whose top-level stream_key array appears before any nested key of
+    the same name. With with_text=True, yields (source text, record) pairs.
+    """
+    decoder = json.JSONDecoder()
+    marker = re.compile(r'"' + re.escape(stream_key) + r'"\s*:\s*\[')
+
+    with open(path, 'r', encoding='utf-8') as f:
+        buf = ''
+        while True:
+            chunk = f.read(chunk_size)
+            buf += chunk
+            match = marker.search(buf)
+            if match:
+                pos = match.end()
+                break
+            if not chunk:
+                return
+            # Keep a tail in case the marker straddles two chunks
+            buf = buf[-(len(stream_key) + 16):]
+
+        eof = False
+        while True:
+            # Skip separators between records
+            while pos < len(buf) and buf[pos] in ' \t\r\n,':
+                pos += 1
+            if pos < len(buf) and buf[pos] == ']':
+                return
+            try:
+                if pos >= len(buf):
+                    raise ValueError('need more data')
+                record, end = decoder.raw_decode(buf, pos)
+            except ValueError:
+                if eof:
+                    raise ValueError(f"Truncated '{stream_key}' array in {path}")
+                chunk = f.read(chunk_size)
+                eof = not chunk
+                buf = buf[pos:] + chunk
+                pos = 0
+                continue
+            yield (buf[pos:end], record) if with_text else record
+            pos = end
@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+In-process fuzzy lookup over the node catalog, for tools and the LLM front end
+that need to resolve a node name (possibly misspelled, camelCase or spaced)
+to a node.
+
+Names are split into words at spaces, underscores, camelCase and digit
+boundaries, so "SetActorRotation", "K2_SetActorRotation" and "Set Actor
+Rotation" share the key "setactorrotation". Indexes:
+- keys:     name key -> nodes (exact resolution)
+- trigrams: trigrams of the padded name keys -> nodes (typo-tolerant candidates)
+- words:    words of names, categories and descriptions -> nodes
+
+A query collects candidates from the trigram and word indexes, reranks the
+best of them by edit distance between name keys (bit-parallel, so each
+comparison is a few integer operations per character), and adds a small bonus
+for query words found in the category or description.
+
+    python node_search.py "set actr rotaton"            # top matches
+    python node_search.py "get forward vector" -k 5
+    python node_search.py --benchmark                   # latency over typo queries
+"""
+
+import argparse
+import heapq
+import json
+import logging
+import random
+import re
+import time
+from collections import Counter
+from itertools import chain
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+WORD_PATTERN = re.compile(r'[A-Z]+(?=[A-Z][a-z])|[A-Z]?[a-z]+|[A-Z]+\d*|\d+')
+
+# Words that carry no meaning in a name (UE's K2_ function prefix)
+NOISE_WORDS = {'k2'}
+
+# Candidates reranked by edit distance per query (at least k)
+RERANK_POOL = 16
+
+
+class SearchHit(NamedTuple):
+    score: float
+    id: int
+    node: Dict
+
+
+def split_words(text: Optional[str]) -> List[str]:
+    """'K2_SetActorRotation' / 'Set Actor Rotation' -> ['set', 'actor', 'rotation']."""
+    if not text:
+        return []
+    return [w.lower() for w in WORD_PATTERN.findall(text) if w.lower() not in NOISE_WORDS]
+
+
+def name_key(text: Optional[str]) -> str:
+    return ''.join(split_words(text))
+
+
+def key_trigrams(key: str) -> List[str]:
+    padded = f"^{key}$"
+    return [padded[i:i + 3] for i in range(len(padded) - 2)]
+
+
+class EditDistance:
+    """Levenshtein distance from one pattern to many strings (Myers/Hyyrö bit-parallel).
+
+    The pattern's character masks are built once, so each comparison costs a
+    few integer operations per character of the other string.
+    """
+
+    def __init__(self, pattern: str):
+        self.pattern = pattern
+        self.peq = {}
+        for i, c in enumerate(pattern):
+            self.peq[c] = self.peq.get(c, 0) | (1 << i)
+        self.mask = (1 << len(pattern)) - 1
+        self.high = 1 << (len(pattern) - 1) if pattern else 0
+
+    def __call__(self, text: str) -> int:
+        if not self.pattern:
+            return len(text)
+        peq, mask, high = self.peq, self.mask, self.high
+        pv, mv, score = mask, 0, len(self.pattern)
+        for c in text:
+            eq = peq.get(c, 0)
+            xv = eq | mv
+            xh = (((eq & pv) + pv) ^ pv) | eq
+            ph = mv | ~(xh | pv)
+            mh = pv & xh
+            if ph & high:
+                score += 1
+            elif mh & high:
+                score -= 1
+            ph = (ph << 1) | 1
+            mh <<= 1
+            pv = (mh | ~(xv | ph)) & mask
+            mv = ph & xv & mask
+        return score
+
+
+def edit_distance(a: str, b: str) -> int:
+    return EditDistance(a)(b)
+
+
+def key_similarity(query: str, key: str, distance: Optional[EditDistance] = None) -> float:
+    """1.0 for equal keys, high for prefixes (typing in progress), else 1 - normalised edit distance."""
+    if query == key:
+        return 1.0
+    if key.startswith(query):
+        return 0.8 + 0.15 * len(query) / len(key)
+    distance = distance or EditDistance(query)
+    return 1.0 - distance(key) / max(len(query), len(key))
+
+
+class NodeSearch:
+    """Fuzzy node lookup over a list of node records (merged database schema)."""
+
+    def __init__(self, nodes: List[Dict]):
+        self.nodes = nodes
+        self.name_keys = []
+        self.key_lengths = []
+        self.keys = {}
+        self.trigrams = {}
+        self.name_words = {}
+        self.other_words = []
+
+        for node_id, node in enumerate(nodes):
+            keys = []
+            for field in ('displayName', 'functionName'):
+                key = name_key(node.get(field))
+                if key and key not in keys:
+                    keys.append(key)
+            self.name_keys.append(keys)
+            self.key_lengths.append(min((len(key) for key in keys), default=1))
+
+            for key in keys:
+                self.keys.setdefault(key, []).append(node_id)
+                for gram in set(key_trigrams(key)):
+                    self.trigrams.setdefault(gram, []).append(node_id)
+
+            words = set(chain.from_iterable(split_words(node.get(f)) for f in ('displayName', 'functionName')))
+            for word in words:
+                self.name_words.setdefault(word, []).append(node_id)
+            self.other_words.append(set(split_words(node.get('category'))) |
+                                    set(split_words(node.get('description'))))
+
+    @classmethod
+    def load(cls, path='ue_blueprint_nodes_merged.json') -> 'NodeSearch':
+        """Index a merged database file (plain or columnar_nodes.py encoding)."""
+        with open(path, 'r', encoding='utf-8') as f:
+            document = json.load(f)
+        if 'columns' in document:
+            from columnar_nodes import ColumnarNodes
+            return cls(list(ColumnarNodes(document)))
+        return cls(document['nodes'])
+
+    def candidates(self, key: str, words: List[str]) -> Counter:
+        """Nodes sharing trigrams or name words with the query, with the number shared."""
+        counts = Counter()
+        counts.update(chain.from_iterable(self.trigrams.get(g, ()) for g in set(key_trigrams(key))))
+        counts.update(chain.from_iterable(self.name_words.get(w, ()) for w in set(words)))
+        return counts
+
+    def score(self, node_id: int, key: str, words: List[str], distance: EditDistance) -> float:
+        similarity = max((key_similarity(key, k, distance) for k in self.name_keys[node_id]), default=0.0)
+        if words:
+            other = self.other_words[node_id]
+            similarity += 0.1 * sum(1 for w in words if w in other) / len(words)
+        return similarity
+
+    def search(self, query: str, k: int = 10, category: Optional[str] = None,
+               spawnable_only: bool = False) -> List[SearchHit]:
+        """Best k nodes for a name-like query, best first."""
+        words = split_words(query)
+        key = ''.join(words)
+        if not key:
+            return []
+
+        counts = self.candidates(key, words)
+        if category or spawnable_only:
+            wanted = category.lower() if category else None
+            counts = Counter({node_id: count for node_id, count in counts.items()
+                              if (not wanted or (self.nodes[node_id].get('category') or '').lower() == wanted)
+                              and (not spawnable_only or self.nodes[node_id].get('canSpawn'))})
+
+        # Exact key matches, then the nodes sharing the most trigrams and words
+        # relative to name length (raw counts would favour long names)
+        pool = set(node_id for node_id in self.keys.get(key, ()) if node_id in counts)
+        size = len(key)
+        lengths = self.key_lengths
+        pool.update(node_id for node_id, _ in heapq.nlargest(
+            max(k, RERANK_POOL), counts.items(), key=lambda item: item[1] / (size + lengths[item[0]])))
+
+        distance = EditDistance(key)
+        hits = [SearchHit(round(self.score(node_id, key, words, distance), 4), node_id, self.nodes[node_id])
+                for node_id in pool]
+        hits.sort(key=lambda hit: (-hit.score, not hit.node.get('canSpawn'), hit.id))
+        return hits[:k]
+
+    def resolve(self, name: str, min_score: float = 0.75) -> Optional[Dict]:
+        """The node a name most likely refers to, or None if nothing is close enough."""
+        hits = self.search(name, k=1)
+        return hits[0].node if hits and hits[0].score >= min_score else None
+
+
+def typo(text: str, rng: random.Random) -> str:
+    """Drop, double or swap one character."""
+    if len(text) < 4:
+        return text
+    i = rng.randrange(1, len(text) - 2)
+    roll = rng.random()
+    if roll < 0.33:
+        return text[:i] + text[i + 1:]
+    if roll < 0.66:
+        return text[:i] + text[i] + text[i:]
+    return text[:i] + text[i + 1] + text[i] + text[i + 2:]
+
+
+def benchmark(search: NodeSearch, count: int = 500, seed: int = 0):
+    """Time top-10 lookups for misspelled, camelCase and spaced names; report top-1 accuracy."""
+    rng = random.Random(seed)
+    named = [i for i, node in enumerate(search.nodes) if node.get('displayName')]
+    sample = [rng.choice(named) for _ in range(count)]
+
+    def variants(node: Dict) -> Iterable[str]:
+        name = node['displayName']
+        yield typo(name, rng)
+        yield name.replace(' ', '')
+        yield name.lower()
+
+    queries = [(node_id, q) for node_id in sample for q in variants(search.nodes[node_id])]
+    correct = 0
+    start = time.perf_counter()
+    for node_id, q in queries:
+        hits = search.search(q)
+        if hits and name_key(hits[0].node.get('displayName')) == name_key(search.nodes[node_id]['displayName']):
+            correct += 1
+    elapsed = time.perf_counter() - start
+
+    logger.info(f"⏱️  {len(queries)} queries: {elapsed * 1000 / len(queries):.3f} ms/query, "
+                f"top-1 accuracy {correct / len(queries) * 100:.1f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fuzzy blueprint node lookup')
+    parser.add_argument('query', nargs='*', help='Node name to look up')
+    parser.add_argument('--database', default='ue_blueprint_nodes_merged.json', help='Node database')
+    parser.add_argument('-k', type=int, default=10, help='Number of results')
+    parser.add_argument('--category', help='Only nodes in this category')
+    parser.add_argument('--spawnable', action='store_true', help='Only spawnable nodes')
+    parser.add_argument('--benchmark', action='store_true', help='Time lookups over generated typo queries')
+
+    args = parser.parse_args()
+
+    if not Path(args.database).exists():
+        logger.error(f"❌ {args.database} not found! Run merge_all_nodes.py first.")
+        return
+
+    start = time.perf_counter()
+    search = NodeSearch.load(args.database)
+    logger.info(f"📚 Indexed {len(search.nodes)} nodes in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    if args.benchmark:
+        benchmark(search)
+
+    if args.query:
+        query = ' '.join(args.query)
+        start = time.perf_counter()
+        hits = search.search(query, args.k, args.category, args.spawnable)
+        elapsed = time.perf_counter() - start
+        logger.info(f"\n🔎 '{query}' ({elapsed * 1000:.2f} ms)")
+        for hit in hits:
+            spawn = '' if hit.node.get('canSpawn') else ' (search only)'
+            logger.info(f"   {hit.score:.3f}  {hit.node.get('displayName')} [{hit.node.get('category')}]{spawn}")
+
+
+if __name__ == '__main__':
+    main()
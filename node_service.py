@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Local HTTP query service over the node catalog, so the web UI and LLM tooling
+share one process that has the database loaded and indexed instead of each
+downloading or json.load-ing the whole file.
+
+Endpoints (all GET, JSON responses):
+    /search?q=set+actor+rotation&k=10&category=Transformation&spawnable=1
+    /nodes/<id>                 full node record
+    /nodes/<id>/spawn?x=0&y=0   spawn payload (class, function, pins) of a spawnable node,
+                                with its paste-ready T3D text (t3d_serializer.py)
+    /categories                 categories with node counts
+    /categories/<name>          node summaries in one category
+    /stats                      catalog, cache and reload counters
+
+Node ids are positions in the database's nodes list. Responses are cached
+(encoded) in an LRU keyed by path and query, except spawn payloads (their T3D
+has fresh GUIDs every time); the database file is polled and reloaded in the
+background when it changes, and the cache is dropped on swap. A request that
+raises is answered with a 500 JSON error instead of dropping the connection.
+
+    python node_service.py                          # serve on 127.0.0.1:8765
+    python node_service.py --benchmark --clients 8  # latency / throughput under load
+"""
+
+import argparse
+import json
+import logging
+import random
+import re
+import statistics
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, quote, unquote, urlsplit
+
+from node_search import NodeSearch, typo
+from t3d_serializer import T3DSerializer
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SUMMARY_FIELDS = ['displayName', 'category', 'type', 'canSpawn', 'isPure']
+SPAWN_FIELDS = ['displayName', 'className', 'functionName', 'targetClass', 'isPure', 'inputs', 'outputs']
+MAX_RESULTS = 100
+INTEGER = re.compile(r'-?[0-9]+')
+
+
+def summary(node_id: int, node: Dict) -> Dict:
+    return {'id': node_id, **{field: node[field] for field in SUMMARY_FIELDS if field in node}}
+
+
+class Catalog:
+    """One loaded database: the nodes, the search index and the category lists."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.signature = self.file_signature(path)
+        self.search = NodeSearch.load(path)
+        self.nodes = self.search.nodes
+        self.by_category = {}
+        for node_id, node in enumerate(self.nodes):
+            self.by_category.setdefault(node.get('category') or 'Uncategorized', []).append(node_id)
+        self.loaded_at = time.strftime('%Y-%m-%d %H:%M:%S')
+        self.generation = 0
+        # Compiled T3D templates belong to these node records, so they go with the catalog
+        self.serializer = T3DSerializer()
+        self.serializer_lock = threading.Lock()
+
+    def spawn_t3d(self, node: Dict, x: int, y: int) -> str:
+        with self.serializer_lock:
+            return self.serializer.serialize(node, x, y)
+
+    @staticmethod
+    def file_signature(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+
+class ResponseCache:
+    """Thread-safe LRU of encoded responses."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key) -> Optional[Tuple[int, bytes]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key, entry: Tuple[int, bytes]):
+        if self.size <= 0:
+            return
+        with self.lock:
+            self.entries[key] = entry
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+
+class CatalogService:
+    """Routes requests against the current catalog; reloads it when the file changes."""
+
+    def __init__(self, path, cache_size: int = 1024, reload_interval: float = 1.0):
+        self.path = Path(path)
+        self.catalog = Catalog(self.path)
+        self.cache = ResponseCache(cache_size)
+        self.reload_interval = reload_interval
+        self.reloads = 0
+        self.generation = 0
+        self.requests = 0
+        self.stopped = threading.Event()
+
+    def watch(self):
+        """Poll the database file; load a changed file off to the side, then swap it in."""
+        while not self.stopped.wait(self.reload_interval):
+            try:
+                if Catalog.file_signature(self.path) == self.catalog.signature:
+                    continue
+                catalog = Catalog(self.path)
+            except (OSError, ValueError, KeyError) as e:
+                # Missing or half-written file: keep serving the old catalog
+                logger.warning(f"⚠️  Reload of {self.path} failed: {e}")
+                continue
+            self.generation += 1
+            catalog.generation = self.generation
+            self.catalog = catalog
+            self.cache.clear()
+            self.reloads += 1
+            logger.info(f"🔄 Reloaded {self.path} ({len(catalog.nodes)} nodes)")
+
+    def start_watcher(self) -> threading.Thread:
+        thread = threading.Thread(target=self.watch, name='catalog-watcher', daemon=True)
+        thread.start()
+        return thread
+
+    def handle(self, target: str) -> Tuple[int, bytes]:
+        """(status, JSON body) for a request target, from the cache when possible."""
+        self.requests += 1
+        catalog = self.catalog
+        # Keyed by generation, so a response computed from a catalog that was
+        # swapped out mid-request is never served from the new one
+        key = (catalog.generation, target)
+        cached = self.cache.get(key)
+        if cached:
+            return cached
+
+        url = urlsplit(target)
+        params = {name: values[-1] for name, values in parse_qs(url.query).items()}
+        parts = [unquote(part) for part in url.path.strip('/').split('/') if part]
+        try:
+            status, payload = self.route(catalog, parts, params)
+        except Exception as e:
+            logger.exception(f"❌ {target} failed")
+            status, payload = 500, {'error': f"internal error: {e}"}
+        response = (status, json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+        if status == 200 and parts[:1] != ['stats'] and parts[2:] != ['spawn']:
+            self.cache.put(key, response)
+        return response
+
+    def route(self, catalog: Catalog, parts: List[str], params: Dict[str, str]) -> Tuple[int, object]:
+        if parts == ['search']:
+            query = params.get('q', '')
+            k = params.get('k', '10')
+            if not (k.isascii() and k.isdigit()):
+                return 400, {'error': 'k must be a non-negative integer'}
+            k = min(int(k), MAX_RESULTS)
+            hits = catalog.search.search(query, k, params.get('category'),
+                                         params.get('spawnable') in ('1', 'true'))
+            return 200, {'query': query,
+                         'results': [{**summary(hit.id, hit.node), 'score': hit.score} for hit in hits]}
+
+        if parts[:1] == ['nodes'] and len(parts) in (2, 3):
+            node_id = int(parts[1]) if parts[1].isdigit() else -1
+            if not 0 <= node_id < len(catalog.nodes):
+                return 404, {'error': f"no node {parts[1]}"}
+            node = catalog.nodes[node_id]
+            if len(parts) == 2:
+                return 200, {'id': node_id, **node}
+            if parts[2] != 'spawn':
+                return 404, {'error': 'unknown endpoint'}
+            if not node.get('canSpawn') or not node.get('className'):
+                return 404, {'error': f"'{node.get('displayName')}' is search-only"}
+            position = [params.get(axis, '0') for axis in ('x', 'y')]
+            if not all(INTEGER.fullmatch(value) for value in position):
+                return 400, {'error': 'x and y must be integers'}
+            return 200, {'id': node_id, **{field: node[field] for field in SPAWN_FIELDS if field in node},
+                         't3d': catalog.spawn_t3d(node, *map(int, position))}
+
+        if parts == ['categories']:
+            return 200, {'categories': [{'name': name, 'nodes': len(ids)}
+                                        for name, ids in sorted(catalog.by_category.items())]}
+
+        if parts[:1] == ['categories'] and len(parts) == 2:
+            ids = catalog.by_category.get(parts[1])
+            if ids is None:
+                return 404, {'error': f"no category '{parts[1]}'"}
+            return 200, {'category': parts[1], 'nodes': [summary(i, catalog.nodes[i]) for i in ids]}
+
+        if parts == ['stats']:
+            return 200, {
+                'database': str(catalog.path),
+                'nodes': len(catalog.nodes),
+                'loadedAt': catalog.loaded_at,
+                'reloads': self.reloads,
+                'requests': self.requests,
+                'cache': {'entries': len(self.cache.entries), 'hits': self.cache.hits,
+                          'misses': self.cache.misses},
+            }
+
+        return 404, {'error': 'unknown endpoint'}
+
+
+class RequestHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'       # keep-alive for repeat clients
+    disable_nagle_algorithm = True      # headers and body go out as separate writes
+    service: CatalogService = None
+
+    def do_GET(self):
+        status, body = self.service.handle(self.path)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        logger.debug(format % args)
+
+
+def make_server(service: CatalogService, host: str, port: int) -> ThreadingHTTPServer:
+    handler = type('CatalogRequestHandler', (RequestHandler,), {'service': service})
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def benchmark_targets(catalog: Catalog, count: int, seed: int = 0) -> List[str]:
+    """A request mix: mostly searches (some repeated, as hot queries are), node and category reads."""
+    rng = random.Random(seed)
+    names = [n['displayName'] for n in catalog.nodes if n.get('displayName')]
+    hot = [quote(name.lower()) for name in rng.sample(names, min(20, len(names)))]
+    categories = list(catalog.by_category)
+
+    targets = []
+    for _ in range(count):
+        roll = rng.random()
+        if roll < 0.4:
+            targets.append(f"/search?q={rng.choice(hot)}")
+        elif roll < 0.7:
+            targets.append(f"/search?q={quote(typo(rng.choice(names), rng))}")
+        elif roll < 0.9:
+            targets.append(f"/nodes/{rng.randrange(len(catalog.nodes))}")
+        else:
+            targets.append(f"/categories/{quote(rng.choice(categories))}")
+    return targets
+
+
+def run_benchmark(service: CatalogService, clients: int, requests: int):
+    """Serve on an ephemeral port and drive it with concurrent keep-alive clients."""
+    server = make_server(service, '127.0.0.1', 0)
+    port = server.server_address[1]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    per_client = max(1, requests // clients)
+
+    def client(index: int) -> List[float]:
+        conn = HTTPConnection('127.0.0.1', port)
+        latencies = []
+        for target in benchmark_targets(service.catalog, per_client, seed=index):
+            start = time.perf_counter()
+            conn.request('GET', target)
+            response = conn.getresponse()
+            response.read()
+            latencies.append(time.perf_counter() - start)
+        conn.close()
+        return latencies
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=clients) as pool:
+        latencies = sorted(latency for result in pool.map(client, range(clients)) for latency in result)
+    elapsed = time.perf_counter() - start
+    server.shutdown()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] * 1000
+
+    total = service.cache.hits + service.cache.misses
+    logger.info(f"⏱️  {len(latencies)} requests from {clients} clients in {elapsed:.2f}s "
+                f"({len(latencies) / elapsed:.0f} req/s)")
+    logger.info(f"   latency p50 {percentile(0.5):.2f} ms, p95 {percentile(0.95):.2f} ms, "
+                f"p99 {percentile(0.99):.2f} ms, mean {statistics.mean(latencies) * 1000:.2f} ms")
+    logger.info(f"   cache hit rate {service.cache.hits / max(1, total) * 100:.0f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Local HTTP query service for the node catalog')
+    parser.add_argument('--database', default='ue_blueprint_nodes_merged.json',
+                        help='Node database (merged JSON or columnar encoding)')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to bind')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--cache-size', type=int, default=1024, help='Cached responses (0 disables)')
+    parser.add_argument('--reload-interval', type=float, default=1.0,
+                        help='Seconds between checks of the database file for changes')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Measure latency and throughput with concurrent clients, then exit')
+    parser.add_argument('--clients', type=int, default=8, help='Concurrent clients for --benchmark')
+    parser.add_argument('--requests', type=int, default=4000, help='Total requests for --benchmark')
+
+    args = parser.parse_args()
+
+    if not Path(args.database).exists():
+        logger.error(f"❌ {args.database} not found! Run merge_all_nodes.py first.")
+        return
+
+    start = time.perf_counter()
+    service = CatalogService(args.database, args.cache_size, args.reload_interval)
+    logger.info(f"📚 Loaded {len(service.catalog.nodes)} nodes from {args.database} "
+                f"in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    if args.benchmark:
+        run_benchmark(service, max(1, args.clients), args.requests)
+        return
+
+    service.start_watcher()
+    server = make_server(service, args.host, args.port)
+    logger.info(f"🌐 Serving on http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("\n👋 Stopped")
+    finally:
+        service.stopped.set()
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+Packed, compressed, content-addressed store for cached document.json pages.
+Replaces one pretty-printed JSON file per page with a few append-only segment
+files plus an index keyed by a hash of the canonical documentation path:
+
+    <cache_dir>/store/seg-00000.pack   zlib-compressed compact JSON payloads
+    <cache_dir>/store/index.jsonl      one line per put: key, path, location, meta
+
+The index is loaded into a dict on open (O(1) lookups; later lines win) and
+payloads are read through mmap. Hashing the canonical path also fixes the
+collisions of the old '/'/'-' -> '_' file naming.
+"""
+
+import hashlib
+import json
+import mmap
+import threading
+import zlib
+from pathlib import Path
+from typing import Callable, Dict, Iterator, NamedTuple, Optional, Tuple
+
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+COMPRESSION_LEVEL = 6
+DELTA_KEY = '__delta_of__'
+_MISSING = object()
+
+
+def canonical_path(path: str) -> str:
+    """Normalise a documentation path: no query string, no stray slashes."""
+    path = path.split('?', 1)[0].split('#', 1)[0].strip().strip('/')
+    while '//' in path:
+        path = path.replace('//', '/')
+    return path
+
+
+def path_key(path: str) -> str:
+    """Content address for a documentation path."""
+    return hashlib.sha1(canonical_path(path).encode('utf-8')).hexdigest()
+
+
+def legacy_cache_name(path: str) -> str:
+    """File stem the old per-file cache used for a path (for logs and fallbacks)."""
+    return path.replace('/', '_').replace('-', '_')
+
+
+class PageStore:
+    """Append-only packed page store with an in-memory hash index."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.index_file = self.root / 'index.jsonl'
+        self.index: Dict[str, Dict] = {}
+        self.lock = threading.Lock()
+        self.maps: Dict[int, Tuple[int, mmap.mmap]] = {}
+        self.segment_files = {}
+        self.segment = 0
+        if self.index_file.exists():
+            self.load_index()
+
+    def load_index(self):
+        with open(self.index_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                entry = json.loads(line)
+                self.index[entry['key']] = entry
+                self.segment = max(self.segment, entry['seg'])
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __contains__(self, path: str) -> bool:
+        return path_key(path) in self.index
+
+    def segment_path(self, seg: int) -> Path:
+        return self.root / f"seg-{seg:05d}.pack"
+
+    def _segment_for_write(self, size: int):
+        """Return (seg, file handle) with room for size more bytes."""
+        seg_path = self.segment_path(self.segment)
+        if seg_path.exists() and seg_path.stat().st_size + size > SEGMENT_MAX_BYTES \
+                and seg_path.stat().st_size > 0:
+            self.segment += 1
+        if self.segment not in self.segment_files:
+            self.segment_files[self.segment] = open(self.segment_path(self.segment), 'ab')
+        return self.segment, self.segment_files[self.segment]
+
+    def _read_bytes(self, seg: int, offset: int, length: int) -> bytes:
+        mapped = self.maps.get(seg)
+        if mapped is None or mapped[0] < offset + length:
+            # (Re)map: the segment may have grown since it was last mapped
+            if mapped is not None:
+                mapped[1].close()
+            with open(self.segment_path(seg), 'rb') as f:
+                size = f.seek(0, 2)
+                mapped = (size, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            self.maps[seg] = mapped
+        return mapped[1][offset:offset + length]
+
+    def put(self, path: str, data: Dict, meta: Optional[Dict] = None):
+        """Store a document (replacing any previous version of the path)."""
+        raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        blob = zlib.compress(raw, COMPRESSION_LEVEL)
+        key = path_key(path)
+
+        with self.lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            seg, handle = self._segment_for_write(len(blob))
+            offset = handle.seek(0, 2)
+            handle.write(blob)
+            handle.flush()
+            entry = {
+                'key': key,
+                'path': canonical_path(path),
+                'seg': seg,
+                'off': offset,
+                'len': len(blob),
+                'raw': len(raw),
+                'sha1': hashlib.sha1(raw).hexdigest(),
+                'meta': meta or {},
+            }
+            self._append_index(entry)
+
+    def _append_index(self, entry: Dict):
+        with open(self.index_file, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+        self.index[entry['key']] = entry
+
+    def get(self, path: str) -> Optional[Dict]:
+        """Return the stored document for a path, or None."""
+        entry = self.index.get(path_key(path))
+        return self.read_entry(entry) if entry else None
+
+    def read_entry(self, entry: Dict) -> Dict:
+        with self.lock:
+            blob = self._read_bytes(entry['seg'], entry['off'], entry['len'])
+        return json.loads(zlib.decompress(blob))
+
+    def get_meta(self, path: str) -> Dict:
+        entry = self.index.get(path_key(path))
+        return dict(entry['meta']) if entry else {}
+
+    def update_meta(self, path: str, meta: Dict):
+        """Replace a stored document's metadata without rewriting its payload."""
+        key = path_key(path)
+        with self.lock:
+            entry = self.index.get(key)
+            if entry is not None:
+                self._append_index({**entry, 'meta': meta})
+
+    def entries(self) -> Iterator[Dict]:
+        """Index entries in a stable order (by legacy cache name)."""
+        return iter(sorted(self.index.values(), key=lambda e: legacy_cache_name(e['path'])))
+
+    def items(self) -> Iterator[Tuple[str, Dict]]:
+        """Yield (path, document) for every stored page."""
+        for entry in self.entries():
+            yield entry['path'], self.read_entry(entry)
+
+    def close(self):
+        for handle in self.segment_files.values():
+            handle.close()
+        for _, mapped in self.maps.values():
+            mapped.close()
+        self.segment_files.clear()
+        self.maps.clear()
+
+
+def make_delta(base: Dict, data: Dict, base_sha1: str) -> Dict:
+    """Describe data relative to base: changed top-level keys plus per-block references.
+
+    Blocks identical to a base block are stored as that block's index.
+    """
+    base_blocks = {}
+    for i, block in enumerate(base.get('blocks', [])):
+        base_blocks.setdefault(_block_key(block), i)
+
+    delta = {
+        DELTA_KEY: base_sha1,
+        'set': {k: v for k, v in data.items() if k != 'blocks' and base.get(k, _MISSING) != v},
+        'del': [k for k in base if k not in data and k != 'blocks'],
+        'order': list(data),
+    }
+    if 'blocks' in data:
+        delta['blocks'] = [base_blocks.get(_block_key(block), block) for block in data['blocks']]
+    elif 'blocks' in base:
+        delta['del'].append('blocks')
+    return delta
+
+
+def apply_delta(base: Dict, delta: Dict) -> Dict:
+    """Rebuild a document from its base and a make_delta() record."""
+    base_blocks = base.get('blocks', [])
+    data = {k: v for k, v in base.items() if k not in delta['del'] and k != 'blocks'}
+    data.update(delta['set'])
+    if 'blocks' in delta:
+        data['blocks'] = [base_blocks[b] if isinstance(b, int) else b for b in delta['blocks']]
+    # Restore the original key order so the document re-serialises identically
+    return {k: data[k] for k in delta['order']}
+
+
+def _block_key(block: Dict) -> str:
+    return hashlib.sha1(json.dumps(block, sort_keys=True, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class VersionedPageStore:
+    """Page store for a non-base engine version, kept as deltas against the base store.
+
+    Most documentation pages are identical or nearly identical across engine
+    versions, so a page whose base-version copy is cached is stored as a small
+    delta (changed top-level fields, new blocks, indexes of unchanged blocks).
+    Pages without a base copy are stored in full. A delta whose base page has
+    since changed cannot be rebuilt and reads as a cache miss.
+    """
+
+    def __init__(self, root, base: PageStore):
+        self.deltas = PageStore(root)
+        self.base = base
+
+    def __len__(self) -> int:
+        return len(self.deltas)
+
+    def __contains__(self, path: str) -> bool:
+        return self.get(path) is not None
+
+    def put(self, path: str, data: Dict, meta: Optional[Dict] = None):
+        base_entry = self.base.index.get(path_key(path))
+        if base_entry is None:
+            self.deltas.put(path, data, meta)
+            return
+        self.deltas.put(path, make_delta(self.base.read_entry(base_entry), data, base_entry['sha1']), meta)
+
+    def get(self, path: str) -> Optional[Dict]:
+        stored = self.deltas.get(path)
+        if stored is None or DELTA_KEY not in stored:
+            return stored
+
+        base_entry = self.base.index.get(path_key(path))
+        if base_entry is None or base_entry['sha1'] != stored[DELTA_KEY]:
+            return None
+        return apply_delta(self.base.read_entry(base_entry), stored)
+
+    def get_meta(self, path: str) -> Dict:
+        return self.deltas.get_meta(path)
+
+    def update_meta(self, path: str, meta: Dict):
+        self.deltas.update_meta(path, meta)
+
+    def close(self):
+        self.deltas.close()
+
+
+def load_cached_document(cache_dir, path: str) -> Optional[Dict]:
+    """Load one cached page by documentation path (packed store, then legacy file)."""
+    cache_dir = Path(cache_dir)
+    store_root = cache_dir / 'store'
+    if (store_root / 'index.jsonl').exists():
+        store = PageStore(store_root)
+        try:
+            data = store.get(path)
+        finally:
+            store.close()
+        if data is not None:
+            return data
+
+    legacy_file = cache_dir / f"{legacy_cache_name(path)}.json"
+    if legacy_file.exists():
+        with open(legacy_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    return None
+
+
+def iter_cached_documents(cache_dir) -> Iterator[Tuple[str, Dict]]:
+    """Yield (name, document) for every cached page in a cache directory.
+
+    Reads the packed store first, then any legacy per-file JSON not yet
+    migrated. name is the legacy cache file stem, for logging.
+    """
+    cache_dir = Path(cache_dir)
+    seen = set()
+
+    store_root = cache_dir / 'store'
+    if (store_root / 'index.jsonl').exists():
+        store = PageStore(store_root)
+        try:
+            for path, data in store.items():
+                name = legacy_cache_name(path)
+                seen.add(name)
+                yield name, data
+        finally:
+            store.close()
+
+    for cache_file in sorted(cache_dir.glob('*.json')):
+        if cache_file.stem in seen:
+            continue
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            yield cache_file.stem, json.load(f)
+
+
+class CachedPayload(NamedTuple):
+    name: str
+    sha1: Optional[str]
+    compressed: bool
+    payload: Optional[bytes]
+    # Packed pages: (segment file, offset, length), so a skipped payload can still be read
+    location: Optional[Tuple[str, int, int]] = None
+
+
+def iter_cached_payloads(cache_dir, skip: Optional[Callable[[str], bool]] = None) -> Iterator[CachedPayload]:
+    """Yield every cached page undecoded, in iter_cached_documents() order.
+
+    For callers that decode in worker processes: compressed payloads are the
+    packed store's zlib blobs, the others legacy file contents; decode with
+    decode_payload(). sha1 is the store's hash of the page's compact JSON;
+    legacy files are yielded with sha1 None, as their bytes are not that JSON
+    (hash the decoded document instead). Packed pages for which skip(sha1) is
+    true are yielded without reading their payload (payload None); see
+    read_cached_payload().
+    """
+    cache_dir = Path(cache_dir)
+    seen = set()
+
+    store_root = cache_dir / 'store'
+    if (store_root / 'index.jsonl').exists():
+        store = PageStore(store_root)
+        try:
+            for entry in store.entries():
+                name = legacy_cache_name(entry['path'])
+                seen.add(name)
+                payload = None
+                if skip is None or not skip(entry['sha1']):
+                    payload = store._read_bytes(entry['seg'], entry['off'], entry['len'])
+                location = (str(store.segment_path(entry['seg'])), entry['off'], entry['len'])
+                yield CachedPayload(name, entry['sha1'], True, payload, location)
+        finally:
+            store.close()
+
+    for cache_file in sorted(cache_dir.glob('*.json')):
+        if cache_file.stem in seen:
+            continue
+        yield CachedPayload(cache_file.stem, None, False, cache_file.read_bytes())
+
+
+def read_cached_payload(cached: CachedPayload) -> bytes:
+    """An iter_cached_payloads() entry's payload, read from its segment if it was skipped."""
+    if cached.payload is not None:
+        return cached.payload
+    segment, offset, length = cached.location
+    with open(segment, 'rb') as f:
+        f.seek(offset)
+        return f.read(length)
+
+
+def decode_payload(compressed: bool, payload: bytes) -> Dict:
+    return json.loads(zlib.decompress(payload) if compressed else payload)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Producer/consumer pipeline separating network fetch from HTML parsing.
+Fetchers push raw document.json payloads onto a bounded queue and a process
+pool parses them, so throughput is set by the slower stage rather than the
+sum of both. Parse functions must be module-level (picklable).
+"""
+
+import asyncio
+import os
+import logging
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import Any, Callable, Iterable, Optional
+
+from crawl_frontier import ListFrontier
+
+logger = logging.getLogger(__name__)
+
+
+def default_parse_workers() -> int:
+    """Leave one core for the fetch/event-loop side."""
+    return max(1, (os.cpu_count() or 2) - 1)
+
+
+class AsyncParseStage:
+    """Parse stage for asyncio fetchers: bounded queue -> process pool -> callback."""
+
+    def __init__(self, parse_fn: Callable, on_parsed: Callable[[Any, Any], None],
+                 workers: Optional[int] = None, queue_size: int = 32):
+        self.parse_fn = parse_fn
+        self.on_parsed = on_parsed
+        self.workers = workers or default_parse_workers()
+        self.queue_size = queue_size
+        self.queue = None
+        self.pool = None
+        self.tasks = []
+
+    async def __aenter__(self):
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.tasks = [asyncio.create_task(self.consume()) for _ in range(self.workers)]
+        return self
+
+    async def __aexit__(self, *exc):
+        for _ in self.tasks:
+            await self.queue.put(None)
+        await asyncio.gather(*self.tasks)
+        self.pool.shutdown(wait=True)
+
+    async def put(self, item: Any, payload: Any):
+        """Queue a fetched payload; blocks the fetcher when the queue is full."""
+        await self.queue.put((item, payload))
+
+    async def consume(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            entry = await self.queue.get()
+            if entry is None:
+                return
+            item, payload = entry
+            try:
+                parsed = await loop.run_in_executor(self.pool, self.parse_fn, payload)
+            except Exception as e:
+                logger.error(f"  ✗ Parse error: {e}")
+                parsed = None
+            self.on_parsed(item, parsed)
+
+
+class CrawlPipeline:
+    """Thread-pool fetchers feeding a process-pool parser, for crawls that
+    discover new work from parsed pages.
+
+    fetch_fn(item) -> payload runs in threads; parse_fn(payload, item) -> parsed
+    runs in worker processes; handle(item, parsed) -> iterable of new items runs
+    in the driver. At most queue_size fetched payloads wait for parsing.
+    An item whose fetch, parse or handle raises is marked failed in the
+    frontier and the crawl goes on.
+
+    Work is taken from a frontier (push/pop/complete/fail): an in-memory
+    ListFrontier by default, or a persistent CrawlFrontier to make the crawl
+    resumable.
+    """
+
+    def __init__(self, fetch_fn: Callable, parse_fn: Callable,
+                 handle: Callable[[Any, Any], Iterable], fetch_workers: int = 4,
+                 parse_workers: Optional[int] = None, queue_size: int = 32):
+        self.fetch_fn = fetch_fn
+        self.parse_fn = parse_fn
+        self.handle = handle
+        self.fetch_workers = max(1, fetch_workers)
+        self.parse_workers = parse_workers or default_parse_workers()
+        self.queue_size = queue_size
+
+    def run(self, seeds: Iterable, frontier=None):
+        frontier = frontier if frontier is not None else ListFrontier()
+        frontier.push(seeds)
+        fetching = {}
+        parsing = {}
+
+        with ThreadPoolExecutor(max_workers=self.fetch_workers) as fetch_pool, \
+                ProcessPoolExecutor(max_workers=self.parse_workers) as parse_pool:
+            while True:
+                # Backpressure: only start fetches while the parse backlog has room
+                while len(fetching) < self.fetch_workers \
+                        and len(fetching) + len(parsing) < self.queue_size:
+                    item = frontier.pop()
+                    if item is None:
+                        break
+                    fetching[fetch_pool.submit(self.fetch_fn, item)] = item
+
+                if not fetching and not parsing:
+                    break
+
+                done, _ = wait(list(fetching) + list(parsing), return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in fetching:
+                        item = fetching.pop(future)
+                        try:
+                            payload = future.result()
+                        except Exception as e:
+                            logger.error(f"  ✗ Fetch error: {e}")
+                            frontier.fail(item, f'fetch error: {e}')
+                            continue
+                        if payload:
+                            parsing[parse_pool.submit(self.parse_fn, payload, item)] = item
+                        else:
+                            frontier.fail(item, 'fetch error')
+                    else:
+                        item = parsing.pop(future)
+                        try:
+                            parsed = future.result()
+                        except Exception as e:
+                            logger.error(f"  ✗ Parse error: {e}")
+                            frontier.fail(item, f'parse error: {e}')
+                            continue
+                        try:
+                            children = self.handle(item, parsed) or []
+                        except Exception as e:
+                            logger.error(f"  ✗ Handler error: {e}")
+                            frontier.fail(item, f'handler error: {e}')
+                            continue
+                        frontier.complete(item, children)
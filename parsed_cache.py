@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Cache of parsed category pages, so a page whose cached document.json has not
+changed is never JSON-decoded or HTML-parsed again.
+
+For each page it stores what the category-page scripts read: the title, slug
+and description, and per content block its block-dir-item attributes, h3/h4
+sections (the paragraphs and parameter tables that follow each header) and tag
+counts (see html_extract.extract_page_structure):
+
+    <cache_dir>/parsed/v<PARSER_VERSION>-<backend>-m<marshal version>/<payload sha1>.bin
+
+Entries are marshal-encoded and keyed by the SHA-1 of the page's compact JSON
+(the page store already records it, so a hit on a packed page reads no payload
+at all; legacy cache files are decoded and hashed the same way). Changing the
+parser, the HTML backend or the Python marshal format starts a new directory;
+bump PARSER_VERSION whenever parse_document() output changes.
+
+    python parsed_cache.py              # parse any pages not cached yet
+    python parsed_cache.py --prune      # also delete other parser versions' entries
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import marshal
+import os
+import shutil
+import time
+from pathlib import Path
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+from html_extract import extract_page_structure, get_backend
+from page_store import (CachedPayload, PageStore, decode_payload, iter_cached_payloads, legacy_cache_name,
+                        path_key, read_cached_payload)
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+PARSER_VERSION = 1
+
+PAGE_FIELDS = ('title', 'slug', 'description')
+
+
+def parse_document(data: Dict, backend: Optional[str] = None) -> Dict:
+    """Parsed page: PAGE_FIELDS that are present, plus one entry per block.
+
+    Blocks with content_html also carry the extract_page_structure() fields
+    and the HTML's length ('size'); the others only their 'type'.
+    """
+    page = {field: data[field] for field in PAGE_FIELDS if field in data}
+    page['blocks'] = []
+    for block in data.get('blocks', []):
+        parsed = {'type': block.get('type')}
+        if 'content_html' in block:
+            html = block['content_html'] or ''
+            parsed.update(extract_page_structure(html, backend), size=len(html))
+        page['blocks'].append(parsed)
+    return page
+
+
+def document_sha1(data: Dict) -> str:
+    """Payload hash of a decoded document (the hash PageStore records for it)."""
+    raw = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return hashlib.sha1(raw).hexdigest()
+
+
+class ParsedPageCache:
+    """Parsed pages on disk, one marshal file per source payload hash."""
+
+    def __init__(self, root, backend: Optional[str] = None):
+        self.backend = get_backend(backend)
+        self.root = Path(root)
+        self.dir = self.root / f"v{PARSER_VERSION}-{self.backend}-m{marshal.version}"
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, sha1: str) -> Path:
+        return self.dir / f"{sha1}.bin"
+
+    def __contains__(self, sha1: str) -> bool:
+        return self.path(sha1).exists()
+
+    def load(self, sha1: str) -> Optional[Dict]:
+        try:
+            # marshal.loads on the whole file: marshal.load() reads a file in small pieces
+            return marshal.loads(self.path(sha1).read_bytes())
+        except OSError:
+            return None
+        except (EOFError, ValueError, TypeError):
+            # Corrupt entry: drop it, so it is no longer reported as cached
+            self.path(sha1).unlink(missing_ok=True)
+            return None
+
+    def save(self, sha1: str, page: Dict):
+        self.dir.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent workers never read a partial entry
+        tmp = self.path(sha1).with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(marshal.dumps(page))
+        os.replace(tmp, self.path(sha1))
+
+    def get(self, sha1: str, load_document: Callable[[], Dict]) -> Dict:
+        """The parsed page for a payload hash; load_document() is only called on a miss."""
+        page = self.load(sha1)
+        if page is not None:
+            self.hits += 1
+            return page
+        self.misses += 1
+        page = parse_document(load_document(), self.backend)
+        self.save(sha1, page)
+        return page
+
+    def get_document(self, data: Dict) -> Dict:
+        """The parsed page for an already decoded document."""
+        return self.get(document_sha1(data), lambda: data)
+
+    def get_payload(self, cached: CachedPayload) -> Dict:
+        """The parsed page for an iter_cached_payloads() entry."""
+        if cached.sha1 is None:
+            return self.get_document(decode_payload(cached.compressed, cached.payload))
+        return self.get(cached.sha1, lambda: decode_payload(cached.compressed, read_cached_payload(cached)))
+
+    def prune(self) -> int:
+        """Delete the entries of other parser versions, backends and marshal formats."""
+        removed = 0
+        if self.root.exists():
+            for stale in self.root.iterdir():
+                if stale.is_dir() and stale != self.dir:
+                    removed += sum(1 for _ in stale.glob('*.bin'))
+                    shutil.rmtree(stale)
+        return removed
+
+
+def iter_parsed_pages(cache_dir, cache: Optional[ParsedPageCache] = None) -> Iterator[Tuple[str, Dict]]:
+    """Yield (name, parsed page) for every cached page, in iter_cached_documents() order."""
+    cache = cache or ParsedPageCache(Path(cache_dir) / 'parsed')
+    for cached in iter_cached_payloads(cache_dir, skip=cache.__contains__):
+        yield cached.name, cache.get_payload(cached)
+
+
+def load_parsed_page(cache_dir, path: str, cache: Optional[ParsedPageCache] = None) -> Optional[Dict]:
+    """The parsed page for one documentation path (packed store, then legacy file), or None."""
+    cache_dir = Path(cache_dir)
+    cache = cache or ParsedPageCache(cache_dir / 'parsed')
+
+    store_root = cache_dir / 'store'
+    if (store_root / 'index.jsonl').exists():
+        store = PageStore(store_root)
+        try:
+            entry = store.index.get(path_key(path))
+            if entry is not None:
+                return cache.get(entry['sha1'], lambda: store.read_entry(entry))
+        finally:
+            store.close()
+
+    legacy_file = cache_dir / f"{legacy_cache_name(path)}.json"
+    if legacy_file.exists():
+        return cache.get_document(json.loads(legacy_file.read_bytes()))
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Fill the parsed-page cache for the cached category pages')
+    parser.add_argument('--cache', default='cache', help='Page cache directory')
+    parser.add_argument('--prune', action='store_true', help="Delete other parser versions' entries")
+
+    args = parser.parse_args()
+
+    cache_dir = Path(args.cache)
+    if not cache_dir.exists():
+        logger.error("❌ Cache directory not found!")
+        return
+
+    cache = ParsedPageCache(cache_dir / 'parsed')
+    start = time.perf_counter()
+    pages = sum(1 for _ in iter_parsed_pages(cache_dir, cache))
+    elapsed = time.perf_counter() - start
+
+    logger.info(f"📂 {pages} pages in {elapsed:.2f}s: {cache.hits} from the parsed cache, {cache.misses} parsed")
+    logger.info(f"   {cache.dir}")
+    if args.prune:
+        logger.info(f"🧹 Removed {cache.prune()} stale parsed pages")
+
+
+if __name__ == '__main__':
+    main()
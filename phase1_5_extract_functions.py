@@ -6,14 +6,66 @@ Parses the HTML in cached category files to find all individual function nodes.
 
 import json
 from pathlib import Path
-from bs4 import BeautifulSoup
 import re
 import logging
+from typing import Optional
+
+from parsed_cache import iter_parsed_pages, parse_document as parse_page_document
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+def is_blueprint_category(data: dict) -> bool:
+    return 'BlueprintAPI' in data.get('slug', '')
+
+
+def function_from_item(item: dict, category_title: str) -> Optional[dict]:
+    """Function entry for a block-dir-item, or None for sub-categories and unnamed items."""
+    function_name = item.get('page-name', '')
+    description = item.get('description', function_name)
+    url = item.get('href', '')
+    item_type = item.get('type', 'topic')
+
+    if not function_name or not url:
+        return None
+
+    # Skip if it's another category (check if URL goes deeper than category level)
+    # If URL has BlueprintAPI/Category/Function pattern, it's a function
+    if url.count('/BlueprintAPI/') != 1 or url.count('/') < 6:
+        return None
+
+    return {
+        'displayName': function_name,
+        'category': category_title,
+        'description': description,
+        'url': url.split('?')[0],  # Remove query params
+        'type': item_type,
+        'hasDetailedInfo': False,
+        'canSpawn': False  # Will be updated in Phase 2 when we get parameters
+    }
+
+
+def build_output(functions: list, categories_processed: int) -> dict:
+    """The ue_blueprint_functions_phase1_5.json document: unique by URL, sorted by category and name."""
+    # Remove duplicates based on URL
+    unique_functions = {}
+    for func in functions:
+        unique_functions.setdefault(func['url'], func)
+
+    # Sort by category and name
+    functions = sorted(unique_functions.values(), key=lambda x: (x['category'], x['displayName']))
+
+    return {
+        'version': '1.5',
+        'source': 'Extracted from cached category pages',
+        'extractedAt': Path('cache').stat().st_mtime if Path('cache').exists() else 0,
+        'totalFunctions': len(functions),
+        'categoriesProcessed': categories_processed,
+        'nodes': functions
+    }
+
+
 class Phase15FunctionExtractor:
     """Extract individual blueprint functions from category cache files."""
 
@@ -33,59 +85,45 @@ class Phase15FunctionExtractor:
         try:
             with open(cache_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+        except Exception as e:
+            logger.error(f"Error parsing {cache_file.name}: {e}")
+            return
+        self.parse_document(data, cache_file.stem)
 
+    def parse_document(self, data: dict, name: str):
+        """Parse a cached category document and extract function entries."""
+        try:
+            page = parse_page_document(data)
+        except Exception as e:
+            logger.error(f"Error parsing {name}: {e}")
+            return
+        self.parse_page(page, name)
+
+    def parse_page(self, page: dict, name: str):
+        """Extract function entries from a parsed category page (see parsed_cache.py)."""
+        try:
             # Get category info
-            category_title = data.get('title', 'Unknown')
-            category_url = f"https://dev.epicgames.com/documentation/en-us/unreal-engine/{data.get('slug', '')}"
+            category_title = page.get('title', 'Unknown')
 
             # Skip if not a BlueprintAPI category
-            if 'BlueprintAPI' not in data.get('slug', ''):
+            if not is_blueprint_category(page):
                 return
 
-            # Parse HTML blocks
-            for block in data.get('blocks', []):
-                if block.get('type') != 'markdown':
+            for block in page['blocks']:
+                if block['type'] != 'markdown' or not block.get('size'):
                     continue
 
-                html = block.get('content_html', '')
-                if not html:
-                    continue
-
-                # Parse with BeautifulSoup
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Find all block-dir-item elements
-                items = soup.find_all('block-dir-item')
-
-                for item in items:
-                    function_name = item.get('page-name', '')
-                    description = item.get('description', function_name)
-                    url = item.get('href', '')
-                    item_type = item.get('type', 'topic')
-
-                    if not function_name or not url:
-                        continue
-
-                    # Skip if it's another category (check if URL goes deeper than category level)
-                    url_parts = url.split('/')
-                    # If URL has BlueprintAPI/Category/Function pattern, it's a function
-                    if url.count('/BlueprintAPI/') == 1 and url.count('/') >= 6:
-                        function_entry = {
-                            'displayName': function_name,
-                            'category': category_title,
-                            'description': description,
-                            'url': url.split('?')[0],  # Remove query params
-                            'type': item_type,
-                            'hasDetailedInfo': False,
-                            'canSpawn': False  # Will be updated in Phase 2 when we get parameters
-                        }
+                # All block-dir-item elements
+                for item in block['items']:
+                    function_entry = function_from_item(item, category_title)
+                    if function_entry:
                         self.all_functions.append(function_entry)
                         self.functions_found += 1
 
             self.categories_processed += 1
 
         except Exception as e:
-            logger.error(f"Error parsing {cache_file.name}: {e}")
+            logger.error(f"Error parsing {name}: {e}")
 
     def run(self):
         """Run the extraction process."""
@@ -96,40 +134,21 @@ class Phase15FunctionExtractor:
             logger.error("❌ Cache directory not found!")
             return
 
-        # Process all cache files
-        cache_files = list(self.cache_dir.glob('*.json'))
-        logger.info(f"📂 Found {len(cache_files)} cache files\n")
-
-        for cache_file in cache_files:
-            self.parse_cache_file(cache_file)
+        # Process all cached pages (packed store and any legacy files)
+        cached_pages = 0
+        for name, page in iter_parsed_pages(self.cache_dir):
+            self.parse_page(page, name)
+            cached_pages += 1
+        logger.info(f"📂 Read {cached_pages} cached pages\n")
 
         logger.info(f"\n📊 Extraction complete:")
         logger.info(f"   Categories processed: {self.categories_processed}")
         logger.info(f"   Functions found: {self.functions_found}")
 
-        # Remove duplicates based on URL
-        unique_functions = {}
-        for func in self.all_functions:
-            url = func['url']
-            if url not in unique_functions:
-                unique_functions[url] = func
-
-        self.all_functions = list(unique_functions.values())
+        output = build_output(self.all_functions, self.categories_processed)
+        self.all_functions = output['nodes']
         logger.info(f"   Unique functions: {len(self.all_functions)}")
 
-        # Sort by category and name
-        self.all_functions.sort(key=lambda x: (x['category'], x['displayName']))
-
-        # Save output
-        output = {
-            'version': '1.5',
-            'source': 'Extracted from cached category pages',
-            'extractedAt': Path('cache').stat().st_mtime if Path('cache').exists() else 0,
-            'totalFunctions': len(self.all_functions),
-            'categoriesProcessed': self.categories_processed,
-            'nodes': self.all_functions
-        }
-
         output_file = Path('ue_blueprint_functions_phase1_5.json')
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(output, f, indent=2, ensure_ascii=False)
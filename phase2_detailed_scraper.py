@@ -4,213 +4,268 @@ Phase 2: Gradual detailed scraping over multiple days.
 Fetches detailed parameter info for each node with resumable progress.
 """
 
-import cloudscraper
+import asyncio
 import json
-from bs4 import BeautifulSoup
 from pathlib import Path
 import time
 import logging
-from typing import Dict, Set
+from typing import Dict, Optional
 import argparse
 
+from crawl_state import COMPLETED, FAILED, CrawlState
+from fetch_engine import AsyncFetchEngine
+from parse_pipeline import AsyncParseStage, default_parse_workers
+from docs_client import DocsClient, FetchResult, extract_path_from_url
+from html_extract import extract_page_content
+from node_journal import NodeJournal, write_document
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+def parse_node_details(data: Dict) -> Dict:
+    """Parse detailed node info from API response.
+
+    Module-level so the parse stage can run it in worker processes.
+    """
+    details = {
+        'inputs': [],
+        'outputs': [],
+        'returnValue': None,
+        'detailedDescription': data.get('description', ''),
+        'examples': []
+    }
+
+    if 'blocks' not in data:
+        return details
+
+    for block in data['blocks']:
+        if block.get('type') == 'markdown' and 'content_html' in block:
+            content = extract_page_content(block['content_html'])
+
+            # Extract detailed description
+            paragraphs = content['paragraphs']
+            if paragraphs:
+                full_desc = ' '.join(paragraphs[:5])
+                details['detailedDescription'] = full_desc
+
+            # Extract parameter tables
+            for rows in content['tables']:
+                if len(rows) <= 1:
+                    continue
+
+                headers = [th.lower() for th in rows[0][0]]
+                is_output = any(kw in ' '.join(headers) for kw in ['output', 'return'])
+
+                for _, cols in rows[1:]:
+                    if len(cols) >= 2:
+                        param = {
+                            'name': cols[0],
+                            'type': cols[1],
+                            'description': cols[2] if len(cols) > 2 else ''
+                        }
+                        if is_output:
+                            details['outputs'].append(param)
+                        else:
+                            details['inputs'].append(param)
+
+            # Extract code examples
+            for example in content['code'][:3]:
+                if example and len(example) > 20:
+                    details['examples'].append(example)
+
+    return details
+
+
 class Phase2DetailedScraper:
     """Resumable scraper for detailed blueprint node information."""
 
-    def __init__(self, nodes_per_session=50, delay=2.0):
-        self.scraper = cloudscraper.create_scraper(
-            browser={'browser': 'chrome', 'platform': 'windows', 'desktop': True}
-        )
-        self.scraper.headers.update({
-            'Referer': 'https://dev.epicgames.com/',
-        })
-
-        self.base_api_url = 'https://dev.epicgames.com/community/api/documentation'
+    def __init__(self, nodes_per_session=50, delay=2.0, concurrency=4, refresh=False,
+                 parse_workers=None):
+        self.client = DocsClient(cache_dir='detailed_cache', refresh=refresh)
+        self.refresh = refresh
         self.delay = delay
+        self.concurrency = concurrency
+        self.parse_workers = parse_workers or default_parse_workers()
         self.nodes_per_session = nodes_per_session
-        self.detailed_cache_dir = Path('detailed_cache')
-        self.detailed_cache_dir.mkdir(exist_ok=True)
+        self.detailed_cache_dir = self.client.cache_dir
         self.progress_file = Path('phase2_progress.json')
-        self.completed_urls: Set[str] = set()
-        self.failed_urls: Set[str] = set()
+        self.state = CrawlState('phase2_state.db')
+        self.output_file = Path('ue_blueprint_nodes_phase2.json')
+        self.journal = NodeJournal('ue_blueprint_nodes_phase2.journal.jsonl')
 
     def load_progress(self):
-        """Load progress from previous runs."""
-        if self.progress_file.exists():
-            with open(self.progress_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.completed_urls = set(data.get('completed', []))
-                self.failed_urls = set(data.get('failed', []))
-            logger.info(f"📂 Loaded progress: {len(self.completed_urls)} completed, {len(self.failed_urls)} failed")
-
-    def save_progress(self):
-        """Save current progress."""
-        data = {
-            'completed': list(self.completed_urls),
-            'failed': list(self.failed_urls),
-            'lastUpdate': time.strftime('%Y-%m-%d %H:%M:%S')
-        }
-        with open(self.progress_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        """Load progress from previous runs (importing a legacy phase2_progress.json once)."""
+        if self.state.is_empty() and self.progress_file.exists():
+            imported = self.state.import_json_progress(self.progress_file)
+            logger.info(f"📥 Imported {imported} URLs from {self.progress_file}")
+
+        counts = self.state.counts()
+        logger.info(f"📂 Loaded progress: {counts[COMPLETED]} completed, {counts[FAILED]} failed")
 
     def extract_path_from_url(self, url: str) -> str:
         """Extract doc path from URL."""
-        import re
-        match = re.search(r'/documentation/([\w-]+/[\w-]+/[\w-]+/.+?)(?:\?|$)', url)
-        return match.group(1) if match else ''
+        return extract_path_from_url(url)
 
-    def get_cache_filename(self, url: str) -> Path:
-        """Get cache filename for a URL."""
-        path = self.extract_path_from_url(url)
-        safe_name = path.replace('/', '_').replace('-', '_')
-        return self.detailed_cache_dir / f"{safe_name}.json"
+    def load_cached_details(self, url: str) -> Optional[Dict]:
+        """Return the cached API response for a node, if we have one."""
+        return self.client.load_cached(self.extract_path_from_url(url))
 
-    def fetch_node_details(self, url: str) -> Dict:
-        """Fetch detailed info for a single node."""
+    def download_node_details(self, url: str) -> FetchResult:
+        """Download detailed info for a single node and cache it.
+
+        In refresh mode the cached copy is revalidated with a conditional request.
+        """
         path = self.extract_path_from_url(url)
         if not path:
-            return {}
-
-        cache_file = self.get_cache_filename(url)
-        if cache_file.exists():
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            return FetchResult({}, 'error')
+        return self.client.fetch_document(path, use_cache=self.refresh, paced=True)
 
-        api_url = f"{self.base_api_url}/document.json?path={path}&application_version=5.5"
-
-        try:
-            time.sleep(self.delay)
-            response = self.scraper.get(api_url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
-            # Cache it
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+    def fetch_node_details(self, url: str) -> Dict:
+        """Fetch detailed info for a single node (cache first)."""
+        if not self.extract_path_from_url(url):
+            return {}
 
-            return data
+        cached = self.load_cached_details(url)
+        if cached is not None:
+            return cached
 
-        except Exception as e:
-            if '500' in str(e):
-                logger.warning(f"  ⚠️  500 error (server issue)")
-            elif '403' in str(e):
-                logger.warning(f"  ⚠️  403 error (rate limit) - sleeping 60s")
-                time.sleep(60)
-            else:
-                logger.error(f"  ✗ Error: {e}")
-            return {}
+        return self.download_node_details(url).data
 
     def parse_node_details(self, data: Dict) -> Dict:
         """Parse detailed node info from API response."""
-        details = {
-            'inputs': [],
-            'outputs': [],
-            'returnValue': None,
-            'detailedDescription': data.get('description', ''),
-            'examples': []
-        }
-
-        if 'blocks' not in data:
-            return details
-
-        for block in data['blocks']:
-            if block.get('type') == 'markdown' and 'content_html' in block:
-                html = block['content_html']
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Extract detailed description
-                paragraphs = soup.find_all('p')
-                if paragraphs:
-                    full_desc = ' '.join([p.get_text(strip=True) for p in paragraphs[:5]])
-                    details['detailedDescription'] = full_desc
-
-                # Extract parameter tables
-                for table in soup.find_all('table'):
-                    rows = table.find_all('tr')
-                    if len(rows) <= 1:
-                        continue
-
-                    headers = [th.get_text(strip=True).lower() for th in rows[0].find_all('th')]
-                    is_output = any(kw in ' '.join(headers) for kw in ['output', 'return'])
-
-                    for row in rows[1:]:
-                        cols = [td.get_text(strip=True) for td in row.find_all('td')]
-                        if len(cols) >= 2:
-                            param = {
-                                'name': cols[0],
-                                'type': cols[1],
-                                'description': cols[2] if len(cols) > 2 else ''
-                            }
-                            if is_output:
-                                details['outputs'].append(param)
-                            else:
-                                details['inputs'].append(param)
-
-                # Extract code examples
-                code_blocks = soup.find_all(['pre', 'code'])
-                for code in code_blocks[:3]:
-                    example = code.get_text(strip=True)
-                    if example and len(example) > 20:
-                        details['examples'].append(example)
-
-        return details
+        return parse_node_details(data)
 
     def scrape_session(self, nodes_to_scrape: list):
         """Run a scraping session for a batch of nodes."""
         logger.info(f"🔄 Starting session: {len(nodes_to_scrape)} nodes")
-        logger.info(f"   Delay: {self.delay}s per request\n")
-
-        successful = 0
-        failed = 0
-        skipped = 0
-
-        for i, node in enumerate(nodes_to_scrape, 1):
-            url = node['url']
-
-            if url in self.completed_urls:
-                skipped += 1
-                continue
+        logger.info(f"   Initial delay: {self.delay}s per request (adaptive), {self.concurrency} in flight, {self.parse_workers} parse workers\n")
 
-            if url in self.failed_urls and len(self.failed_urls) < 100:
-                # Retry previously failed
-                logger.info(f"  [{i}/{len(nodes_to_scrape)}] Retrying: {node['displayName']}")
-
-            else:
-                logger.info(f"  [{i}/{len(nodes_to_scrape)}] {node['displayName']}")
+        started = time.monotonic()
+        stats = asyncio.run(self.scrape_session_async(nodes_to_scrape))
+        elapsed = time.monotonic() - started
 
-            data = self.fetch_node_details(url)
+        processed = stats['successful'] + stats['failed']
+        rate = processed / (elapsed / 60) if elapsed > 0 else 0.0
 
-            if data:
-                details = self.parse_node_details(data)
+        logger.info(f"\n📊 Session complete:")
+        logger.info(f"   Successful: {stats['successful']}")
+        logger.info(f"   Failed: {stats['failed']}")
+        logger.info(f"   Skipped: {stats['skipped']}")
+        if self.refresh:
+            logger.info(f"   Unchanged (304): {stats['unchanged']}")
+        logger.info(f"   Requests sent: {stats['requests']}")
+        logger.info(f"   Throughput: {rate:.1f} nodes/min ({elapsed:.1f}s)")
+        counts = self.state.counts()
+        logger.info(f"   Total progress: {counts[COMPLETED]}/{counts[COMPLETED] + counts[FAILED]}")
+
+    async def scrape_session_async(self, nodes_to_scrape: list) -> Dict:
+        """Fetch a batch concurrently and parse it in a process pool.
+
+        Fetchers (bounded by the in-flight limit and host budget) push raw
+        payloads onto a bounded queue; the parse stage consumes them, so
+        network waits and HTML parsing overlap.
+        """
+        stats = {'successful': 0, 'failed': 0, 'skipped': 0, 'unchanged': 0, 'requests': 0}
+        total = len(nodes_to_scrape)
+        retry_failed = self.state.counts()[FAILED] < 100
+
+        def record(i: int, node: Dict, label: str, details: Optional[Dict], error: str = 'parse error'):
+            url = node['url']
+            # Each status change is committed immediately (one small transaction)
+            if details is not None:
                 node.update(details)
                 node['hasDetailedInfo'] = True
-                self.completed_urls.add(url)
-                successful += 1
-                logger.info(f"      ✓ Success ({len(details['inputs'])} inputs, {len(details['outputs'])} outputs)")
+                self.journal.append({'url': url, **details})
+                self.state.mark_completed(url)
+                stats['successful'] += 1
+                logger.info(f"  [{i}/{total}] {label}{node['displayName']} ✓ ({len(details['inputs'])} inputs, {len(details['outputs'])} outputs)")
             else:
-                self.failed_urls.add(url)
-                failed += 1
+                self.state.mark_failed(url, error)
+                stats['failed'] += 1
+                logger.info(f"  [{i}/{total}] {label}{node['displayName']} ✗")
 
-            # Save progress every 10 nodes
-            if i % 10 == 0:
-                self.save_progress()
+        async with AsyncFetchEngine(self.download_node_details,
+                                    max_in_flight=self.concurrency,
+                                    per_host_rate=1.0 / self.delay if self.delay > 0 else 0) as engine, \
+                AsyncParseStage(parse_node_details, lambda item, details: record(*item, details),
+                                workers=self.parse_workers) as parser:
 
-        self.save_progress()
+            async def fetch_node(i: int, node: Dict):
+                url = node['url']
 
-        logger.info(f"\n📊 Session complete:")
-        logger.info(f"   Successful: {successful}")
-        logger.info(f"   Failed: {failed}")
-        logger.info(f"   Skipped: {skipped}")
-        logger.info(f"   Total progress: {len(self.completed_urls)}/{len(self.completed_urls) + len(self.failed_urls)}")
+                status = self.state.status(url)
+                if status == COMPLETED and not self.refresh:
+                    stats['skipped'] += 1
+                    return
+
+                # Retry previously failed
+                label = 'Retrying: ' if status == FAILED and retry_failed else ''
+
+                result = FetchResult({}, 'error')
+                if self.extract_path_from_url(url):
+                    cached = None if self.refresh else self.load_cached_details(url)
+                    if cached is not None:
+                        result = FetchResult(cached, 'cached')
+                    else:
+                        result = await engine.fetch(url)
+
+                if result.status == 'not_modified':
+                    # Unchanged since the last scrape (304) - nothing to re-parse
+                    stats['unchanged'] += 1
+                    logger.info(f"  [{i}/{total}] {node['displayName']} (unchanged)")
+                elif result.data:
+                    await parser.put((i, node, label), result.data)
+                else:
+                    record(i, node, label, None,
+                           error='invalid URL' if not self.extract_path_from_url(url) else 'fetch error')
+
+            await asyncio.gather(*(fetch_node(i, node) for i, node in enumerate(nodes_to_scrape, 1)))
+            stats['requests'] = engine.requests_sent
+
+        return stats
+
+    def seed_journal(self):
+        """Carry details from a pre-journal ue_blueprint_nodes_phase2.json into the journal once."""
+        if self.journal.path.exists() or not self.output_file.exists():
+            return
+
+        with open(self.output_file, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+
+        detail_keys = ('inputs', 'outputs', 'returnValue', 'detailedDescription', 'examples')
+        for node in previous.get('nodes', []):
+            if node.get('hasDetailedInfo'):
+                self.journal.append({'url': node['url'], **{k: node.get(k) for k in detail_keys}})
+        logger.info(f"📥 Seeded journal with {self.journal.appended} nodes from {self.output_file}")
+
+    def merged_nodes(self, all_nodes: list):
+        """Yield Phase 1 nodes with their latest journaled details applied.
+
+        Only url -> journal offset is held in memory; detail records are read
+        back one at a time. Superseded records (from refresh runs) are pruned
+        once they make up most of the journal.
+        """
+        offsets, total = self.journal.latest_offsets(lambda record: record['url'])
+        if total > 2 * len(offsets):
+            self.journal.prune(lambda record: record['url'])
+            offsets, _ = self.journal.latest_offsets(lambda record: record['url'])
+
+        for node in all_nodes:
+            offset = offsets.get(node['url'])
+            if offset is None:
+                yield node
+                continue
+            details = self.journal.read_at(offset)
+            del details['url']
+            yield {**node, **details, 'hasDetailedInfo': True}
 
     def run(self):
         """Run Phase 2 scraper."""
         logger.info("🚀 Phase 2: Detailed Blueprint Node Scraper")
         logger.info(f"   Nodes per session: {self.nodes_per_session}")
-        logger.info(f"   Delay: {self.delay}s\n")
+        logger.info(f"   Initial delay: {self.delay}s (adapts to server responses)")
+        logger.info(f"   Concurrency: {self.concurrency}\n")
 
         # Load Phase 1 data
         phase1_file = Path('ue_blueprint_nodes_phase1.json')
@@ -225,10 +280,17 @@ class Phase2DetailedScraper:
         logger.info(f"📚 Loaded {len(all_nodes)} nodes from Phase 1\n")
 
         self.load_progress()
-
-        # Get nodes that need scraping
-        pending_nodes = [n for n in all_nodes if n['url'] not in self.completed_urls]
-        logger.info(f"📋 Pending nodes: {len(pending_nodes)}")
+        self.seed_journal()
+        self.state.add_pending(n['url'] for n in all_nodes)
+        completed_urls = self.state.urls_with_status(COMPLETED)
+
+        # Get nodes that need scraping (or revalidating, in refresh mode)
+        if self.refresh:
+            pending_nodes = [n for n in all_nodes if n['url'] in completed_urls]
+            logger.info(f"🔁 Nodes to revalidate: {len(pending_nodes)}")
+        else:
+            pending_nodes = [n for n in all_nodes if n['url'] not in completed_urls]
+            logger.info(f"📋 Pending nodes: {len(pending_nodes)}")
 
         if not pending_nodes:
             logger.info("✅ All nodes already scraped!")
@@ -238,37 +300,44 @@ class Phase2DetailedScraper:
         batch = pending_nodes[:self.nodes_per_session]
         self.scrape_session(batch)
 
-        # Save updated data
+        # Save updated data (Phase 1 nodes merged with every journaled detail record)
+        counts = self.state.counts()
         output = {
             **phase1_data,
+            'nodes': self.merged_nodes(all_nodes),
             'phase': 'Phase 2 - With Detailed Info (In Progress)',
             'lastUpdated': time.strftime('%Y-%m-%d %H:%M:%S'),
             'progress': {
-                'completed': len(self.completed_urls),
-                'failed': len(self.failed_urls),
+                'completed': counts[COMPLETED],
+                'failed': counts[FAILED],
                 'pending': len(pending_nodes) - len(batch),
                 'total': len(all_nodes)
             }
         }
 
-        output_file = 'ue_blueprint_nodes_phase2.json'
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        write_document(self.output_file, output)
 
-        logger.info(f"\n💾 Saved to {output_file}")
+        logger.info(f"\n💾 Saved to {self.output_file}")
         logger.info(f"\n📈 Overall Progress:")
-        logger.info(f"   {len(self.completed_urls)}/{len(all_nodes)} nodes complete ({100*len(self.completed_urls)/len(all_nodes):.1f}%)")
+        logger.info(f"   {counts[COMPLETED]}/{len(all_nodes)} nodes complete ({100*counts[COMPLETED]/len(all_nodes):.1f}%)")
         logger.info(f"\n💡 Run this script again tomorrow to continue scraping!")
 
 
 def main():
     parser = argparse.ArgumentParser(description='Phase 2: Detailed blueprint node scraper')
     parser.add_argument('--nodes', type=int, default=50, help='Nodes to scrape per session')
-    parser.add_argument('--delay', type=float, default=2.0, help='Delay between requests (seconds)')
+    parser.add_argument('--delay', type=float, default=2.0, help='Initial delay between requests to the same host (seconds); adapts at runtime')
+    parser.add_argument('--concurrency', type=int, default=4, help='Maximum requests in flight')
+    parser.add_argument('--parse-workers', type=int, default=None,
+                        help='Parser processes (default: CPU count - 1)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Revalidate completed nodes with conditional requests (ETag / If-Modified-Since)')
 
     args = parser.parse_args()
 
-    scraper = Phase2DetailedScraper(nodes_per_session=args.nodes, delay=args.delay)
+    scraper = Phase2DetailedScraper(nodes_per_session=args.nodes, delay=args.delay,
+                                    concurrency=args.concurrency, refresh=args.refresh,
+                                    parse_workers=args.parse_workers)
     scraper.run()
 
 
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+"""
+Resolve node pins to fully qualified pin types (PinCategory, PinSubCategory,
+PinSubCategoryObject) when the database is built, so spawning a node only
+looks the types up.
+
+A pin's type comes from, in order:
+- its type text, when it names one (Phase 2 parameter tables: "Boolean",
+  "Vector", "Hit Result Structure", "Actor Object Reference", ...)
+- for the generic 'struct' and 'object' types of the spawn data: the target
+  class for 'self', else a struct or class named by whole words of the pin
+  name, then of the description ("OtherActor" hints Actor, "SpawnTransform"
+  does not hint Pawn)
+- a generic fallback (counted, so unresolved pins show up in the build log);
+  a struct pin with no hint becomes a wildcard counted as ambiguous, since no
+  struct path would make a valid pin
+
+"Array of ..." and "Set of ..." pins resolve their element type the same way
+and record the container; "Map of ..." pins (which also need a value type)
+are counted as ambiguous.
+
+Resolved types are stored on each pin as
+    "pinType": {"category": ..., "subCategory": ..., "subCategoryObject": ...}
+plus "containerType" ("Array", "Set" or "Map") for container pins, in the
+form index.html and t3d_serializer.py write into T3D.
+
+    python pin_types.py                  # report how the merged database's pins resolve
+"""
+
+import argparse
+import json
+import logging
+import re
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from node_search import split_words
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+STRUCT_PATHS = {
+    'vector': '/Script/CoreUObject.Vector',
+    'vector2d': '/Script/CoreUObject.Vector2D',
+    'vector4': '/Script/CoreUObject.Vector4',
+    'rotator': '/Script/CoreUObject.Rotator',
+    'quat': '/Script/CoreUObject.Quat',
+    'transform': '/Script/CoreUObject.Transform',
+    'linearcolor': '/Script/CoreUObject.LinearColor',
+    'color': '/Script/CoreUObject.Color',
+    'box': '/Script/CoreUObject.Box',
+    'datetime': '/Script/CoreUObject.DateTime',
+    'timespan': '/Script/CoreUObject.Timespan',
+    'guid': '/Script/CoreUObject.Guid',
+    'hitresult': '/Script/Engine.HitResult',
+}
+
+CLASS_PATHS = {
+    'object': '/Script/CoreUObject.Object',
+    'actor': '/Script/Engine.Actor',
+    'pawn': '/Script/Engine.Pawn',
+    'character': '/Script/Engine.Character',
+    'controller': '/Script/Engine.Controller',
+    'playercontroller': '/Script/Engine.PlayerController',
+    'actorcomponent': '/Script/Engine.ActorComponent',
+    'scenecomponent': '/Script/Engine.SceneComponent',
+    'primitivecomponent': '/Script/Engine.PrimitiveComponent',
+    'staticmeshcomponent': '/Script/Engine.StaticMeshComponent',
+    'skeletalmeshcomponent': '/Script/Engine.SkeletalMeshComponent',
+}
+
+# Type text -> (PinCategory, PinSubCategory)
+SCALAR_TYPES = {
+    'exec': ('exec', ''),
+    'bool': ('bool', ''),
+    'boolean': ('bool', ''),
+    'byte': ('byte', ''),
+    'int': ('int', ''),
+    'integer': ('int', ''),
+    'integer64': ('int64', ''),
+    'float': ('real', 'double'),
+    'double': ('real', 'double'),
+    'real': ('real', 'double'),
+    'name': ('name', ''),
+    'string': ('string', ''),
+    'text': ('text', ''),
+}
+
+# Words in a generic struct pin's name or description, most specific first
+STRUCT_HINTS = [
+    ('transform', 'transform'),
+    ('rotation', 'rotator'),
+    ('rotator', 'rotator'),
+    ('location', 'vector'),
+    ('scale', 'vector'),
+    ('velocity', 'vector'),
+    ('direction', 'vector'),
+    ('vector', 'vector'),
+    ('color', 'linearcolor'),
+]
+
+# "Float (single-precision)" is UE's float subcategory, not the default double
+SINGLE_PRECISION = re.compile(r'single[\s-]*precision', re.IGNORECASE)
+
+# "Array of Actor Object Reference" -> ('Array', 'Actor Object Reference')
+CONTAINER_PATTERN = re.compile(r'\s*(array|set|map)\s+of\s+(.*)', re.IGNORECASE | re.DOTALL)
+
+
+def struct_object(path: str) -> str:
+    return f"/Script/CoreUObject.ScriptStruct'\"{path}\"'"
+
+
+def class_object(path: str) -> str:
+    return f"/Script/CoreUObject.Class'\"{path}\"'"
+
+
+def pin_type(category: str, sub_category: str = '', sub_category_object: str = 'None') -> Dict[str, str]:
+    return {'category': category, 'subCategory': sub_category, 'subCategoryObject': sub_category_object}
+
+
+def compact(text: str) -> str:
+    return ''.join(text.lower().split())
+
+
+def split_container(text: str) -> Tuple[Optional[str], str]:
+    """(container type or None, element type text) of a type text."""
+    match = CONTAINER_PATTERN.fullmatch(text)
+    if match:
+        return match.group(1).capitalize(), match.group(2)
+    return None, text
+
+
+def parse_type_text(text: str) -> Optional[Dict[str, str]]:
+    """Pin type named by a type column ("Vector", "Actor Object Reference", ...), or None."""
+    container, element = split_container(text)
+    if container:
+        resolved = parse_type_text(element) if container != 'Map' else None
+        return {**resolved, 'containerType': container} if resolved else None
+
+    # "Float (double-precision)" -> "float"
+    words = re.sub(r'\(.*?\)', ' ', text.lower()).replace('-', ' ').split()
+    if not words:
+        return None
+    key = ''.join(words)
+    if key in SCALAR_TYPES:
+        if key in ('float', 'real') and SINGLE_PRECISION.search(text):
+            return pin_type('real', 'float')
+        return pin_type(*SCALAR_TYPES[key])
+
+    if words[-2:] == ['object', 'reference'] and compact(' '.join(words[:-2])) in CLASS_PATHS:
+        return pin_type('object', '', class_object(CLASS_PATHS[compact(' '.join(words[:-2]))]))
+    if words[-2:] == ['class', 'reference'] and compact(' '.join(words[:-2])) in CLASS_PATHS:
+        return pin_type('class', '', class_object(CLASS_PATHS[compact(' '.join(words[:-2]))]))
+
+    if words[-1] in ('structure', 'struct'):
+        key = ''.join(words[:-1])
+    if key in STRUCT_PATHS:
+        return pin_type('struct', '', struct_object(STRUCT_PATHS[key]))
+    return None
+
+
+def hint_words(text: str) -> List[str]:
+    """Whole words of a pin name or description, plurals also in the singular."""
+    words = split_words(text)
+    return words + [w[:-1] for w in words if len(w) > 3 and w.endswith('s')]
+
+
+def hinted_structs(text: str) -> List[str]:
+    """Structs whose hint words are words of text, most specific first."""
+    words = set(hint_words(text))
+    return [struct for word, struct in STRUCT_HINTS if word in words]
+
+
+def hinted_class(text: str) -> Optional[str]:
+    """The longest CLASS_PATHS key spelled by consecutive words of text ('object' aside)."""
+    words = split_words(text)
+    best = None
+    for start in range(len(words)):
+        for end in range(start + 1, len(words) + 1):
+            key = ''.join(words[start:end])
+            for candidate in (key, key[:-1] if key.endswith('s') else None):
+                if candidate in CLASS_PATHS and candidate != 'object' and len(candidate) > len(best or ''):
+                    best = candidate
+    return best
+
+
+def resolve_pin(pin: Dict, target_class: Optional[str] = None) -> Tuple[Dict[str, str], str]:
+    """(pin type, how it was found: 'typed', 'hint', 'ambiguous' or 'fallback')."""
+    type_text = pin.get('type') or ''
+    resolved = parse_type_text(type_text)
+    if resolved:
+        return resolved, 'typed'
+
+    container, element = split_container(type_text)
+    if container == 'Map':
+        # The key type alone would make a wrong pin; the value type is not modelled
+        return {**pin_type('wildcard'), 'containerType': container}, 'ambiguous'
+    if container:
+        resolved, outcome = resolve_pin({**pin, 'type': element}, target_class)
+        return {**resolved, 'containerType': container}, outcome
+
+    name = pin.get('name') or ''
+    description = pin.get('description') or ''
+    kind = type_text.lower()
+    if kind == 'object' or kind.endswith('object reference'):
+        if name == 'self' and target_class:
+            return pin_type('object', '', class_object(target_class)), 'hint'
+        for text in (name, description):
+            hint = hinted_class(text)
+            if hint:
+                return pin_type('object', '', class_object(CLASS_PATHS[hint])), 'hint'
+        return pin_type('object', '', class_object(CLASS_PATHS['object'])), 'fallback'
+
+    if kind == 'class' or kind.endswith('class reference'):
+        return pin_type('class', '', class_object(CLASS_PATHS['object'])), 'fallback'
+
+    if kind == 'struct' or kind.endswith('structure'):
+        # The pin name is the stronger signal; a description may mention several structs
+        hints = hinted_structs(name)
+        if hints:
+            return pin_type('struct', '', struct_object(STRUCT_PATHS[hints[0]])), 'hint'
+        hints = hinted_structs(description)
+        if hints:
+            outcome = 'hint' if len(set(hints)) == 1 else 'ambiguous'
+            return pin_type('struct', '', struct_object(STRUCT_PATHS[hints[0]])), outcome
+        return pin_type('wildcard'), 'ambiguous'
+
+    return pin_type('wildcard'), 'fallback'
+
+
+def resolve_node_pins(node: Dict) -> Counter:
+    """Store a resolved pinType on every pin of a node; returns the count of each outcome."""
+    outcomes = Counter()
+    for field in ('inputs', 'outputs'):
+        for pin in node.get(field) or []:
+            pin['pinType'], outcome = resolve_pin(pin, node.get('targetClass'))
+            outcomes[outcome] += 1
+            if outcome in ('ambiguous', 'fallback'):
+                logger.debug(f"   {outcome}: {node.get('displayName')}.{pin.get('name')} ({pin.get('type')})")
+    return outcomes
+
+
+def resolve_database(nodes) -> Counter:
+    """Resolve the pins of every node that has any."""
+    outcomes = Counter()
+    for node in nodes:
+        if node.get('inputs') or node.get('outputs'):
+            outcomes.update(resolve_node_pins(node))
+    return outcomes
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report how the pins of a node database resolve to pin types')
+    parser.add_argument('--database', default='ue_blueprint_nodes_merged.json', help='Node database')
+    parser.add_argument('--verbose', action='store_true', help='List ambiguous and fallback pins')
+
+    args = parser.parse_args()
+
+    if not Path(args.database).exists():
+        logger.error(f"❌ {args.database} not found! Run merge_all_nodes.py first.")
+        return
+    if args.verbose:
+        logger.setLevel(logging.DEBUG)
+
+    with open(args.database, 'r', encoding='utf-8') as f:
+        nodes = json.load(f)['nodes']
+
+    outcomes = resolve_database(nodes)
+    logger.info(f"📌 {sum(outcomes.values())} pins: " +
+                ', '.join(f"{count} {outcome}" for outcome, count in outcomes.most_common()))
+
+
+if __name__ == '__main__':
+    main()
@@ -5,80 +5,65 @@ This runs immediately on data we already have!
 """
 
 import json
-from bs4 import BeautifulSoup
 from pathlib import Path
 import time
 import logging
+from typing import Optional
+
+from parsed_cache import iter_parsed_pages, parse_document
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
 def extract_nodes_from_category(cache_file: Path) -> list:
-    """Extract all node entries from a cached category page."""
+    """Extract all node entries from a cached category page file."""
     with open(cache_file, 'r', encoding='utf-8') as f:
         data = json.load(f)
+    return extract_nodes_from_document(data)
+
+
+def extract_nodes_from_document(data: dict) -> list:
+    """Extract all node entries from a category page document."""
+    return extract_nodes_from_page(parse_document(data))
 
+
+def extract_nodes_from_page(page: dict) -> list:
+    """Extract all node entries from a parsed category page (see parsed_cache.py)."""
     nodes = []
-    category_name = data.get('title', 'Unknown')
-
-    if 'blocks' not in data:
-        return nodes
-
-    for block in data['blocks']:
-        if block.get('type') == 'markdown' and 'content_html' in block:
-            html = block['content_html']
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Find all blueprint node items
-            items = soup.find_all('block-dir-item')
-
-            for item in items:
-                node = {
-                    'displayName': item.get('page-name', ''),
-                    'category': category_name,
-                    'description': item.get('description', ''),
-                    'url': item.get('href', ''),
-                    'type': item.get('type', ''),
-                    'hasDetailedInfo': False  # Will be updated in Phase 2
-                }
-
-                if node['displayName']:
+    category_name = page.get('title', 'Unknown')
+
+    for block in page['blocks']:
+        if block['type'] == 'markdown' and 'items' in block:
+            # Blueprint node items
+            for item in block['items']:
+                node = node_from_item(item, category_name)
+                if node:
                     nodes.append(node)
 
     return nodes
 
 
-def main():
-    logger.info("🚀 Phase 1: Quick Blueprint Node Extraction")
-    logger.info("   Extracting from cached category pages...\n")
-
-    cache_dir = Path('cache')
-    cache_files = list(cache_dir.glob('*.json'))
-
-    all_nodes = []
-    categories_processed = 0
+def node_from_item(item: dict, category_name: str) -> Optional[dict]:
+    """Phase 1 node for a block-dir-item's attributes (None without a name)."""
+    node = {
+        'displayName': item.get('page-name', ''),
+        'category': category_name,
+        'description': item.get('description', ''),
+        'url': item.get('href', ''),
+        'type': item.get('type', ''),
+        'hasDetailedInfo': False  # Will be updated in Phase 2
+    }
+    return node if node['displayName'] else None
 
-    for cache_file in cache_files:
-        try:
-            nodes = extract_nodes_from_category(cache_file)
-            if nodes:
-                all_nodes.extend(nodes)
-                categories_processed += 1
-                logger.info(f"  ✓ {cache_file.stem}: {len(nodes)} nodes")
-        except Exception as e:
-            logger.error(f"  ✗ Error processing {cache_file.name}: {e}")
 
-    # Organize by category
+def build_output(all_nodes: list, categories_processed: int) -> dict:
+    """The ue_blueprint_nodes_phase1.json document, with per-category counts."""
     by_category = {}
     for node in all_nodes:
-        cat = node['category']
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(node)
+        by_category[node['category']] = by_category.get(node['category'], 0) + 1
 
-    # Save results
-    output = {
+    return {
         'version': '2.0',
         'source': 'Unreal Engine Official Documentation (Quick Extract)',
         'unrealVersion': '5.5',
@@ -89,22 +74,48 @@ def main():
         'categoriesProcessed': categories_processed,
         'note': 'This is basic info. Phase 2 will add detailed parameters/inputs/outputs.',
         'nodes': all_nodes,
-        'byCategory': {cat: len(nodes) for cat, nodes in by_category.items()}
+        'byCategory': by_category
     }
 
-    filename = 'ue_blueprint_nodes_phase1.json'
-    with open(filename, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
 
+def log_summary(output: dict, filename: str):
     logger.info(f"\n✅ Phase 1 Complete!")
-    logger.info(f"   Total nodes extracted: {len(all_nodes)}")
-    logger.info(f"   Categories: {len(by_category)}")
+    logger.info(f"   Total nodes extracted: {output['totalNodes']}")
+    logger.info(f"   Categories: {output['totalCategories']}")
     logger.info(f"   Saved to: {filename}")
     logger.info(f"\n📊 Top 10 categories by node count:")
 
-    sorted_cats = sorted(by_category.items(), key=lambda x: len(x[1]), reverse=True)
-    for cat, nodes in sorted_cats[:10]:
-        logger.info(f"      {cat}: {len(nodes)} nodes")
+    sorted_cats = sorted(output['byCategory'].items(), key=lambda x: x[1], reverse=True)
+    for cat, count in sorted_cats[:10]:
+        logger.info(f"      {cat}: {count} nodes")
+
+
+def main():
+    logger.info("🚀 Phase 1: Quick Blueprint Node Extraction")
+    logger.info("   Extracting from cached category pages...\n")
+
+    cache_dir = Path('cache')
+
+    all_nodes = []
+    categories_processed = 0
+
+    for name, page in iter_parsed_pages(cache_dir):
+        try:
+            nodes = extract_nodes_from_page(page)
+            if nodes:
+                all_nodes.extend(nodes)
+                categories_processed += 1
+                logger.info(f"  ✓ {name}: {len(nodes)} nodes")
+        except Exception as e:
+            logger.error(f"  ✗ Error processing {name}: {e}")
+
+    output = build_output(all_nodes, categories_processed)
+
+    filename = 'ue_blueprint_nodes_phase1.json'
+    with open(filename, 'w', encoding='utf-8') as f:
+        json.dump(output, f, indent=2, ensure_ascii=False)
+
+    log_summary(output, filename)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+Adaptive AIMD (additive-increase / multiplicative-decrease) request rate controller.
+Ramps the request rate up while responses are healthy and cuts it on 403/429/5xx,
+honouring Retry-After, so scrapers find the fastest sustainable rate on their own.
+"""
+
+import asyncio
+import threading
+import time
+import logging
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUSES = {403, 429}
+
+
+def is_throttle_status(status: int) -> bool:
+    """True for responses that mean we are going too fast (403/429/5xx)."""
+    return status in THROTTLE_STATUSES or 500 <= status < 600
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class AIMDRateController:
+    """Thread-safe request pacer whose rate adapts to server responses."""
+
+    def __init__(self, initial_rate=0.5, min_rate=0.02, max_rate=5.0,
+                 increase=0.05, decrease=0.5, max_backoff=300.0):
+        # requests per second, kept within [min_rate, max_rate]
+        self.rate = min(max_rate, max(min_rate, initial_rate))
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase          # added per healthy response
+        self.decrease = decrease          # multiplied on throttling
+        self.max_backoff = max_backoff
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+        self.successes = 0
+        self.throttles = 0
+
+    def reserve(self) -> float:
+        """Reserve the next request slot and return how long to wait for it."""
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_slot)
+            self.next_slot = start + 1.0 / self.rate
+            return start - now
+
+    def wait(self):
+        """Block until the next request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def wait_async(self):
+        """Asynchronously wait until the next request may be sent."""
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record_success(self):
+        """Additively increase the rate after a healthy response."""
+        with self.lock:
+            self.successes += 1
+            self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def record_throttle(self, status: int, retry_after: Optional[str] = None) -> float:
+        """Multiplicatively cut the rate and push back the next slot.
+
+        Returns the pause (seconds) imposed before the next request.
+        """
+        with self.lock:
+            self.throttles += 1
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            pause = parse_retry_after(retry_after)
+            if pause is None:
+                pause = 1.0 / self.rate
+            pause = min(pause, self.max_backoff)
+            self.next_slot = max(self.next_slot, time.monotonic() + pause)
+
+        logger.warning(f"  ⚠️  {status} response - slowing to {self.rate:.2f} req/s, pausing {pause:.0f}s")
+        return pause
+
+    def record_response(self, status: int, retry_after: Optional[str] = None) -> bool:
+        """Feed a response status into the controller. Returns True if throttled."""
+        if is_throttle_status(status):
+            self.record_throttle(status, retry_after)
+            return True
+        self.record_success()
+        return False
+
+
+_controllers: Dict[str, AIMDRateController] = {}
+_controllers_lock = threading.Lock()
+
+
+def get_controller(url: str, initial_rate: Optional[float] = None) -> AIMDRateController:
+    """Get the process-wide controller for a URL's host, creating it on first use."""
+    host = urlparse(url).netloc or url
+    with _controllers_lock:
+        if host not in _controllers:
+            _controllers[host] = (AIMDRateController(initial_rate=initial_rate)
+                                  if initial_rate is not None else AIMDRateController())
+        return _controllers[host]
+
+
+def get_with_backoff(session, url: str, timeout=30, max_attempts=3, paced=False, **kwargs):
+    """GET a URL paced by its host's controller, retrying throttled responses.
+
+    Pass paced=True when the caller already waited for a slot (e.g. the async
+    fetch engine); only retries will wait then.
+    Returns the final response; raises if it is still an HTTP error.
+    """
+    controller = get_controller(url)
+    for attempt in range(1, max_attempts + 1):
+        if attempt > 1 or not paced:
+            controller.wait()
+        response = session.get(url, timeout=timeout, **kwargs)
+        throttled = controller.record_response(response.status_code,
+                                               response.headers.get('Retry-After'))
+        if not throttled or attempt == max_attempts:
+            break
+    response.raise_for_status()
+    return response
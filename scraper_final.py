@@ -4,16 +4,18 @@ Final Unreal Engine Blueprint Nodes Scraper
 Scrapes all blueprint nodes from the official Unreal Engine documentation API.
 """
 
-import cloudscraper
 import json
 import time
-import re
 from bs4 import BeautifulSoup
 from typing import List, Dict, Set
 from urllib.parse import urljoin, urlparse, parse_qs
 import logging
 from pathlib import Path
 
+from docs_client import DocsClient, extract_path_from_url
+from html_extract import extract_dir_items
+from parsed_cache import ParsedPageCache
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -26,37 +28,26 @@ class BlueprintNodeScraper:
     """Scraper for Unreal Engine Blueprint API."""
 
     def __init__(self, version='5.5'):
-        self.scraper = cloudscraper.create_scraper(
-            browser={'browser': 'chrome', 'platform': 'windows', 'desktop': True}
-        )
+        self.client = DocsClient(version=version, cache_dir='cache')
         self.version = version
         self.base_doc_url = 'https://dev.epicgames.com/documentation'
-        self.base_api_url = 'https://dev.epicgames.com/community/api/documentation'
         self.delay = 0.5  # Delay between requests
         self.nodes_data = []
         self.categories_data = {}
         self.visited_urls: Set[str] = set()
+        self.parsed_pages = ParsedPageCache(self.client.cache_dir / 'parsed')
 
     def fetch_json_api(self, path: str) -> Dict:
-        """Fetch documentation JSON from the API."""
-        url = f"{self.base_api_url}/document.json?path={path}&application_version={self.version}"
-
-        logger.info(f"Fetching API: {url}")
-        try:
-            response = self.scraper.get(url, timeout=30)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Error fetching {url}: {e}")
-            return {}
+        """Fetch documentation JSON from the API (or the shared cache)."""
+        logger.info(f"Fetching API: {self.client.api_url(path)}")
+        return self.client.fetch_json(path)
 
     def extract_category_urls_from_html(self, html_content: str) -> List[Dict]:
         """Extract blueprint category URLs from HTML content."""
-        soup = BeautifulSoup(html_content, 'html.parser')
         categories = []
 
         # Find all block-dir-item elements (category links)
-        items = soup.find_all('block-dir-item')
+        items = extract_dir_items(html_content)
 
         for item in items:
             href = item.get('href', '')
@@ -77,10 +68,7 @@ class BlueprintNodeScraper:
     def extract_path_from_url(self, url: str) -> str:
         """Extract the documentation path from a URL."""
         # URL format: https://dev.epicgames.com/documentation/en-us/unreal-engine/BlueprintAPI/AI
-        match = re.search(r'/documentation/([\w-]+/[\w-]+/[\w-]+/.+?)(?:\?|$)', url)
-        if match:
-            return match.group(1)
-        return ''
+        return extract_path_from_url(url)
 
     def parse_blueprint_function(self, elem: BeautifulSoup) -> Dict:
         """Parse a blueprint function/node from HTML element."""
@@ -143,29 +131,22 @@ class BlueprintNodeScraper:
 
         nodes = []
         category_name = category['name']
+        page = self.parsed_pages.get_document(data)
 
         # Process each block
-        for block in data['blocks']:
-            if block.get('type') == 'markdown' and 'content_html' in block:
-                html = block['content_html']
-                soup = BeautifulSoup(html, 'html.parser')
-
+        for block in page['blocks']:
+            if block['type'] == 'markdown' and 'sections' in block:
                 # Look for function/node listings
                 # They might be in various formats, try multiple approaches
 
                 # Approach 1: Look for h3/h4 headers with descriptions
-                headers = soup.find_all(['h3', 'h4'])
-                for header in headers:
-                    # Get the section around this header
-                    section_content = []
-                    for sibling in header.find_next_siblings():
-                        if sibling.name in ['h3', 'h4']:
-                            break
-                        section_content.append(sibling)
+                for section in block['sections']:
+                    # The elements between this header and the next
+                    section_content = section['siblings']
 
                     if section_content:
                         node = {
-                            'displayName': header.get_text(strip=True),
+                            'displayName': section['title'],
                             'category': category_name,
                             'description': None,
                             'inputs': [],
@@ -173,25 +154,22 @@ class BlueprintNodeScraper:
                         }
 
                         # Get description from first paragraph
-                        for elem in section_content:
-                            if elem.name == 'p':
-                                node['description'] = elem.get_text(strip=True)
+                        for tag, content in section_content:
+                            if tag == 'p':
+                                node['description'] = content
                                 break
 
                         # Look for parameter tables
-                        for elem in section_content:
-                            if elem.name == 'table':
-                                rows = elem.find_all('tr')
-                                if len(rows) > 1:
-                                    for row in rows[1:]:
-                                        cols = [td.get_text(strip=True) for td in row.find_all('td')]
-                                        if len(cols) >= 2:
-                                            param = {
-                                                'name': cols[0],
-                                                'type': cols[1],
-                                                'description': cols[2] if len(cols) > 2 else ''
-                                            }
-                                            node['inputs'].append(param)
+                        for tag, rows in section_content:
+                            if tag == 'table' and len(rows) > 1:
+                                for cols in rows[1:]:
+                                    if len(cols) >= 2:
+                                        param = {
+                                            'name': cols[0],
+                                            'type': cols[1],
+                                            'description': cols[2] if len(cols) > 2 else ''
+                                        }
+                                        node['inputs'].append(param)
 
                         if node['displayName']:
                             nodes.append(node)
@@ -4,15 +4,17 @@ Recursive Blueprint Node Scraper
 Handles the hierarchical structure of the Unreal Engine Blueprint API.
 """
 
-import cloudscraper
-import json
+import threading
 import time
-import re
-from bs4 import BeautifulSoup
-from typing import List, Dict, Set
-from pathlib import Path
+from functools import partial
+from typing import List, Dict, Optional, Tuple
 import logging
-import random
+
+from crawl_frontier import DONE, FAILED, QUEUED, CrawlFrontier
+from docs_client import DocsClient, extract_path_from_url
+from html_extract import extract_dir_items, extract_page_content
+from node_journal import NodeJournal, compact
+from parse_pipeline import CrawlPipeline
 
 logging.basicConfig(
     level=logging.INFO,
@@ -20,219 +22,266 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+ROOT_PATH = 'en-us/unreal-engine/BlueprintAPI'
+
+
+def parse_node_page(data: Dict, category_path: str) -> Dict:
+    """Parse an individual blueprint node page."""
+    node = {
+        'displayName': data.get('title', ''),
+        'category': category_path,
+        'description': data.get('description', ''),
+        'inputs': [],
+        'outputs': [],
+        'metadata': {}
+    }
+
+    if 'blocks' not in data:
+        return None
+
+    for block in data['blocks']:
+        if block.get('type') == 'markdown' and 'content_html' in block:
+            content = extract_page_content(block['content_html'])
+
+            # Extract more detailed description
+            paragraphs = content['paragraphs']
+            if paragraphs:
+                full_desc = ' '.join(paragraphs[:3])
+                if full_desc and len(full_desc) > len(node['description']):
+                    node['description'] = full_desc
+
+            # Extract parameters from tables
+            for rows in content['tables']:
+                if len(rows) <= 1:
+                    continue
+
+                headers = [th.lower() for th in rows[0][0]]
+                is_output_table = any(keyword in ' '.join(headers) for keyword in ['output', 'return', 'result'])
+
+                for _, cols in rows[1:]:
+                    if len(cols) >= 2:
+                        param = {
+                            'name': cols[0],
+                            'type': cols[1],
+                            'description': cols[2] if len(cols) > 2 else ''
+                        }
+
+                        if is_output_table:
+                            node['outputs'].append(param)
+                        else:
+                            node['inputs'].append(param)
+
+    return node if node['displayName'] else None
+
+
+def default_link_filter(root_path: str) -> str:
+    """Links followed from a crawl root: those under its last path segment ('BlueprintAPI/')."""
+    return root_path.rstrip('/').rsplit('/', 1)[-1] + '/'
+
+
+def extract_subcategories(data: Dict, link_filter: str = 'BlueprintAPI/') -> List[Dict]:
+    """Return the sub-pages linked from an index page whose href contains link_filter
+    (empty for a leaf page)."""
+    subcategories = []
+
+    for block in data['blocks']:
+        if block.get('type') == 'markdown' and 'content_html' in block:
+            for item in extract_dir_items(block['content_html']):
+                href = item.get('href', '')
+                page_name = item.get('page-name', '')
+                if href and link_filter in href:
+                    sub_path = extract_path_from_url(href)
+                    if sub_path:
+                        subcategories.append({
+                            'name': page_name,
+                            'path': sub_path
+                        })
+
+    return subcategories
+
+
+def parse_page(data: Dict, item: Tuple, link_filter: str = 'BlueprintAPI/') -> Dict:
+    """Parse a fetched page into sub-pages (index page) or a node (leaf page).
+
+    Module-level so the crawl pipeline can run it in worker processes.
+    """
+    _, _, category_path = item
+    if 'blocks' not in data:
+        return {'title': data.get('title', ''), 'subcategories': [], 'node': None}
+
+    subcategories = extract_subcategories(data, link_filter)
+    return {
+        'title': data.get('title', ''),
+        'subcategories': subcategories,
+        'node': None if subcategories else parse_node_page(data, category_path),
+    }
+
 
 class RecursiveBlueprintScraper:
     """Recursive scraper for blueprint nodes."""
 
-    def __init__(self, version='5.5'):
-        self.scraper = cloudscraper.create_scraper(
-            browser={'browser': 'chrome', 'platform': 'windows', 'desktop': True}
-        )
-        self.scraper.headers.update({
-            'Referer': 'https://dev.epicgames.com/',
-            'Origin': 'https://dev.epicgames.com',
-        })
-
+    def __init__(self, version='5.5', refresh=False, fetch_workers=4, parse_workers=None,
+                 max_depth: Optional[int] = 5, restart=False, root_path: str = ROOT_PATH,
+                 link_filter: Optional[str] = None):
+        self.client = DocsClient(version=version, cache_dir='cache', refresh=refresh)
         self.version = version
-        self.base_api_url = 'https://dev.epicgames.com/community/api/documentation'
-        self.delay_min = 0.3
-        self.delay_max = 0.7
-        self.nodes_data = []
-        self.visited_paths: Set[str] = set()
-        self.cache_dir = Path('cache')
-        self.cache_dir.mkdir(exist_ok=True)
+        self.journal = NodeJournal(f'ue_blueprint_nodes_v{version}.journal.jsonl')
+        self.frontier = CrawlFrontier(f'crawl_frontier_v{version}.db', max_depth=max_depth)
+        self.restart = restart
+        self.root_path = root_path
+        self.link_filter = link_filter or default_link_filter(root_path)
+        self.cache_dir = self.client.cache_dir
+        self.fetch_workers = fetch_workers
+        self.parse_workers = parse_workers
         self.request_count = 0
-
-    def random_delay(self):
-        time.sleep(random.uniform(self.delay_min, self.delay_max))
-
-    def get_cache_path(self, path: str) -> Path:
-        safe_name = path.replace('/', '_').replace('-', '_')
-        return self.cache_dir / f"{safe_name}.json"
+        self.request_lock = threading.Lock()
+        self.pages_parsed = 0
 
     def fetch_json_api(self, path: str) -> Dict:
         """Fetch from API or cache."""
-        cache_path = self.get_cache_path(path)
-
-        if cache_path.exists():
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-
-        url = f"{self.base_api_url}/document.json?path={path}&application_version={self.version}"
-        self.request_count += 1
-
-        if self.request_count % 20 == 0:
-            logger.info(f"  [Processed {self.request_count} pages, found {len(self.nodes_data)} nodes so far]")
-            self.save_progress()
-            time.sleep(3)
-
-        try:
-            self.random_delay()
-            response = self.scraper.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            return data
+        if self.client.refresh or not self.client.is_cached(path):
+            # Called from the pipeline's fetcher threads
+            with self.request_lock:
+                self.request_count += 1
 
-        except Exception as e:
-            if '403' in str(e):
-                logger.warning(f"  403 error - waiting 30s...")
-                time.sleep(30)
-            else:
-                logger.error(f"  Error: {e}")
-            return {}
+        return self.client.fetch_json(path)
 
     def extract_path_from_url(self, url: str) -> str:
         """Extract documentation path from URL."""
-        match = re.search(r'/documentation/([\w-]+/[\w-]+/[\w-]+/.+?)(?:\?|$)', url)
-        return match.group(1) if match else ''
+        return extract_path_from_url(url)
 
     def parse_node_page(self, data: Dict, category_path: str) -> Dict:
         """Parse an individual blueprint node page."""
-        node = {
-            'displayName': data.get('title', ''),
-            'category': category_path,
-            'description': data.get('description', ''),
-            'inputs': [],
-            'outputs': [],
-            'metadata': {}
-        }
+        return parse_node_page(data, category_path)
 
-        if 'blocks' not in data:
-            return None
-
-        for block in data['blocks']:
-            if block.get('type') == 'markdown' and 'content_html' in block:
-                html = block['content_html']
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Extract more detailed description
-                paragraphs = soup.find_all('p')
-                if paragraphs:
-                    full_desc = ' '.join([p.get_text(strip=True) for p in paragraphs[:3]])
-                    if full_desc and len(full_desc) > len(node['description']):
-                        node['description'] = full_desc
-
-                # Extract parameters from tables
-                for table in soup.find_all('table'):
-                    rows = table.find_all('tr')
-                    if len(rows) <= 1:
-                        continue
-
-                    headers = [th.get_text(strip=True).lower() for th in rows[0].find_all('th')]
-                    is_output_table = any(keyword in ' '.join(headers) for keyword in ['output', 'return', 'result'])
-
-                    for row in rows[1:]:
-                        cols = [td.get_text(strip=True) for td in row.find_all('td')]
-                        if len(cols) >= 2:
-                            param = {
-                                'name': cols[0],
-                                'type': cols[1],
-                                'description': cols[2] if len(cols) > 2 else ''
-                            }
-
-                            if is_output_table:
-                                node['outputs'].append(param)
-                            else:
-                                node['inputs'].append(param)
-
-        return node if node['displayName'] else None
+    def fetch_page(self, item: Tuple) -> Dict:
+        """Fetch stage of the crawl pipeline (runs in fetcher threads)."""
+        return self.fetch_json_api(item[0])
 
-    def scrape_page_recursive(self, path: str, depth: int = 0, category_path: str = "") -> None:
-        """Recursively scrape a page and its sub-pages."""
-        if path in self.visited_paths or depth > 5:  # Max depth safety
-            return
-
-        self.visited_paths.add(path)
-        data = self.fetch_json_api(path)
-
-        if not data or 'blocks' not in data:
-            return
-
-        # Check if this page has sub-categories
-        has_subcategories = False
-        subcategories = []
-
-        for block in data['blocks']:
-            if block.get('type') == 'markdown' and 'content_html' in block:
-                html = block['content_html']
-                soup = BeautifulSoup(html, 'html.parser')
-                items = soup.find_all('block-dir-item')
-
-                if items:
-                    has_subcategories = True
-                    for item in items:
-                        href = item.get('href', '')
-                        page_name = item.get('page-name', '')
-                        if href and 'BlueprintAPI/' in href:
-                            sub_path = self.extract_path_from_url(href)
-                            if sub_path:
-                                subcategories.append({
-                                    'name': page_name,
-                                    'path': sub_path
-                                })
-
-        if has_subcategories:
-            # This is an index page - recursively scrape subcategories
-            current_category = category_path or data.get('title', '')
-            indent = "  " * depth
-            logger.info(f"{indent}📁 {current_category} ({len(subcategories)} items)")
-
-            for subcat in subcategories:
+    def handle_parsed_page(self, item: Tuple, parsed: Dict) -> List[Tuple]:
+        """Record a parsed page and return the sub-pages to crawl next."""
+        path, depth, category_path = item
+        self.pages_parsed += 1
+
+        if self.pages_parsed % 20 == 0:
+            queued = self.frontier.counts()[QUEUED]
+            logger.info(f"  [Processed {self.pages_parsed} pages, found {self.journal.appended} nodes so far, "
+                        f"{queued} queued]")
+
+        indent = "  " * depth
+
+        if parsed['subcategories']:
+            # This is an index page - queue its subcategories
+            current_category = category_path or parsed['title']
+            logger.info(f"{indent}📁 {current_category} ({len(parsed['subcategories'])} items)")
+
+            # The frontier drops paths it has already seen (and any beyond max_depth)
+            children = []
+            for subcat in parsed['subcategories']:
                 new_category_path = f"{current_category}/{subcat['name']}" if current_category else subcat['name']
-                self.scrape_page_recursive(subcat['path'], depth + 1, new_category_path)
+                children.append((subcat['path'], depth + 1, new_category_path))
+            return children
+
+        # This is a leaf node - journal the node data
+        node = parsed['node']
+        if node and self.frontier.is_journaled(path):
+            # Journaled before the crash, but the page was not yet marked done
+            return []
+        if node:
+            self.journal.append(node)
+            self.frontier.mark_journaled(path)
+            logger.info(f"{indent}✓ {node['displayName']}")
+        return []
 
-        else:
-            # This is a leaf node - extract node data
-            node = self.parse_node_page(data, category_path)
-            if node:
-                self.nodes_data.append(node)
-                indent = "  " * depth
-                logger.info(f"{indent}✓ {node['displayName']}")
+    def scrape_page_recursive(self, path: str, depth: int = 0, category_path: str = "") -> None:
+        """Scrape a page and its sub-pages.
+
+        The crawl is driven by the persistent frontier rather than recursion:
+        fetching (threads) and parsing (processes) run as separate pipeline
+        stages, and every parsed page is checkpointed together with the
+        sub-pages it discovered.
+        """
+        pipeline = CrawlPipeline(self.fetch_page, partial(parse_page, link_filter=self.link_filter),
+                                 self.handle_parsed_page,
+                                 fetch_workers=self.fetch_workers,
+                                 parse_workers=self.parse_workers)
+        pipeline.run([(path, depth, category_path)], frontier=self.frontier)
 
     def scrape_all(self):
-        """Start scraping from the main Blueprint API page."""
+        """Start scraping from the root page (or resume an interrupted crawl)."""
         logger.info("🚀 Starting Recursive Blueprint API Scraper")
-        logger.info(f"   Version: {self.version}\n")
+        logger.info(f"   Version: {self.version}")
+        logger.info(f"   Root: {self.root_path} (following links containing '{self.link_filter}')\n")
+
+        remaining = self.frontier.resume()
+        if remaining and not self.restart:
+            counts = self.frontier.counts()
+            logger.info(f"📂 Resuming crawl: {counts[DONE]} pages done, {remaining} queued\n")
+            self.journal.reopen()
+        else:
+            self.frontier.reset()
+            self.journal.reset()
 
-        # Start from main page
-        main_path = 'en-us/unreal-engine/BlueprintAPI'
-        self.scrape_page_recursive(main_path, depth=0, category_path="")
+        self.scrape_page_recursive(self.root_path, depth=0, category_path="")
 
         self.save_results()
+        counts = self.frontier.counts()
+        kinds = self.frontier.kinds()
         logger.info(f"\n✅ Scraping Complete!")
         logger.info(f"   Pages processed: {self.request_count}")
-        logger.info(f"   Total nodes: {len(self.nodes_data)}")
-
-    def save_progress(self):
-        """Save current progress."""
-        self.save_results(suffix='_progress')
+        logger.info(f"   Pages crawled: {counts[DONE]} ({kinds.get('index', 0)} index, {kinds.get('leaf', 0)} leaf)")
+        if counts[FAILED]:
+            logger.info(f"   Failed pages: {counts[FAILED]}")
+        logger.info(f"   Total nodes: {self.journal.appended}")
 
     def save_results(self, suffix=''):
-        """Save results to JSON."""
-        output = {
+        """Compact the node journal into the JSON results file.
+
+        Nodes are journaled as they are parsed, so an interrupted crawl can
+        still be materialised (suffix='_interrupted').
+        """
+        header = {
             'version': '2.0',
             'source': 'Unreal Engine Official Documentation API',
             'unrealVersion': self.version,
             'scrapedAt': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'totalNodes': len(self.nodes_data),
+            'totalNodes': self.journal.appended,
             'pagesProcessed': self.request_count,
-            'nodes': self.nodes_data
         }
 
         filename = f'ue_blueprint_nodes_v{self.version}{suffix}.json'
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        written = compact(self.journal, filename, header)
 
         if not suffix:
-            logger.info(f"\n💾 Saved {len(self.nodes_data)} nodes to {filename}")
+            logger.info(f"\n💾 Saved {written} nodes to {filename}")
 
 
 def main():
-    scraper = RecursiveBlueprintScraper(version='5.5')
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Recursively scrape the Unreal Engine Blueprint API')
+    parser.add_argument('--version', default='5.5', help='Unreal Engine version (default: 5.5)')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Revalidate cached pages with conditional requests instead of trusting them')
+    parser.add_argument('--fetch-workers', type=int, default=4, help='Concurrent page fetchers')
+    parser.add_argument('--parse-workers', type=int, default=None,
+                        help='Parser processes (default: CPU count - 1)')
+    parser.add_argument('--max-depth', type=int, default=5,
+                        help='Do not follow links deeper than this (default: 5)')
+    parser.add_argument('--restart', action='store_true',
+                        help='Discard an interrupted crawl instead of resuming it')
+    parser.add_argument('--root', default=ROOT_PATH,
+                        help=f'Documentation path to start from (default: {ROOT_PATH})')
+    parser.add_argument('--link-filter', default=None,
+                        help="Only follow links containing this (default: the root's last path segment + '/')")
+
+    args = parser.parse_args()
+
+    scraper = RecursiveBlueprintScraper(version=args.version, refresh=args.refresh,
+                                        fetch_workers=args.fetch_workers,
+                                        parse_workers=args.parse_workers,
+                                        max_depth=args.max_depth, restart=args.restart,
+                                        root_path=args.root, link_filter=args.link_filter)
     try:
         scraper.scrape_all()
     except KeyboardInterrupt:
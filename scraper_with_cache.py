@@ -4,15 +4,17 @@ Blueprint Node Scraper with caching and better 403 handling.
 Uses cached data when available and adds delays to avoid rate limiting.
 """
 
-import cloudscraper
+import hashlib
 import json
 import time
-import re
-from bs4 import BeautifulSoup
-from typing import List, Dict, Set
-from pathlib import Path
+from typing import List, Dict, Optional, Set, Tuple
 import logging
-import random
+
+from docs_client import DocsClient, extract_path_from_url, store_dir
+from html_extract import extract_dir_items
+from node_journal import NodeJournal, compact
+from page_store import PageStore
+from parsed_cache import ParsedPageCache
 
 logging.basicConfig(
     level=logging.INFO,
@@ -22,100 +24,49 @@ logger = logging.getLogger(__name__)
 
 
 class BlueprintNodeScraperCached:
-    """Scraper with caching and rate limit handling."""
-
-    def __init__(self, version='5.5'):
-        self.scraper = cloudscraper.create_scraper(
-            browser={'browser': 'chrome', 'platform': 'windows', 'desktop': True}
-        )
-        # Add more headers to avoid detection
-        self.scraper.headers.update({
-            'Referer': 'https://dev.epicgames.com/',
-            'Origin': 'https://dev.epicgames.com',
-            'DNT': '1',
-            'Sec-Ch-Ua': '"Google Chrome";v="120", "Chromium";v="120", "Not_A Brand";v="24"',
-            'Sec-Ch-Ua-Mobile': '?0',
-            'Sec-Ch-Ua-Platform': '"Windows"',
-        })
-
-        self.version = version
-        self.base_api_url = 'https://dev.epicgames.com/community/api/documentation'
-        self.delay_min = 1.0  # Minimum delay
-        self.delay_max = 2.0  # Maximum delay
-        self.nodes_data = []
+    """Scraper with caching and rate limit handling.
+
+    Crawls one or more engine versions in a single pass: each category path is
+    fetched once per version, and content blocks that are identical to an
+    already parsed version's are not parsed again. The first version is the
+    base for that reuse and for page storage: DocsClient stores the other
+    versions' pages as deltas against it.
+    """
+
+    def __init__(self, version='5.5', refresh=False, versions: Optional[List[str]] = None):
+        self.versions = list(versions or [version])
+        self.version = self.versions[0]
+        # One base store (the first version's) for every version's client, so the
+        # delta stores see base pages fetched this run
+        base_store = PageStore(store_dir('cache', self.version, self.version))
+        self.clients = {v: DocsClient(version=v, cache_dir='cache', refresh=refresh,
+                                      base_version=self.version, base_store=base_store)
+                        for v in self.versions}
+        self.client = self.clients[self.version]
+        self.journals = {v: NodeJournal(f'ue_blueprint_nodes_v{v}.journal.jsonl') for v in self.versions}
+        self.journal = self.journals[self.version]
         self.categories_data = {}
-        self.visited_urls: Set[str] = set()
-        self.cache_dir = Path('cache')
-        self.cache_dir.mkdir(exist_ok=True)
-        self.request_count = 0
-
-    def random_delay(self):
-        """Add a random delay to avoid rate limiting."""
-        delay = random.uniform(self.delay_min, self.delay_max)
-        time.sleep(delay)
-
-    def get_cache_path(self, path: str) -> Path:
-        """Get cache file path for a given documentation path."""
-        safe_name = path.replace('/', '_').replace('-', '_')
-        return self.cache_dir / f"{safe_name}.json"
-
-    def fetch_json_api(self, path: str, use_cache=True) -> Dict:
-        """Fetch documentation JSON from API or cache."""
-        cache_path = self.get_cache_path(path)
-
-        # Try cache first
-        if use_cache and cache_path.exists():
-            logger.info(f"Using cached: {path}")
-            with open(cache_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-
-        url = f"{self.base_api_url}/document.json?path={path}&application_version={self.version}"
-        logger.info(f"Fetching API [{self.request_count}]: {path}")
-
-        self.request_count += 1
+        self.visited_urls: Set[Tuple[str, str]] = set()
+        self.cache_dir = self.client.cache_dir
+        self.parsed_pages = ParsedPageCache(self.cache_dir / 'parsed')
+        self.blocks_parsed = 0
+        self.blocks_reused = 0
 
-        # Add extra delay every 10 requests
-        if self.request_count % 10 == 0:
-            logger.info("  Pausing for rate limit...")
-            time.sleep(5)
-
-        try:
-            self.random_delay()
-            response = self.scraper.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-
-            # Cache the response
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-
-            return data
-
-        except Exception as e:
-            if '403' in str(e):
-                logger.warning(f"403 error - rate limited. Waiting 30 seconds...")
-                time.sleep(30)
-                # Try one more time
-                try:
-                    response = self.scraper.get(url, timeout=30)
-                    response.raise_for_status()
-                    data = response.json()
-                    with open(cache_path, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
-                    return data
-                except Exception as e2:
-                    logger.error(f"Failed again: {e2}")
-                    return {}
-            else:
-                logger.error(f"Error fetching {url}: {e}")
-                return {}
+    def fetch_json_api(self, path: str, use_cache=True, version: Optional[str] = None) -> Dict:
+        """Fetch documentation JSON from API or cache."""
+        client = self.clients[version or self.version]
+        tag = f" [{client.version}]" if len(self.versions) > 1 else ''
+        if use_cache and client.is_cached(path):
+            logger.info(f"{'Revalidating' if client.refresh else 'Using cached'}{tag}: {path}")
+        else:
+            logger.info(f"Fetching API{tag} [{client.request_count}]: {path}")
+        return client.fetch_json(path, use_cache=use_cache)
 
     def extract_category_urls_from_html(self, html_content: str) -> List[Dict]:
         """Extract blueprint category URLs from HTML content."""
-        soup = BeautifulSoup(html_content, 'html.parser')
         categories = []
 
-        items = soup.find_all('block-dir-item')
+        items = extract_dir_items(html_content)
         for item in items:
             href = item.get('href', '')
             page_name = item.get('page-name', '')
@@ -133,85 +84,96 @@ class BlueprintNodeScraperCached:
 
     def extract_path_from_url(self, url: str) -> str:
         """Extract the documentation path from a URL."""
-        match = re.search(r'/documentation/([\w-]+/[\w-]+/[\w-]+/.+?)(?:\?|$)', url)
-        if match:
-            return match.group(1)
-        return ''
+        return extract_path_from_url(url)
+
+    def parse_block_nodes(self, block: Dict, category_name: str) -> List[Dict]:
+        """Build the blueprint nodes of one parsed markdown content block (see parsed_cache.py)."""
+        nodes = []
+
+        # h3/h4 headers (function names) and the elements up to the next header
+        for section in block['sections']:
+            section_content = []
+            for tag, content in section['siblings']:
+                if tag == 'h2':
+                    break
+                section_content.append((tag, content))
+
+            if section_content:
+                node = {
+                    'displayName': section['title'],
+                    'category': category_name,
+                    'description': None,
+                    'inputs': [],
+                    'outputs': []
+                }
+
+                # Get description
+                for tag, content in section_content:
+                    if tag == 'p':
+                        node['description'] = content
+                        break
+
+                # Extract parameters from tables
+                for tag, rows in section_content:
+                    if tag == 'table' and len(rows) > 1:
+                        for cols in rows[1:]:
+                            if len(cols) >= 2:
+                                param = {
+                                    'name': cols[0],
+                                    'type': cols[1],
+                                    'description': cols[2] if len(cols) > 2 else ''
+                                }
+                                node['inputs'].append(param)
+
+                if node['displayName']:
+                    nodes.append(node)
+
+        return nodes
+
+    def scrape_category_page(self, category: Dict, version: Optional[str] = None,
+                             block_cache: Optional[Dict] = None) -> List[Dict]:
+        """Scrape all blueprint nodes from a category page.
 
-    def scrape_category_page(self, category: Dict) -> List[Dict]:
-        """Scrape all blueprint nodes from a category page."""
+        block_cache maps a content block's hash to its parsed nodes; pass the
+        same dict for every version of a category so unchanged blocks are
+        parsed once.
+        """
+        version = version or self.version
         path = category['path']
-        if not path or path in self.visited_urls:
+        if not path or (version, path) in self.visited_urls:
             return []
 
-        self.visited_urls.add(path)
-        data = self.fetch_json_api(path)
+        self.visited_urls.add((version, path))
+        data = self.fetch_json_api(path, version=version)
 
         if not data or 'blocks' not in data:
             return []
 
         nodes = []
         category_name = category['name']
+        block_cache = {} if block_cache is None else block_cache
+        page = None
 
-        for block in data['blocks']:
+        for i, block in enumerate(data['blocks']):
             if block.get('type') == 'markdown' and 'content_html' in block:
                 html = block['content_html']
-                soup = BeautifulSoup(html, 'html.parser')
-
-                # Look for h3/h4 headers (function names)
-                headers = soup.find_all(['h3', 'h4'])
-                for header in headers:
-                    section_content = []
-                    for sibling in header.find_next_siblings():
-                        if sibling.name in ['h3', 'h4', 'h2']:
-                            break
-                        section_content.append(sibling)
-
-                    if section_content:
-                        node = {
-                            'displayName': header.get_text(strip=True),
-                            'category': category_name,
-                            'description': None,
-                            'inputs': [],
-                            'outputs': []
-                        }
-
-                        # Get description
-                        for elem in section_content:
-                            if elem.name == 'p':
-                                node['description'] = elem.get_text(strip=True)
-                                break
-
-                        # Extract parameters from tables
-                        for elem in section_content:
-                            if elem.name == 'table':
-                                rows = elem.find_all('tr')
-                                if len(rows) > 1:
-                                    for row in rows[1:]:
-                                        cols = [td.get_text(strip=True) for td in row.find_all('td')]
-                                        if len(cols) >= 2:
-                                            param = {
-                                                'name': cols[0],
-                                                'type': cols[1],
-                                                'description': cols[2] if len(cols) > 2 else ''
-                                            }
-                                            node['inputs'].append(param)
-
-                        if node['displayName']:
-                            nodes.append(node)
-
-        logger.info(f"  ✓ {category_name}: {len(nodes)} nodes")
+                key = hashlib.sha1(html.encode('utf-8')).hexdigest()
+                if key in block_cache:
+                    self.blocks_reused += 1
+                else:
+                    # Parsed once per page payload, then reused from the parsed-page cache
+                    page = page or self.parsed_pages.get_document(data)
+                    block_cache[key] = self.parse_block_nodes(page['blocks'][i], category_name)
+                    self.blocks_parsed += 1
+                nodes.extend(block_cache[key])
+
+        tag = f" [{version}]" if len(self.versions) > 1 else ''
+        logger.info(f"  ✓ {category_name}{tag}: {len(nodes)} nodes")
         return nodes
 
-    def scrape_all(self):
-        """Scrape all blueprint nodes."""
-        logger.info("🚀 Starting Blueprint API scraper (cached version)...")
-        logger.info(f"   Version: {self.version}")
-        logger.info(f"   Cache dir: {self.cache_dir.absolute()}")
-
-        # Use cached main page if available
-        logger.info("\nStep 1: Loading main Blueprint API page...")
-        main_data = self.fetch_json_api('en-us/unreal-engine/BlueprintAPI')
+    def load_categories(self, version: str) -> List[Dict]:
+        """Load a version's main Blueprint API page and extract its categories."""
+        main_data = self.fetch_json_api('en-us/unreal-engine/BlueprintAPI', version=version)
 
         if not main_data or 'blocks' not in main_data:
             logger.error("Failed to fetch main page. Trying to use blueprint_api_raw.json...")
@@ -220,64 +182,105 @@ class BlueprintNodeScraperCached:
                     main_data = json.load(f)
             except:
                 logger.error("No cached data available")
-                return
+                return []
 
-        # Extract categories
-        logger.info("\nStep 2: Extracting categories...")
         html_content = main_data['blocks'][0]['content_html']
-        categories = self.extract_category_urls_from_html(html_content)
+        return self.extract_category_urls_from_html(html_content)
+
+    def scrape_all(self):
+        """Scrape all blueprint nodes."""
+        logger.info("🚀 Starting Blueprint API scraper (cached version)...")
+        logger.info(f"   Version: {', '.join(self.versions)}")
+        logger.info(f"   Cache dir: {self.cache_dir.absolute()}")
+
+        # Use cached main page if available
+        logger.info("\nStep 1: Loading main Blueprint API page...")
+        categories = self.load_categories(self.version)
+        if not categories:
+            return
+
+        # Extract categories (adding any that only exist in later versions)
+        logger.info("\nStep 2: Extracting categories...")
+        known_paths = {c['path'] for c in categories}
+        for version in self.versions[1:]:
+            for category in self.load_categories(version):
+                if category['path'] not in known_paths:
+                    known_paths.add(category['path'])
+                    categories.append(category)
 
         self.categories_data = {
             'version': self.version,
             'totalCategories': len(categories),
             'categories': categories
         }
+        if len(self.versions) > 1:
+            self.categories_data['versions'] = self.versions
 
         with open('blueprint_categories.json', 'w', encoding='utf-8') as f:
             json.dump(self.categories_data, f, indent=2, ensure_ascii=False)
 
         logger.info(f"✓ Found {len(categories)} categories")
 
-        # Scrape each category
+        # Scrape each category, once per version
         logger.info(f"\nStep 3: Scraping {len(categories)} categories...")
+        for journal in self.journals.values():
+            journal.reset()
 
         for i, category in enumerate(categories, 1):
             logger.info(f"\n[{i}/{len(categories)}] {category['name']}")
-            try:
-                nodes = self.scrape_category_page(category)
-                self.nodes_data.extend(nodes)
-
-                # Save progress every 20 categories
-                if i % 20 == 0:
-                    self.save_results()
-            except Exception as e:
-                logger.error(f"Error scraping {category['name']}: {e}")
-                continue
-
-        self.save_results()
-        logger.info(f"\n✅ Complete! Total nodes: {len(self.nodes_data)}")
-
-    def save_results(self):
-        """Save results to JSON."""
-        output = {
+            block_cache = {}
+            for version in self.versions:
+                try:
+                    nodes = self.scrape_category_page(category, version, block_cache)
+                    # Journal each category's nodes as soon as they are scraped
+                    self.journals[version].extend(nodes)
+                except Exception as e:
+                    logger.error(f"Error scraping {category['name']} ({version}): {e}")
+                    continue
+
+        for version in self.versions:
+            self.save_results(version)
+
+        logger.info(f"\n✅ Complete! Total nodes: "
+                    f"{', '.join(f'{v}: {self.journals[v].appended}' for v in self.versions)}")
+        if len(self.versions) > 1:
+            logger.info(f"   Content blocks parsed: {self.blocks_parsed}, reused across versions: {self.blocks_reused}")
+        for version, client in self.clients.items():
+            if client.refresh:
+                logger.info(f"   Unchanged pages (304) [{version}]: {client.not_modified_count}/{client.request_count}")
+
+    def save_results(self, version: Optional[str] = None):
+        """Compact a version's node journal into its JSON results file."""
+        version = version or self.version
+        journal = self.journals[version]
+        header = {
             'version': '2.0',
             'source': 'Unreal Engine Official Documentation API',
-            'unrealVersion': self.version,
+            'unrealVersion': version,
             'scrapedAt': time.strftime('%Y-%m-%d %H:%M:%S'),
-            'totalNodes': len(self.nodes_data),
+            'totalNodes': journal.appended,
             'totalCategories': len(self.categories_data.get('categories', [])),
-            'nodes': self.nodes_data
         }
 
-        filename = f'ue_blueprint_nodes_v{self.version}.json'
-        with open(filename, 'w', encoding='utf-8') as f:
-            json.dump(output, f, indent=2, ensure_ascii=False)
+        filename = f'ue_blueprint_nodes_v{version}.json'
+        written = compact(journal, filename, header)
 
-        logger.info(f"💾 Saved {len(self.nodes_data)} nodes to {filename}")
+        logger.info(f"💾 Saved {written} nodes to {filename}")
 
 
 def main():
-    scraper = BlueprintNodeScraperCached(version='5.5')
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Scrape Unreal Engine Blueprint API (cached)')
+    parser.add_argument('--version', default='5.5', help='Unreal Engine version (default: 5.5)')
+    parser.add_argument('--versions', nargs='+',
+                        help='Crawl several versions in one run (first is the base), e.g. --versions 5.5 5.4 5.3')
+    parser.add_argument('--refresh', action='store_true',
+                        help='Revalidate cached pages with conditional requests instead of trusting them')
+
+    args = parser.parse_args()
+
+    scraper = BlueprintNodeScraperCached(version=args.version, refresh=args.refresh, versions=args.versions)
     scraper.scrape_all()
 
 
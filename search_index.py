@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Build the search index the index.html node menu queries instead of scanning
+every node on each keystroke.
+
+The index (ue_blueprint_nodes_search.json, next to the merged database) holds,
+in a static ranking order (spawnable first, then nodes with detailed info,
+then shorter names):
+- order:     rank -> position of the node in the merged database's nodes list
+- names:     lower-cased display names (for short queries and ranking matches)
+- spawnable: ranks of nodes that can be spawned
+- trigrams:  trigram -> delta-encoded ranks of the nodes whose searchable
+             fields contain it
+
+A query of 3+ characters checks only the nodes in every one of its trigrams'
+postings, against the node records the menu already holds. A shorter query
+has no trigram: it matches the names first, and checks the other fields only
+while the result limit is not filled (those matches rank after every name
+match anyway). Matches are then ordered by where the query hits the name
+(prefix, word start, anywhere, other field) and by rank. query() is the
+reference implementation the menu mirrors.
+
+    python search_index.py                    # build from ue_blueprint_nodes_merged.json
+    python search_index.py --verify           # compare answers with a linear scan
+"""
+
+import argparse
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 2
+
+# Fields the menu searches, as in the original filterNodes()
+SEARCH_FIELDS = ['displayName', 'className', 'nodeType', 'category', 'description', 'keywords', 'uclassMetadata']
+
+
+def normalize(text) -> str:
+    return str(text).lower() if text else ''
+
+
+def search_text(node: Dict) -> str:
+    """Searchable fields, normalised and newline-separated (queries never match across fields)."""
+    return '\n'.join(normalize(node.get(field)) for field in SEARCH_FIELDS)
+
+
+def node_matches(node: Dict, q: str) -> bool:
+    return any(q in normalize(node.get(field)) for field in SEARCH_FIELDS)
+
+
+def trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def static_rank(node: Dict):
+    name = node.get('displayName') or node.get('className') or ''
+    return (not node.get('canSpawn'), not node.get('hasDetailedInfo'), len(name))
+
+
+def delta_encode(values: List[int]) -> List[int]:
+    return [value - prev for prev, value in zip([0] + values, values)]
+
+
+def delta_decode(deltas: List[int], end: Optional[int] = None) -> List[int]:
+    """Decode postings, stopping at the first value >= end."""
+    values = []
+    total = 0
+    for delta in deltas:
+        total += delta
+        if end is not None and total >= end:
+            break
+        values.append(total)
+    return values
+
+
+def build_search_index(nodes: List[Dict]) -> Dict:
+    order = sorted(range(len(nodes)), key=lambda i: static_rank(nodes[i]))
+
+    postings = {}
+    for rank, i in enumerate(order):
+        for gram in trigrams(search_text(nodes[i])):
+            if '\n' not in gram:
+                postings.setdefault(gram, []).append(rank)
+
+    return {
+        'version': INDEX_VERSION,
+        'totalNodes': len(nodes),
+        'fields': SEARCH_FIELDS,
+        'order': order,
+        'names': [normalize(nodes[i].get('displayName') or nodes[i].get('className')) for i in order],
+        'spawnable': [rank for rank, i in enumerate(order) if nodes[i].get('canSpawn')],
+        'trigrams': {gram: delta_encode(ranks) for gram, ranks in sorted(postings.items())},
+    }
+
+
+def match_tier(name: str, query: str) -> int:
+    if name.startswith(query):
+        return 0
+    if ' ' + query in name:
+        return 1
+    if query in name:
+        return 2
+    return 3
+
+
+def query(index: Dict, nodes: List[Dict], text: str, limit: int = 100, spawnable_only: bool = True) -> List[int]:
+    """Positions (in the merged nodes list) of the best matches for a menu query."""
+    q = text.lower()
+    allowed = set(index['spawnable']) if spawnable_only else None
+
+    if not q.strip():
+        ranks = index['spawnable'] if spawnable_only else range(len(index['order']))
+        return [index['order'][rank] for rank in list(ranks)[:limit]]
+
+    # Spawnable nodes rank first, so with spawnable_only only ranks below end can match
+    if spawnable_only:
+        end = index['spawnable'][-1] + 1 if index['spawnable'] else 0
+    else:
+        end = len(index['order'])
+
+    names = index['names']
+    if len(q) >= 3:
+        # Nodes in every trigram's postings, rarest first; each is checked against its record
+        postings = []
+        for gram in trigrams(q):
+            deltas = index['trigrams'].get(gram)
+            if deltas is None:
+                return []
+            postings.append(deltas)
+        postings.sort(key=len)
+        candidates = set(delta_decode(postings[0], end))
+        for deltas in postings[1:]:
+            if not candidates:
+                break
+            candidates.intersection_update(delta_decode(deltas, end))
+        matches = [rank for rank in sorted(candidates)
+                   if (allowed is None or rank in allowed) and node_matches(nodes[index['order'][rank]], q)]
+    else:
+        ranks = [rank for rank in range(end) if allowed is None or rank in allowed]
+        matches = [rank for rank in ranks if q in names[rank]]
+        # Other-field matches rank after all name matches: only needed to fill the limit
+        named = set(matches)
+        for rank in ranks:
+            if len(matches) >= limit:
+                break
+            if rank not in named and node_matches(nodes[index['order'][rank]], q):
+                matches.append(rank)
+    matches.sort(key=lambda rank: (match_tier(names[rank], q), rank))
+    return [index['order'][rank] for rank in matches[:limit]]
+
+
+def linear_scan(nodes: List[Dict], text: str, spawnable_only: bool = True) -> set:
+    """The original filterNodes() matching, for verification."""
+    q = text.lower()
+    return {i for i, node in enumerate(nodes)
+            if (not spawnable_only or node.get('canSpawn') is True) and node_matches(node, q)}
+
+
+def verify(nodes: List[Dict], index: Dict) -> bool:
+    """Check every query's full result set against a linear scan, and time both."""
+    queries = ['', 'a', 'ge', 'get', 'actor', 'rotation', 'set actor', 'vector', 'zzzq', 'transformation']
+    queries += [normalize(n.get('displayName'))[:5] for n in nodes[::max(1, len(nodes) // 40)]]
+
+    ok = True
+    index_time = scan_time = 0.0
+    for q in queries:
+        for spawnable_only in (True, False):
+            start = time.perf_counter()
+            got = query(index, nodes, q, limit=len(nodes), spawnable_only=spawnable_only)
+            index_time += time.perf_counter() - start
+            start = time.perf_counter()
+            expected = linear_scan(nodes, q, spawnable_only)
+            scan_time += time.perf_counter() - start
+            if q and set(got) != expected:
+                logger.error(f"   ❌ '{q}' (spawnable_only={spawnable_only}): "
+                             f"{len(got)} results, linear scan {len(expected)}")
+                ok = False
+
+    runs = len(queries) * 2
+    logger.info(f"   {runs} queries: index {index_time * 1000 / runs:.3f} ms/query, "
+                f"linear scan {scan_time * 1000 / runs:.3f} ms/query")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the node menu search index')
+    parser.add_argument('--input', default='ue_blueprint_nodes_merged.json', help='Merged node database')
+    parser.add_argument('--output', default='ue_blueprint_nodes_search.json', help='Index file to write')
+    parser.add_argument('--verify', action='store_true', help='Check index answers against a linear scan')
+
+    args = parser.parse_args()
+
+    input_file = Path(args.input)
+    if not input_file.exists():
+        logger.error(f"❌ {input_file} not found! Run merge_all_nodes.py first.")
+        return
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        nodes = json.load(f)['nodes']
+
+    start = time.perf_counter()
+    index = build_search_index(nodes)
+    elapsed = time.perf_counter() - start
+
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+
+    size_kb = Path(args.output).stat().st_size / 1024
+    logger.info(f"🔎 Indexed {len(nodes)} nodes ({len(index['spawnable'])} spawnable, "
+                f"{len(index['trigrams'])} trigrams) in {elapsed * 1000:.0f} ms")
+    logger.info(f"💾 Saved {args.output} ({size_kb:.0f} KB)")
+
+    if args.verify:
+        if verify(nodes, index):
+            logger.info("✅ Index answers match the linear scan")
+        else:
+            raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
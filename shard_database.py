@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Split the merged node database into a small manifest and per-category detail
+shards, so index.html is searchable as soon as the manifest has loaded and
+fetches full node records (inputs, outputs, spawn data, Phase 2 details) only
+for the nodes that are selected or spawned.
+
+    ue_blueprint_nodes_shards/manifest.json   the shard list (file, category) and
+                                              per node: the fields the search menu
+                                              shows, a description summary and the
+                                              index of its detail shard
+    ue_blueprint_nodes_shards/<category>.json full records of one category,
+                                              keyed by node id
+
+Node ids are positions in the merged database's nodes list (the ids the
+search index uses), and the manifest lists nodes in that order, so its size
+grows with the number of nodes but not with the detail payload.
+"""
+
+import argparse
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Dict, Tuple
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+SHARD_DIR = 'ue_blueprint_nodes_shards'
+
+# Fields the search menu lists and filters on; everything else is in the shards.
+# A node's category is its shard's category.
+MANIFEST_FIELDS = ['displayName', 'className', 'nodeType', 'canSpawn', 'isPure', 'keywords', 'uclassMetadata']
+
+# The menu shows at most this many characters of a description
+SUMMARY_LENGTH = 80
+
+
+def shard_name(category: str, taken: set) -> str:
+    """File stem for a category shard, unique within the build."""
+    base = re.sub(r'[^a-z0-9]+', '_', category.lower()).strip('_') or 'uncategorized'
+    name = base
+    suffix = 2
+    while name in taken:
+        name = f"{base}_{suffix}"
+        suffix += 1
+    taken.add(name)
+    return name
+
+
+def summarize(text: str) -> str:
+    if not text or len(text) <= SUMMARY_LENGTH:
+        return text
+    return text[:SUMMARY_LENGTH] + '...'
+
+
+def build_shards(data: Dict) -> Tuple[Dict, Dict[str, Dict]]:
+    """Return (manifest, {shard file name: shard document}) for a merged database."""
+    nodes = data['nodes']
+
+    shard_of_category = {}
+    shards = []
+    taken = set()
+    for node in nodes:
+        category = node.get('category') or 'Uncategorized'
+        if category not in shard_of_category:
+            shard_of_category[category] = len(shards)
+            shards.append({'file': f"{shard_name(category, taken)}.json", 'category': category, 'nodes': 0})
+
+    entries = []
+    documents = {}
+    for node_id, node in enumerate(nodes):
+        shard_index = shard_of_category[node.get('category') or 'Uncategorized']
+        shard = shards[shard_index]
+        shard['nodes'] += 1
+        documents.setdefault(shard['file'], {'category': shard['category'], 'nodes': {}})
+        documents[shard['file']]['nodes'][str(node_id)] = node
+
+        entry = {field: node[field] for field in MANIFEST_FIELDS if node.get(field)}
+        if node.get('description'):
+            entry['description'] = summarize(node['description'])
+        entry['shard'] = shard_index
+        entries.append(entry)
+
+    manifest = {
+        'version': data.get('version'),
+        'source': data.get('source'),
+        'totalNodes': len(nodes),
+        'spawnableNodes': data.get('spawnableNodes', sum(1 for n in nodes if n.get('canSpawn'))),
+        'searchOnlyNodes': data.get('searchOnlyNodes', sum(1 for n in nodes if not n.get('canSpawn'))),
+        'shards': shards,
+        'nodes': entries,
+    }
+    return manifest, documents
+
+
+def write_shards(manifest: Dict, documents: Dict[str, Dict], output_dir: Path) -> int:
+    """Write the shards, then the manifest; shards left over from earlier builds are removed."""
+    output_dir.mkdir(exist_ok=True)
+    for stale in output_dir.glob('*.json'):
+        if stale.name != 'manifest.json' and stale.name not in documents:
+            stale.unlink()
+
+    total = 0
+    for name, document in documents.items():
+        with open(output_dir / name, 'w', encoding='utf-8') as f:
+            json.dump(document, f, ensure_ascii=False, separators=(',', ':'))
+        total += (output_dir / name).stat().st_size
+
+    with open(output_dir / 'manifest.json', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, separators=(',', ':'))
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Split the merged node database into a manifest and detail shards')
+    parser.add_argument('--input', default='ue_blueprint_nodes_merged.json', help='Merged node database')
+    parser.add_argument('--output-dir', default=SHARD_DIR, help='Directory for manifest.json and the shards')
+
+    args = parser.parse_args()
+
+    input_file = Path(args.input)
+    if not input_file.exists():
+        logger.error(f"❌ {input_file} not found! Run merge_all_nodes.py first.")
+        return
+
+    with open(input_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    manifest, documents = build_shards(data)
+    output_dir = Path(args.output_dir)
+    shard_bytes = write_shards(manifest, documents, output_dir)
+
+    manifest_kb = (output_dir / 'manifest.json').stat().st_size / 1024
+    logger.info(f"🧩 Sharded {manifest['totalNodes']} nodes into {len(documents)} category shards")
+    logger.info(f"   Manifest: {manifest_kb:.0f} KB (was {input_file.stat().st_size / 1024:.0f} KB for the full database)")
+    logger.info(f"   Shards:   {shard_bytes / 1024:.0f} KB total, "
+                f"largest {max(s['nodes'] for s in manifest['shards'])} nodes")
+    logger.info(f"💾 Saved to {output_dir}/")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Paste-ready T3D text (the Blueprint editor's clipboard format) for nodes of
+the merged database, for offline tools and LLM pipelines. Produces the same
+text as createNodeSerialization() in index.html.
+
+Everything in a node's text except its name, position and GUIDs is fixed by
+the node record, so it is compiled once:
+- pin templates: one per (direction, pin type), holding the ~25 constant
+  PinType/flag fields, filled with a pin's name and tooltip
+- node templates: one per node record, with %-placeholders for the variable
+  parts, reused for every later copy of that node
+GUIDs are cut from one os.urandom() call per batch instead of one per pin.
+
+    python t3d_serializer.py "Set Actor Location"             # print one node
+    python t3d_serializer.py --all --output spawnable.t3d     # every spawnable node, in a grid
+    python t3d_serializer.py --benchmark                      # nodes and pins per second
+"""
+
+import argparse
+import itertools
+import json
+import logging
+import math
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+DEFAULT_TARGET_CLASS = '/Script/Engine.KismetSystemLibrary'
+
+NULL_GUID = '0' * 32
+
+# PinType fields that are the same for every pin the database describes (ContainerType aside)
+PIN_TYPE_FLAGS = ('PinType.PinSubCategoryMemberReference=(),PinType.PinValueType=(),PinType.ContainerType={container},'
+                  'PinType.bIsReference=False,PinType.bIsConst=False,PinType.bIsWeakPointer=False,'
+                  'PinType.bIsUObjectWrapper=False,PinType.bSerializeAsSinglePrecisionFloat=False')
+SCALAR_PIN_TYPE_FLAGS = PIN_TYPE_FLAGS.format(container='None')
+PIN_FLAGS = ('bNotConnectable=False,bDefaultValueIsReadOnly=False,bDefaultValueIsIgnored=False,'
+             'bAdvancedView=False,bOrphanedPin=False,')
+
+# Boolean inputs given an explicit default (as in index.html)
+FALSE_DEFAULT_PINS = {'bSweep', 'bTeleport', 'bTeleportPhysics'}
+FALSE_DEFAULT = ',DefaultValue="false",AutogeneratedDefaultValue="false"'
+
+EXEC_PINS = (
+    'CustomProperties Pin (PinId=%s,PinName="execute",PinToolTip="\\nExec",PinType.PinCategory="exec",'
+    f'PinType.PinSubCategory="",PinType.PinSubCategoryObject=None,{SCALAR_PIN_TYPE_FLAGS},LinkedTo=(),'
+    f'PersistentGuid={NULL_GUID},bHidden=False,{PIN_FLAGS})',
+    'CustomProperties Pin (PinId=%s,PinName="then",PinToolTip="\\nExec",Direction="EGPD_Output",'
+    f'PinType.PinCategory="exec",PinType.PinSubCategory="",PinType.PinSubCategoryObject=None,{SCALAR_PIN_TYPE_FLAGS},'
+    f'LinkedTo=(),PersistentGuid={NULL_GUID},bHidden=False,{PIN_FLAGS})',
+)
+
+
+def struct_object(path: str) -> str:
+    return f"/Script/CoreUObject.ScriptStruct'\"{path}\"'"
+
+
+def pin_type_details(pin: Dict) -> Tuple[str, str, str, str]:
+    """(PinCategory, PinSubCategory, PinSubCategoryObject, ContainerType) for a pin, as getPinTypeDetails()
+    finds them: the pinType resolved at build time, else a guess from the pin's name and description."""
+    resolved = pin.get('pinType')
+    if resolved:
+        return (resolved['category'], resolved['subCategory'], resolved['subCategoryObject'],
+                resolved.get('containerType', 'None'))
+
+    pin_type = pin.get('type')
+    name = pin.get('name', '').lower()
+    description = (pin.get('description') or '').lower()
+
+    def mentions(word):
+        return word in name or word in description
+
+    if pin_type == 'struct':
+        if mentions('location'):
+            return pin_type, '', struct_object('/Script/CoreUObject.Vector'), 'None'
+        if mentions('rotation'):
+            return pin_type, '', struct_object('/Script/Engine.Rotator'), 'None'
+        if mentions('scale'):
+            return pin_type, '', struct_object('/Script/CoreUObject.Vector'), 'None'
+        if mentions('transform'):
+            return pin_type, '', struct_object('/Script/Engine.Transform'), 'None'
+        if mentions('vector'):
+            return pin_type, '', struct_object('/Script/CoreUObject.Vector'), 'None'
+        return pin_type, '', struct_object('/Script/CoreUObject.Object'), 'None'
+    if pin_type == 'object':
+        return pin_type, '', "/Script/CoreUObject.Class'\"/Script/Engine.Actor\"'", 'None'
+    return pin_type, '', 'None', 'None'
+
+
+def t3d_string(text: str) -> str:
+    """Text for a quoted T3D value (backslashes, quotes and newlines escaped)."""
+    return text.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+@lru_cache(maxsize=None)
+def pin_template(direction: str, category: str, sub_category: str, sub_category_object: str,
+                 container_type: str = 'None') -> str:
+    """The line for one pin type, with {name}, {friendly}, {tooltip}, {default} and {hidden} to fill in
+    and a %s for the PinId."""
+    type_fields = (f'PinType.PinCategory="{category}",PinType.PinSubCategory="{sub_category}",'
+                   f'PinType.PinSubCategoryObject={sub_category_object},'
+                   f'{PIN_TYPE_FLAGS.format(container=container_type)}')
+    if direction == 'input':
+        return ('CustomProperties Pin (PinId=%s,PinName="{name}",PinFriendlyName={friendly},'
+                f'PinToolTip="{{tooltip}}",{type_fields},Direction="EGPD_Input",LinkedTo=(){{default}},'
+                f'PersistentGuid={NULL_GUID},bHidden={{hidden}},{PIN_FLAGS})')
+    return ('CustomProperties Pin (PinId=%s,PinName="{name}",PinToolTip="{tooltip}",Direction="EGPD_Output",'
+            f'{type_fields},LinkedTo=(),PersistentGuid={NULL_GUID},bHidden=False,{PIN_FLAGS})')
+
+
+def _literal(text: str) -> str:
+    """Node text for a %-template (the template's own placeholders are the only % left)."""
+    return text.replace('%', '%%')
+
+
+def pin_line(pin: Dict, direction: str, is_pure: bool) -> str:
+    template = pin_template(direction, *pin_type_details(pin))
+    name = pin['name']
+    default = FALSE_DEFAULT if pin.get('type') == 'bool' and name in FALSE_DEFAULT_PINS else ''
+    return template.format(
+        name=_literal(t3d_string(name)),
+        friendly='NSLOCTEXT("K2Node", "Target", "Target")' if name == 'self' else '""',
+        tooltip=_literal(t3d_string(pin.get('description') or '')),
+        default=default,
+        # Non-pure nodes carry their target in 'self' but do not show it
+        hidden='True' if name == 'self' and not is_pure else 'False',
+    )
+
+
+def compile_node(node: Dict) -> Tuple[str, int]:
+    """(%-template taking name, name, x, y, node GUID and one GUID per pin; pin count) for a node."""
+    class_name = node['className']
+    lines = [
+        f'Begin Object Class="/Script/BlueprintGraph.{class_name}" Name="%s" '
+        f'ExportPath=/Script/BlueprintGraph.{class_name}\'"/Game/Generated/%s"\'',
+        '    NodePosX=%d',
+        '    NodePosY=%d',
+        '    NodeGuid=%s',
+    ]
+    pins = []
+
+    if 'CallFunction' in class_name:
+        function_name = node.get('functionName') or ''.join((node.get('displayName') or '').split()) or 'PrintString'
+        target_class = node.get('targetClass') or DEFAULT_TARGET_CLASS
+        lines.append(_literal(f'    FunctionReference=(MemberParent=/Script/CoreUObject.Class\'"{target_class}"\','
+                              f'MemberName="{function_name}")'))
+
+        if node.get('inputs') is not None or node.get('outputs') is not None:
+            is_pure = bool(node.get('isPure'))
+            if not is_pure:
+                pins.extend(EXEC_PINS)
+            for direction, field in (('input', 'inputs'), ('output', 'outputs')):
+                pins.extend(pin_line(pin, direction, is_pure) for pin in node.get(field) or []
+                            if pin.get('type') != 'exec')
+    elif 'VariableGet' in class_name or 'VariableSet' in class_name:
+        variable = ''.join(node['displayName'].split()) if node.get('displayName') else 'NewVar'
+        lines.append(_literal(f'    VariableReference=(MemberName="{variable}",bSelfContext=True)'))
+
+    lines.extend('    ' + pin for pin in pins)
+    lines.append('End Object')
+    return '\n'.join(lines), len(pins)
+
+
+class GuidPool:
+    """Random 32-hex-digit GUIDs, generated a batch at a time."""
+
+    def __init__(self, batch: int = 4096):
+        self.batch = batch
+        self.guids = []
+        self.next = 0
+
+    def take(self, count: int) -> List[str]:
+        if self.next + count > len(self.guids):
+            size = max(self.batch, count)
+            digits = os.urandom(16 * size).hex().upper()
+            self.guids = self.guids[self.next:] + [digits[i:i + 32] for i in range(0, len(digits), 32)]
+            self.next = 0
+        guids = self.guids[self.next:self.next + count]
+        self.next += count
+        return guids
+
+
+class T3DSerializer:
+    """Serializes node records to T3D, compiling each record's template on first use."""
+
+    def __init__(self, guids: Optional[GuidPool] = None):
+        self.guids = guids or GuidPool()
+        self.counter = itertools.count()
+        # id(node) -> (node, template, pin count); the node is kept so its id is not reused
+        self.templates = {}
+
+    def template(self, node: Dict) -> Tuple[str, int]:
+        entry = self.templates.get(id(node))
+        if entry is None:
+            entry = self.templates[id(node)] = (node, *compile_node(node))
+        return entry[1], entry[2]
+
+    def node_name(self, class_name: str) -> str:
+        return f"{class_name}_{int(time.time() * 1000)}_{next(self.counter)}"
+
+    def serialize(self, node: Dict, x: float = 0, y: float = 0, name: Optional[str] = None) -> str:
+        """T3D for one node at (x, y) (rounded as Math.round does)."""
+        template, pin_count = self.template(node)
+        name = name or self.node_name(node['className'])
+        return template % (name, name, math.floor(x + 0.5), math.floor(y + 0.5), *self.guids.take(pin_count + 1))
+
+    def serialize_grid(self, nodes: Iterable[Dict], columns: int = 8, spacing: Tuple[int, int] = (400, 300)) -> str:
+        """T3D for several nodes laid out in a grid, pasted together as one selection."""
+        return '\n'.join(self.serialize(node, (i % columns) * spacing[0], (i // columns) * spacing[1])
+                         for i, node in enumerate(nodes))
+
+
+def benchmark(nodes: List[Dict], count: int = 20000):
+    """Nodes and pins per second, compiling every node vs reusing compiled templates."""
+    workload = [nodes[i % len(nodes)] for i in range(count)]
+
+    def run(serializer):
+        start = time.perf_counter()
+        pins = 0
+        for i, node in enumerate(workload):
+            pins += serializer.serialize(node, i, i).count('\n    CustomProperties Pin')
+        return time.perf_counter() - start, pins
+
+    class Uncached(T3DSerializer):
+        def template(self, node):
+            return compile_node(node)
+
+    logger.info(f"⏱️  {count} nodes ({len(nodes)} distinct spawnable records)")
+    for label, serializer in (('compile every node', Uncached()), ('compiled templates', T3DSerializer())):
+        seconds, pins = run(serializer)
+        logger.info(f"   {label:<20} {count / seconds:>9.0f} nodes/s  {pins / seconds:>10.0f} pins/s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serialize blueprint nodes to paste-ready T3D text')
+    parser.add_argument('names', nargs='*', help='Nodes to serialize (matched fuzzily among spawnable nodes)')
+    parser.add_argument('--database', default='ue_blueprint_nodes_merged.json', help='Node database')
+    parser.add_argument('--all', action='store_true', help='Serialize every spawnable node')
+    parser.add_argument('--output', help='Write the T3D here instead of printing it')
+    parser.add_argument('--benchmark', action='store_true', help='Measure nodes and pins serialized per second')
+
+    args = parser.parse_args()
+
+    if not Path(args.database).exists():
+        logger.error(f"❌ {args.database} not found! Run merge_all_nodes.py first.")
+        return
+
+    with open(args.database, 'r', encoding='utf-8') as f:
+        all_nodes = json.load(f)['nodes']
+    spawnable = [node for node in all_nodes if node.get('canSpawn') and node.get('className')]
+
+    if args.benchmark:
+        benchmark(spawnable)
+
+    if args.all:
+        selected = spawnable
+    else:
+        from node_search import NodeSearch
+        search = NodeSearch(spawnable)
+        selected = []
+        for name in args.names:
+            node = search.resolve(name)
+            if node is None:
+                logger.warning(f"⚠️  No spawnable node matches '{name}'")
+            else:
+                selected.append(node)
+    if not selected:
+        return
+
+    text = T3DSerializer().serialize_grid(selected)
+    if args.output:
+        Path(args.output).write_text(text + '\n', encoding='utf-8')
+        logger.info(f"💾 Saved {len(selected)} nodes to {args.output}")
+    else:
+        print(text)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+import sqlite3
+
+from crawl_frontier import DONE, FAILED, IN_FLIGHT, QUEUED, CrawlFrontier
+from scraper_recursive import RecursiveBlueprintScraper, default_link_filter, extract_subcategories
+
+
+def drain(frontier):
+    items = []
+    while True:
+        item = frontier.pop()
+        if item is None:
+            return items
+        items.append(item[0])
+
+
+def test_pops_index_hints_then_shallow_pages_and_skips_known_paths(tmp_path):
+    frontier = CrawlFrontier(tmp_path / 'frontier.db', max_depth=3, index_depth=1)
+    frontier.push([('root', 0, ''), ('deep', 2, 'a/b'), ('mid', 1, 'a'), ('too-deep', 4, 'a/b/c/d')])
+    frontier.push([('mid', 1, 'a')])
+    assert drain(frontier) == ['root', 'mid', 'deep']
+
+
+def test_siblings_of_an_index_page_are_raised(tmp_path):
+    frontier = CrawlFrontier(tmp_path / 'frontier.db', index_depth=0)
+    frontier.push([('root', 0, '')])
+    root = frontier.pop()
+    frontier.complete(root, [('a', 1, 'A'), ('b', 1, 'B'), ('c', 1, 'C')])
+    frontier.complete(frontier.pop(), [('a/x', 2, 'A/X')])      # 'a' is an index page
+    # Without the re-ranking 'b' and 'c' would keep the plain depth order
+    frontier.push([('other', 1, 'O')])
+    assert [frontier.pop()[0] for _ in range(2)] == ['b', 'c']
+
+
+def test_siblings_of_a_leaf_are_lowered_until_an_index_sibling_raises_them(tmp_path):
+    frontier = CrawlFrontier(tmp_path / 'frontier.db', index_depth=0)
+    frontier.push([('root', 0, '')])
+    frontier.complete(frontier.pop(), [('a', 1, 'A'), ('b', 1, 'B'), ('c', 1, 'C')])
+    frontier.complete(frontier.pop(), [])                        # 'a' is a leaf
+    frontier.push([('unrelated', 3, 'U')])
+    assert frontier.pop()[0] == 'unrelated'
+    frontier.complete(frontier.pop(), [('b/x', 2, 'B/X')])       # 'b' is an index page
+    assert drain(frontier) == ['c', 'b/x']
+
+
+def test_resume_requeues_in_flight_pages(tmp_path):
+    frontier = CrawlFrontier(tmp_path / 'frontier.db', max_attempts=2)
+    frontier.push([('a', 0, ''), ('b', 0, '')])
+    frontier.pop()
+    item = frontier.pop()
+    frontier.fail(item, 'timeout')
+    frontier.close()
+
+    resumed = CrawlFrontier(tmp_path / 'frontier.db', max_attempts=2)
+    assert resumed.counts()[IN_FLIGHT] == 1
+    assert resumed.resume() == 2
+    assert drain(resumed) == ['a', 'b']
+    resumed.fail(('b', 0, ''), 'timeout')
+    assert resumed.counts()[FAILED] == 1 and resumed.failed_paths() == ['b']
+
+
+def test_old_frontier_is_migrated(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / 'frontier.db'))
+    conn.execute("CREATE TABLE frontier (seq INTEGER PRIMARY KEY AUTOINCREMENT, path TEXT NOT NULL UNIQUE, "
+                 "depth INTEGER NOT NULL, category_path TEXT NOT NULL DEFAULT '', kind TEXT NOT NULL DEFAULT "
+                 "'unknown', rank INTEGER NOT NULL DEFAULT 1, state TEXT NOT NULL DEFAULT 'queued', attempts "
+                 "INTEGER NOT NULL DEFAULT 0, updated_at TEXT, last_error TEXT)")
+    conn.execute("INSERT INTO frontier (path, depth) VALUES ('a', 0)")
+    conn.commit()
+    conn.close()
+
+    frontier = CrawlFrontier(tmp_path / 'frontier.db')
+    assert not frontier.is_journaled('a')
+    frontier.mark_journaled('a')
+    assert frontier.is_journaled('a')
+
+
+def test_resumed_crawl_does_not_journal_a_node_twice(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    parsed = {'title': 'Get Actor Location', 'subcategories': [],
+              'node': {'displayName': 'Get Actor Location', 'category': 'Transformation'}}
+    scraper = RecursiveBlueprintScraper()
+    scraper.journal.reset()
+    scraper.frontier.push([('leaf', 1, 'Transformation'), ('twin', 1, 'Transformation')])
+    leaf = scraper.frontier.pop()
+    scraper.handle_parsed_page(leaf, parsed)
+    scraper.journal.close()
+    scraper.frontier.close()    # crash before frontier.complete()
+
+    resumed = RecursiveBlueprintScraper()
+    assert resumed.frontier.resume() == 2
+    resumed.journal.reopen()
+    for item in (resumed.frontier.pop(), resumed.frontier.pop()):
+        resumed.frontier.complete(item, resumed.handle_parsed_page(item, parsed) or [])
+    # The re-parsed leaf is skipped; a different leaf with the same name is kept
+    assert resumed.journal.appended == 2
+    assert resumed.frontier.counts()[DONE] == 2 and resumed.frontier.counts()[QUEUED] == 0
+
+
+def test_link_filter_follows_the_root():
+    assert default_link_filter('en-us/unreal-engine/BlueprintAPI') == 'BlueprintAPI/'
+    assert default_link_filter('en-us/unreal-engine/') == 'unreal-engine/'
+    html = ('<block-dir-item page-name="Actor" href="/documentation/en-us/unreal-engine/BlueprintAPI/Actor">'
+            '</block-dir-item><block-dir-item page-name="Lumen" '
+            'href="/documentation/en-us/unreal-engine/lumen-global-illumination"></block-dir-item>')
+    data = {'blocks': [{'type': 'markdown', 'content_html': html}]}
+    assert [sub['name'] for sub in extract_subcategories(data)] == ['Actor']
+    assert [sub['name'] for sub in extract_subcategories(data, 'unreal-engine/')] == ['Actor', 'Lumen']
@@ -0,0 +1,53 @@
+import json
+
+from crawl_state import COMPLETED, FAILED, PENDING, CrawlState
+
+URLS = [f'https://dev.epicgames.com/documentation/en-us/unreal-engine/BlueprintAPI/Node{i}' for i in range(4)]
+
+
+def test_progress_survives_reopening(tmp_path):
+    state = CrawlState(tmp_path / 'state.db')
+    state.add_pending(URLS)
+    state.mark_completed(URLS[0])
+    state.mark_failed(URLS[1], 'HTTP 503')
+    state.close()
+
+    # A crash after close loses nothing: a new process sees the same progress
+    state = CrawlState(tmp_path / 'state.db')
+    assert state.counts() == {PENDING: 2, COMPLETED: 1, FAILED: 1}
+    assert state.status(URLS[0]) == COMPLETED
+    assert state.backlog() == [URLS[2], URLS[3], URLS[1]]
+    [(url, attempts, _, error)] = state.failures()
+    assert (url, attempts, error) == (URLS[1], 1, 'HTTP 503')
+
+
+def test_add_pending_keeps_existing_progress(tmp_path):
+    state = CrawlState(tmp_path / 'state.db')
+    state.mark_completed(URLS[0])
+    state.add_pending(URLS[:2])
+    assert state.status(URLS[0]) == COMPLETED
+    assert state.status(URLS[1]) == PENDING
+
+
+def test_retry_counts_attempts_and_clears_the_error(tmp_path):
+    state = CrawlState(tmp_path / 'state.db')
+    state.mark_failed(URLS[0], 'timeout')
+    state.mark_failed(URLS[0], 'HTTP 429')
+    [(url, attempts, _, error)] = state.failures()
+    assert (url, attempts, error) == (URLS[0], 2, 'HTTP 429')
+
+    state.mark_completed(URLS[0])
+    row = state.conn.execute('SELECT attempts, last_error FROM urls WHERE url = ?', (URLS[0],)).fetchone()
+    assert row == (3, None)
+    assert state.backlog() == []
+
+
+def test_import_json_progress(tmp_path):
+    progress = tmp_path / 'phase2_progress.json'
+    progress.write_text(json.dumps({'completed': URLS[:2], 'failed': URLS[2:3],
+                                    'lastUpdate': '2026-01-01 00:00:00'}), encoding='utf-8')
+    state = CrawlState(tmp_path / 'state.db')
+    assert state.is_empty()
+    assert state.import_json_progress(progress) == 3
+    assert state.urls_with_status(COMPLETED) == set(URLS[:2])
+    assert state.urls_with_status(FAILED) == {URLS[2]}
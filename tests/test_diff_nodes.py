@@ -0,0 +1,79 @@
+from diff_nodes import diff_databases, make_synthetic
+from node_journal import write_document
+
+BASE_URL = 'https://dev.epicgames.com/documentation/en-us/unreal-engine/BlueprintAPI'
+
+
+def node(name, category='Transformation', **fields):
+    return {'displayName': name, 'category': category,
+            'url': f"{BASE_URL}/{category}/{name.replace(' ', '')}", **fields}
+
+
+def write(path, nodes):
+    write_document(path, {'version': '5.5', 'nodes': iter(nodes)})
+    return path
+
+
+def test_added_removed_changed_and_unchanged(tmp_path):
+    old = write(tmp_path / 'old.json', [
+        node('Get Actor Location'),
+        node('Set Actor Location', description='Moves the actor'),
+        node('Print String', category='Development'),
+    ])
+    new = write(tmp_path / 'new.json', [
+        node('Get Actor Location'),
+        node('Set Actor Location', description='Moves the actor, sweeping'),
+        node('Delay', category='Utilities'),
+    ])
+
+    changelog = diff_databases(old, new)
+    assert changelog['summary'] == {'added': 1, 'removed': 1, 'changed': 1, 'unchanged': 1}
+    assert [n['displayName'] for n in changelog['added']] == ['Delay']
+    assert [n['displayName'] for n in changelog['removed']] == ['Print String']
+    assert changelog['changed'] == [{
+        'key': f"{BASE_URL}/Transformation/SetActorLocation",
+        'fields': {'description': {'old': 'Moves the actor', 'new': 'Moves the actor, sweeping'}},
+    }]
+    assert changelog['affectedCategories'] == ['Development', 'Transformation', 'Utilities']
+
+
+def test_url_move_with_same_class_identity_is_a_change(tmp_path):
+    identity = {'className': 'K2Node_CallFunction', 'functionName': 'K2_SetActorLocation'}
+    old = write(tmp_path / 'old.json', [node('Set Actor Location', **identity)])
+    moved = {**node('Set Actor Location', **identity), 'url': f"{BASE_URL}/Actor/SetActorLocation"}
+    new = write(tmp_path / 'new.json', [moved])
+
+    changelog = diff_databases(old, new)
+    assert changelog['summary'] == {'added': 0, 'removed': 0, 'changed': 1, 'unchanged': 0}
+    entry = changelog['changed'][0]
+    assert entry['previousKey'] == f"{BASE_URL}/Transformation/SetActorLocation"
+    assert entry['key'] == f"{BASE_URL}/Actor/SetActorLocation"
+    assert set(entry['fields']) == {'url'}
+
+
+def test_formatting_only_differences_are_unchanged(tmp_path):
+    old = write(tmp_path / 'old.json', [node('Delay', category='Utilities', canSpawn=True)])
+    new = tmp_path / 'new.json'
+    # Same values, different key order and spacing
+    new.write_text('{"nodes": [ {"canSpawn": true, "url": "%s/Utilities/Delay", '
+                   '"category": "Utilities", "displayName": "Delay"} ]}' % BASE_URL, encoding='utf-8')
+
+    assert diff_databases(old, new)['summary'] == {'added': 0, 'removed': 0, 'changed': 0, 'unchanged': 1}
+
+
+def test_repeated_keys_stay_addressable(tmp_path):
+    twin = {'displayName': 'Make Literal', 'category': 'Utilities'}
+    old = write(tmp_path / 'old.json', [twin, twin])
+    new = write(tmp_path / 'new.json', [twin, {**twin, 'description': 'Second copy'}])
+
+    changelog = diff_databases(old, new)
+    assert changelog['summary']['changed'] == 1
+    assert changelog['changed'][0]['key'] == 'Utilities/Make Literal#1'
+
+
+def test_synthetic_pair(tmp_path):
+    old, new = make_synthetic(2000, tmp_path)
+    summary = diff_databases(old, new)['summary']
+    assert summary['added'] == 20
+    assert summary['removed'] + summary['changed'] + summary['unchanged'] == 2000
+    assert summary['changed'] > 0 and summary['removed'] > 0
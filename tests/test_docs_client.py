@@ -0,0 +1,86 @@
+from docs_client import DocsClient, store_dir
+from page_store import DELTA_KEY, PageStore
+
+PATH = 'en-us/unreal-engine/BlueprintAPI/Actor'
+
+
+def page(description):
+    return {
+        'title': 'Actor',
+        'description': description,
+        'blocks': [{'type': 'markdown', 'content_html': '<block-dir-item page-name="Get Actor Location">'}],
+    }
+
+
+def test_versions_fetched_in_one_run_store_deltas(tmp_path):
+    base_store = PageStore(tmp_path / 'store')
+    base = DocsClient(version='5.5', cache_dir=tmp_path, base_store=base_store)
+    older = DocsClient(version='5.4', cache_dir=tmp_path, base_store=base_store)
+
+    # The base page is stored after the 5.4 client was created
+    base.save_cached(PATH, page('Actor functions'))
+    older.save_cached(PATH, page('Actor functions (5.4)'))
+
+    assert DELTA_KEY in older.store.deltas.get(PATH)
+    assert older.load_cached(PATH) == page('Actor functions (5.4)')
+    assert base.load_cached(PATH) == page('Actor functions')
+
+
+def test_unshared_base_store_is_opened_per_client(tmp_path):
+    client = DocsClient(version='5.4', cache_dir=tmp_path)
+    client.save_cached(PATH, page('Actor functions (5.4)'))
+
+    # No base copy: stored in full
+    assert DELTA_KEY not in client.store.deltas.get(PATH)
+    assert client.load_cached(PATH) == page('Actor functions (5.4)')
+
+
+def test_stores_are_deltas_against_a_non_default_base_version(tmp_path):
+    base_store = PageStore(store_dir(tmp_path, '5.4', '5.4'))
+    base = DocsClient(version='5.4', cache_dir=tmp_path, base_version='5.4', base_store=base_store)
+    older = DocsClient(version='5.3', cache_dir=tmp_path, base_version='5.4', base_store=base_store)
+
+    base.save_cached(PATH, page('Actor functions (5.4)'))
+    older.save_cached(PATH, page('Actor functions (5.3)'))
+
+    assert base.is_base_version
+    assert DELTA_KEY in older.store.deltas.get(PATH)
+    assert older.load_cached(PATH) == page('Actor functions (5.3)')
+    # The default version's store is untouched
+    assert PATH not in PageStore(store_dir(tmp_path, '5.5'))
+
+
+def test_multi_version_scraper_uses_first_version_as_base(tmp_path, monkeypatch):
+    from scraper_with_cache import BlueprintNodeScraperCached
+
+    monkeypatch.chdir(tmp_path)
+    scraper = BlueprintNodeScraperCached(versions=['5.4', '5.3'])
+
+    assert scraper.clients['5.4'].is_base_version
+    assert scraper.clients['5.3'].base_version == '5.4'
+    assert scraper.clients['5.3'].store.base is scraper.clients['5.4'].store
+
+
+def test_request_count_is_exact_across_threads(tmp_path, monkeypatch):
+    import threading
+
+    class Response:
+        status_code = 200
+        headers = {}
+
+        def json(self):
+            return page('Actor functions')
+
+    monkeypatch.setattr('docs_client.get_with_backoff', lambda *args, **kwargs: Response())
+    client = DocsClient(cache_dir=tmp_path)
+
+    def fetch_many():
+        for _ in range(200):
+            client.fetch_document(PATH, use_cache=False)
+
+    threads = [threading.Thread(target=fetch_many) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert client.request_count == 1600
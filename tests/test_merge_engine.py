@@ -0,0 +1,106 @@
+import json
+
+import merge_all_nodes
+from merge_engine import MergeEngine, Source, merge, url_slug
+
+DOCS = 'https://dev.epicgames.com/documentation/en-us/unreal-engine/BlueprintAPI/Transformation/SetActorLocation'
+
+
+def test_url_slug_normalises_host_locale_case_and_query():
+    assert url_slug(DOCS) == 'unreal-engine/blueprintapi/transformation/setactorlocation'
+    assert url_slug(DOCS.replace('en-us', 'en-US').lower() + '/?application_version=5.5#top') == url_slug(DOCS)
+
+
+def test_records_merge_by_url():
+    engine = merge([
+        Source('docs', [{'displayName': 'Set Actor Location', 'url': DOCS, 'description': 'Moves'}], priority=1),
+        Source('rescrape', [{'displayName': 'SetActorLocation', 'url': DOCS.lower() + '/', 'description': 'New'}],
+               priority=2),
+    ])
+    assert engine.nodes() == [{'displayName': 'Set Actor Location', 'url': DOCS, 'description': 'Moves'}]
+    assert engine.report()['conflictCounts']['field'] == 2
+
+
+def test_records_merge_by_function_key():
+    engine = merge([
+        Source('a', [{'functionName': 'K2_SetActorLocation', 'targetClass': '/Script/Engine.Actor'}]),
+        Source('b', [{'functionName': 'setactorlocation', 'targetClass': '/script/engine.actor', 'canSpawn': True}]),
+    ])
+    assert len(engine.entities) == 1
+    assert engine.nodes()[0]['canSpawn'] is True
+
+
+def test_records_merge_by_name_within_category_first():
+    engine = merge([
+        Source('catalog', [{'displayName': 'Get Actor Location', 'category': 'Transformation', 'url': DOCS + 'A'},
+                           {'displayName': 'Get Actor Location', 'category': 'Utilities', 'url': DOCS + 'B'}]),
+        Source('old', [{'displayName': 'K2_GetActorLocation', 'category': 'Utilities', 'className': 'K2Node'}]),
+    ])
+    assert [node.get('className') for node in engine.nodes()] == [None, 'K2Node']
+
+
+def test_ambiguous_name_is_reported_not_merged():
+    engine = merge([
+        Source('catalog', [{'displayName': 'Print', 'category': 'A', 'url': DOCS + 'A'},
+                           {'displayName': 'Print', 'category': 'B', 'url': DOCS + 'B'}]),
+        Source('old', [{'displayName': 'Print', 'category': 'C'}]),
+    ])
+    assert len(engine.entities) == 3
+    assert engine.report()['conflictCounts']['ambiguousName'] == 1
+
+
+def test_different_urls_never_match_by_name():
+    engine = merge([
+        Source('a', [{'displayName': 'Print', 'url': DOCS}]),
+        Source('b', [{'displayName': 'Print', 'url': DOCS + 'Other'}]),
+    ])
+    assert len(engine.entities) == 2
+
+
+def test_source_options():
+    engine = MergeEngine()
+    engine.add_source(Source('catalog', [{'displayName': 'Print', 'url': DOCS, 'description': 'Catalog'}]))
+    engine.add_source(Source('names', [{'displayName': 'Print', 'description': 'Other'}],
+                             match_names=False, create=False))
+    engine.add_source(Source('create_only', [{'url': DOCS, 'description': 'Ignored'}, {'url': DOCS + 'X'}],
+                             update=False))
+    engine.add_source(Source('spawn', [{'url': DOCS, 'className': 'K2Node', 'description': 'Dropped'}],
+                             fields={'className'}))
+    assert engine.nodes() == [{'displayName': 'Print', 'url': DOCS, 'description': 'Catalog', 'className': 'K2Node'},
+                              {'url': DOCS + 'X'}]
+    assert [stats['unmatched'] for stats in engine.source_stats] == [0, 1, 0, 0]
+
+
+def write_nodes(path, nodes):
+    path.write_text(json.dumps({'nodes': nodes}), encoding='utf-8')
+
+
+def test_merge_all_nodes_keeps_baseline_old_node_handling(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    write_nodes(tmp_path / 'ue_blueprint_functions_phase1_5.json', [
+        {'displayName': 'Set Actor Location', 'category': 'Transformation', 'url': DOCS},
+        {'displayName': 'Print String', 'category': 'Utilities', 'url': DOCS + 'Print'},
+    ])
+    write_nodes(tmp_path / 'ue_blueprint_nodes.json', [
+        # Matches by URL: adds spawn info
+        {'displayName': 'SetActorLocation', 'category': 'Transformation', 'url': DOCS, 'className': 'K2Node_CallFunction',
+         'inputs': [{'name': 'NewLocation'}]},
+        # Matches nothing: added as spawnable
+        {'displayName': 'Delay', 'category': 'Utilities', 'url': DOCS + 'Delay', 'className': 'K2Node_Delay'},
+        # No className: added as search-only, unless its URL is already there
+        {'displayName': 'Branch', 'category': 'Utilities', 'url': DOCS + 'Branch'},
+        {'displayName': 'Print', 'category': 'Utilities', 'url': DOCS + 'Print', 'description': 'Ignored'},
+        # No URL: never matched by name
+        {'displayName': 'Print String', 'category': 'Utilities', 'className': 'K2Node_CallFunction'},
+    ])
+    merge_all_nodes.main()
+
+    merged = json.loads((tmp_path / 'ue_blueprint_nodes_merged.json').read_text(encoding='utf-8'))
+    assert (merged['totalNodes'], merged['spawnableNodes'], merged['searchOnlyNodes']) == (4, 2, 2)
+    nodes = {node['displayName']: node for node in merged['nodes']}
+    assert nodes['Set Actor Location']['className'] == 'K2Node_CallFunction'
+    assert nodes['Set Actor Location']['canSpawn'] is True
+    assert nodes['Set Actor Location']['inputs'] == [{'name': 'NewLocation'}]
+    assert nodes['Delay']['canSpawn'] is True
+    assert nodes['Branch']['canSpawn'] is False
+    assert 'className' not in nodes['Print String'] and 'description' not in nodes['Print String']
@@ -0,0 +1,58 @@
+import json
+
+from node_journal import NodeJournal, compact, iter_document_records
+
+
+def test_append_and_scan(tmp_path):
+    journal = NodeJournal(tmp_path / 'nodes.journal.jsonl')
+    journal.extend([{'url': 'a', 'n': 1}, {'url': 'b', 'n': 2}])
+    assert list(journal) == [{'url': 'a', 'n': 1}, {'url': 'b', 'n': 2}]
+    assert journal.appended == 2
+    journal.close()
+
+
+def test_resume_after_crash_mid_append_keeps_new_records(tmp_path):
+    path = tmp_path / 'nodes.journal.jsonl'
+    journal = NodeJournal(path)
+    journal.append({'url': 'a'})
+    journal.close()
+    # Crash while writing the second record
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write('{"url": "b", "det')
+
+    resumed = NodeJournal(path)
+    resumed.reopen()
+    assert resumed.appended == 1
+    resumed.append({'url': 'c'})
+    resumed.close()
+
+    assert list(NodeJournal(path)) == [{'url': 'a'}, {'url': 'c'}]
+    assert path.read_text(encoding='utf-8').endswith('{"url": "c"}\n')
+
+
+def test_torn_only_line_is_dropped(tmp_path):
+    path = tmp_path / 'nodes.journal.jsonl'
+    path.write_text('{"url": "a', encoding='utf-8')
+    journal = NodeJournal(path)
+    journal.append({'url': 'b'})
+    journal.close()
+    assert list(journal) == [{'url': 'b'}]
+
+
+def test_prune_keeps_latest_record_per_key(tmp_path):
+    journal = NodeJournal(tmp_path / 'nodes.journal.jsonl')
+    journal.extend([{'url': 'a', 'v': 1}, {'url': 'b', 'v': 1}, {'url': 'a', 'v': 2}])
+    assert journal.prune(lambda record: record['url']) == 2
+    assert list(journal) == [{'url': 'b', 'v': 1}, {'url': 'a', 'v': 2}]
+
+
+def test_compact_matches_json_dump(tmp_path):
+    journal = NodeJournal(tmp_path / 'nodes.journal.jsonl')
+    records = [{'displayName': 'Get Actor Location', 'pins': ['a', 'b']}, {'displayName': 'Délai'}]
+    journal.extend(records)
+    output = tmp_path / 'nodes.json'
+
+    assert compact(journal, output, {'totalNodes': 2}, {'byCategory': {'Actor': 2}}) == 2
+    document = {'totalNodes': 2, 'nodes': records, 'byCategory': {'Actor': 2}}
+    assert output.read_text(encoding='utf-8') == json.dumps(document, indent=2, ensure_ascii=False)
+    assert list(iter_document_records(output, chunk_size=8)) == records
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+
+from node_service import CatalogService
+
+NODES = [
+    {'displayName': 'Set Actor Rotation', 'category': 'Transformation', 'canSpawn': True},
+    {'displayName': 'Get Actor Location', 'category': 'Transformation', 'canSpawn': True},
+]
+
+
+@pytest.fixture
+def service(tmp_path):
+    path = tmp_path / 'nodes.json'
+    path.write_text(json.dumps({'nodes': NODES}), encoding='utf-8')
+    return CatalogService(path)
+
+
+@pytest.mark.parametrize('k', ['-1', '2.5', 'abc', '%203', '1_0'])
+def test_search_rejects_bad_k(service, k):
+    status, body = service.handle(f'/search?q=actor&k={k}')
+    assert status == 400
+    assert json.loads(body) == {'error': 'k must be a non-negative integer'}
+
+
+def test_search_limits_results_to_k(service):
+    status, body = service.handle('/search?q=actor&k=1')
+    assert status == 200
+    assert len(json.loads(body)['results']) == 1
+
+
+def test_spawn_serves_t3d_and_is_not_cached(tmp_path):
+    node = {'displayName': 'Set Actor Rotation', 'category': 'Transformation', 'canSpawn': True,
+            'className': 'K2Node_CallFunction', 'functionName': 'K2_SetActorRotation',
+            'targetClass': '/Script/Engine.Actor', 'inputs': [], 'outputs': []}
+    path = tmp_path / 'nodes.json'
+    path.write_text(json.dumps({'nodes': [node]}), encoding='utf-8')
+    service = CatalogService(path)
+
+    status, body = service.handle('/nodes/0/spawn?x=120&y=-40')
+    assert status == 200
+    t3d = json.loads(body)['t3d']
+    assert t3d.startswith('Begin Object Class="/Script/BlueprintGraph.K2Node_CallFunction"')
+    assert 'NodePosX=120\n    NodePosY=-40' in t3d
+    assert 'MemberName="K2_SetActorRotation"' in t3d
+    # Every request gets fresh GUIDs
+    assert json.loads(service.handle('/nodes/0/spawn?x=120&y=-40')[1])['t3d'] != t3d
+    assert service.handle('/nodes/0/spawn?x=left')[0] == 400
+    assert service.handle('/nodes/0/spawn?y=--5')[0] == 400
+
+
+def test_search_only_node_has_no_spawn(service):
+    status, body = service.handle('/nodes/0/spawn')
+    assert status == 404
+
+
+def test_route_errors_are_500_json(service, monkeypatch):
+    def broken(*args):
+        raise KeyError('displayName')
+
+    monkeypatch.setattr(service, 'route', broken)
+    status, body = service.handle('/nodes/0')
+    assert status == 500
+    assert 'error' in json.loads(body)
+    # Not cached: the next request is routed again
+    monkeypatch.undo()
+    assert service.handle('/nodes/0')[0] == 200
@@ -0,0 +1,46 @@
+from crawl_frontier import ListFrontier
+from parse_pipeline import CrawlPipeline
+
+TREE = {'root': ['a', 'bad-fetch', 'bad-handle', 'bad-parse'], 'a': ['a1'], 'bad-handle': ['lost']}
+
+
+class RecordingFrontier(ListFrontier):
+    def __init__(self):
+        super().__init__()
+        self.completed = []
+        self.failed = {}
+
+    def complete(self, item, children):
+        self.completed.append(item)
+        super().complete(item, children)
+
+    def fail(self, item, error=''):
+        self.failed[item] = error
+
+
+def fetch(item):
+    if item == 'bad-fetch':
+        raise ConnectionError('connection reset')
+    return {'path': item}
+
+
+def parse(payload, item):
+    if item == 'bad-parse':
+        raise ValueError('broken page')
+    return TREE.get(payload['path'], [])
+
+
+def handle(item, children):
+    if item == 'bad-handle':
+        raise KeyError('title')
+    return children
+
+
+def test_failing_items_are_failed_and_the_crawl_continues():
+    frontier = RecordingFrontier()
+    CrawlPipeline(fetch, parse, handle, fetch_workers=2, parse_workers=1).run(['root'], frontier)
+
+    assert sorted(frontier.completed) == ['a', 'a1', 'root']
+    assert frontier.failed['bad-fetch'].startswith('fetch error')
+    assert frontier.failed['bad-parse'].startswith('parse error')
+    assert frontier.failed['bad-handle'].startswith('handler error')
@@ -0,0 +1,54 @@
+import json
+
+from page_store import PageStore, legacy_cache_name
+from parsed_cache import ParsedPageCache, document_sha1, iter_parsed_pages, load_parsed_page
+
+PATH = 'en-us/unreal-engine/BlueprintAPI/Actor'
+DOCUMENT = {
+    'title': 'Actor',
+    'blocks': [{'type': 'markdown', 'content_html': '<block-dir-item page-name="Get Actor Location">'}],
+}
+
+
+def store_page(cache_dir):
+    store = PageStore(cache_dir / 'store')
+    store.put(PATH, DOCUMENT)
+    store.close()
+
+
+def test_store_records_the_document_key(tmp_path):
+    store = PageStore(tmp_path / 'store')
+    store.put(PATH, DOCUMENT)
+    assert store.index[next(iter(store.index))]['sha1'] == document_sha1(DOCUMENT)
+    store.close()
+
+
+def test_legacy_file_shares_the_document_key(tmp_path):
+    # Legacy files were written indented, so their bytes hash differently
+    (tmp_path / f"{legacy_cache_name(PATH)}.json").write_text(json.dumps(DOCUMENT, indent=2), encoding='utf-8')
+    cache = ParsedPageCache(tmp_path / 'parsed')
+    page = load_parsed_page(tmp_path, PATH, cache)
+    assert document_sha1(DOCUMENT) in cache
+    assert list(iter_parsed_pages(tmp_path, cache)) == [(legacy_cache_name(PATH), page)]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_corrupt_entry_is_reparsed_and_replaced(tmp_path):
+    store_page(tmp_path)
+    cache = ParsedPageCache(tmp_path / 'parsed')
+    [(_, page)] = iter_parsed_pages(tmp_path, cache)
+    cache.path(document_sha1(DOCUMENT)).write_bytes(b'\x00corrupt')
+
+    # The payload was skipped for the (corrupt) cached entry, and is read when it fails to load
+    cache = ParsedPageCache(tmp_path / 'parsed')
+    assert list(iter_parsed_pages(tmp_path, cache)) == [(legacy_cache_name(PATH), page)]
+    assert cache.misses == 1
+    assert cache.load(document_sha1(DOCUMENT)) == page
+
+
+def test_unloadable_entry_is_deleted(tmp_path):
+    cache = ParsedPageCache(tmp_path / 'parsed')
+    cache.save('abc', {'blocks': []})
+    cache.path('abc').write_bytes(b'')
+    assert cache.load('abc') is None
+    assert 'abc' not in cache
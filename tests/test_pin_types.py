@@ -0,0 +1,91 @@
+import pytest
+
+from pin_types import class_object, parse_type_text, pin_type, resolve_pin, struct_object
+
+ACTOR = class_object('/Script/Engine.Actor')
+OBJECT = class_object('/Script/CoreUObject.Object')
+VECTOR = struct_object('/Script/CoreUObject.Vector')
+
+
+@pytest.mark.parametrize('text, expected', [
+    ('Boolean', pin_type('bool')),
+    ('Float (double-precision)', pin_type('real', 'double')),
+    ('Float (single-precision)', pin_type('real', 'float')),
+    ('Integer64', pin_type('int64')),
+    ('Vector', pin_type('struct', '', VECTOR)),
+    ('Hit Result Structure', pin_type('struct', '', struct_object('/Script/Engine.HitResult'))),
+    ('Actor Object Reference', pin_type('object', '', ACTOR)),
+    ('Player Controller Class Reference', pin_type('class', '', class_object('/Script/Engine.PlayerController'))),
+    ('Array of Actor Object Reference', {**pin_type('object', '', ACTOR), 'containerType': 'Array'}),
+    ('set of name', {**pin_type('name'), 'containerType': 'Set'}),
+])
+def test_parse_type_text(text, expected):
+    assert parse_type_text(text) == expected
+
+
+@pytest.mark.parametrize('text', ['', 'Widget Object Reference', 'Map of Name to Integer', 'Array of Widget'])
+def test_parse_type_text_unknown(text):
+    assert parse_type_text(text) is None
+
+
+def test_resolve_pin_typed():
+    assert resolve_pin({'name': 'bSweep', 'type': 'Boolean'}) == (pin_type('bool'), 'typed')
+
+
+def test_resolve_pin_self_uses_target_class():
+    target = '/Script/Engine.SceneComponent'
+    assert resolve_pin({'name': 'self', 'type': 'object'}, target) == (pin_type('object', '', class_object(target)), 'hint')
+
+
+def test_resolve_pin_object_hint_from_name():
+    assert resolve_pin({'name': 'OtherActor', 'type': 'object'}) == (pin_type('object', '', ACTOR), 'hint')
+
+
+@pytest.mark.parametrize('name, description', [
+    ('SpawnTransform', ''),
+    ('Value', 'The scale factor applied'),
+])
+def test_resolve_pin_class_hints_are_whole_words(name, description):
+    # 'pawn' in SpawnTransform and 'actor' in "scale factor" are not hints
+    pin = {'name': name, 'type': 'object', 'description': description}
+    assert resolve_pin(pin) == (pin_type('object', '', OBJECT), 'fallback')
+
+
+def test_resolve_pin_class_hint_prefers_longest_words():
+    pin = {'name': 'OwningPlayerController', 'type': 'object'}
+    assert resolve_pin(pin) == (pin_type('object', '', class_object('/Script/Engine.PlayerController')), 'hint')
+
+
+def test_resolve_pin_struct_hints():
+    assert resolve_pin({'name': 'NewLocation', 'type': 'struct'}) == (pin_type('struct', '', VECTOR), 'hint')
+    # A description naming two structs is ambiguous
+    pin = {'name': 'Value', 'type': 'struct', 'description': 'The rotation applied to the transform'}
+    resolved, outcome = resolve_pin(pin)
+    assert outcome == 'ambiguous'
+    assert resolved == pin_type('struct', '', struct_object('/Script/CoreUObject.Transform'))
+
+
+def test_resolve_pin_fallbacks():
+    assert resolve_pin({'name': 'Thing', 'type': 'object'}) == (pin_type('object', '', OBJECT), 'fallback')
+    assert resolve_pin({'name': 'Thing', 'type': ''}) == (pin_type('wildcard'), 'fallback')
+
+
+def test_resolve_pin_unknown_struct_is_ambiguous_wildcard():
+    assert resolve_pin({'name': 'Settings', 'type': 'struct'}) == (pin_type('wildcard'), 'ambiguous')
+    # 'color' inside 'Colorize' is not a hint word
+    assert resolve_pin({'name': 'Colorize', 'type': 'struct'}) == (pin_type('wildcard'), 'ambiguous')
+
+
+def test_resolve_pin_array_is_not_a_single_object():
+    resolved, outcome = resolve_pin({'name': 'Actors', 'type': 'Array of Actor Object Reference'})
+    assert (resolved, outcome) == ({**pin_type('object', '', ACTOR), 'containerType': 'Array'}, 'typed')
+
+
+def test_resolve_pin_array_element_hint():
+    resolved, outcome = resolve_pin({'name': 'IgnoredActors', 'type': 'Array of Object Reference'})
+    assert (resolved, outcome) == ({**pin_type('object', '', ACTOR), 'containerType': 'Array'}, 'hint')
+
+
+def test_resolve_pin_map_is_ambiguous():
+    resolved, outcome = resolve_pin({'name': 'Scores', 'type': 'Map of Name to Integer'})
+    assert (resolved, outcome) == ({**pin_type('wildcard'), 'containerType': 'Map'}, 'ambiguous')
@@ -0,0 +1,81 @@
+import pytest
+
+from rate_controller import AIMDRateController, get_controller, get_with_backoff, parse_retry_after
+
+
+def test_success_increases_rate_additively_up_to_max():
+    controller = AIMDRateController(initial_rate=1.0, max_rate=1.2, increase=0.1)
+    controller.record_success()
+    assert controller.rate == pytest.approx(1.1)
+    controller.record_success()
+    controller.record_success()
+    assert controller.rate == pytest.approx(1.2)
+    assert controller.successes == 3
+
+
+def test_throttle_cuts_rate_multiplicatively_down_to_min():
+    controller = AIMDRateController(initial_rate=1.0, min_rate=0.2, decrease=0.5)
+    assert controller.record_response(429) is True
+    assert controller.rate == pytest.approx(0.5)
+    controller.record_response(503)
+    controller.record_response(403)
+    assert controller.rate == pytest.approx(0.2)
+    assert controller.throttles == 3
+    assert controller.record_response(200) is False
+
+
+def test_throttle_pause_honours_retry_after_up_to_max_backoff():
+    controller = AIMDRateController(initial_rate=1.0, max_backoff=30.0)
+    assert controller.record_throttle(429, '7') == 7.0
+    assert controller.record_throttle(429, '600') == 30.0
+    # Without Retry-After the pause is one slot at the new rate
+    assert controller.record_throttle(429) == pytest.approx(1 / controller.rate)
+
+
+def test_throttle_pushes_back_the_next_slot():
+    controller = AIMDRateController(initial_rate=1.0)
+    controller.record_throttle(429, '5')
+    assert controller.reserve() == pytest.approx(5.0, abs=0.1)
+
+
+def test_reserve_spaces_requests_at_the_rate():
+    controller = AIMDRateController(initial_rate=4.0)
+    assert controller.reserve() == 0
+    assert controller.reserve() == pytest.approx(0.25, abs=0.01)
+    assert controller.reserve() == pytest.approx(0.5, abs=0.01)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after('12') == 12.0
+    assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+    assert parse_retry_after('soon') is None
+    assert parse_retry_after(None) is None
+
+
+def test_get_controller_keeps_an_explicit_zero_rate():
+    # 0 is a requested rate (clamped to min_rate), not "use the default"
+    controller = get_controller('https://zero-rate.test/page', initial_rate=0)
+    assert controller.rate == controller.min_rate
+    assert get_controller('https://zero-rate.test/other') is controller
+
+
+def test_get_with_backoff_retries_throttled_responses():
+    class Response:
+        def __init__(self, status_code):
+            self.status_code = status_code
+            self.headers = {'Retry-After': '0'}
+
+        def raise_for_status(self):
+            pass
+
+    class Session:
+        def __init__(self):
+            self.statuses = [429, 200]
+
+        def get(self, url, **kwargs):
+            return Response(self.statuses.pop(0))
+
+    get_controller('https://retry.test/', initial_rate=5.0)
+    response = get_with_backoff(Session(), 'https://retry.test/page')
+    assert response.status_code == 200
+    assert get_controller('https://retry.test/').throttles == 1
@@ -0,0 +1,50 @@
+from search_index import build_search_index, linear_scan, query
+
+NODES = [
+    {'displayName': 'Get Actor Location', 'canSpawn': True, 'description': 'Returns the location of the actor.'},
+    {'displayName': 'Set Actor Location', 'canSpawn': True, 'description': 'Moves the actor, then prints its location.'},
+    {'displayName': 'Print String', 'canSpawn': True, 'description': 'Prints a string to the log.'},
+    {'displayName': 'Get Socket Transform', 'canSpawn': False, 'keywords': 'bone location'},
+]
+
+
+def test_index_holds_no_search_texts():
+    index = build_search_index(NODES)
+    assert 'texts' not in index
+    assert index['names'][:3] == ['print string', 'get actor location', 'set actor location']
+
+
+def test_long_queries_match_the_linear_scan():
+    index = build_search_index(NODES)
+    for q in ['location', 'actor', 'the log', 'bone loc', 'ring to', 'zzz']:
+        for spawnable_only in (True, False):
+            got = query(index, NODES, q, limit=len(NODES), spawnable_only=spawnable_only)
+            assert set(got) == linear_scan(NODES, q, spawnable_only)
+
+
+def test_long_query_needs_a_contiguous_match():
+    # 'moves' and 'actor' trigrams are all in node 1, the phrase is not
+    index = build_search_index(NODES)
+    assert query(index, NODES, 'actor moves') == []
+
+
+def test_short_queries_match_every_field_names_first():
+    index = build_search_index(NODES)
+    # 'lo' is also in node 2's description and node 3's keywords, 'pr' in node 1's description
+    assert query(index, NODES, 'lo', spawnable_only=False) == [0, 1, 2, 3]
+    assert query(index, NODES, 'pr') == [2, 1]
+    for q in ['lo', 'pr', 'g', 'zz']:
+        for spawnable_only in (True, False):
+            got = query(index, NODES, q, limit=len(NODES), spawnable_only=spawnable_only)
+            assert set(got) == linear_scan(NODES, q, spawnable_only)
+
+
+def test_short_queries_check_other_fields_only_to_fill_the_limit():
+    index = build_search_index(NODES)
+    assert query(index, NODES, 'lo', limit=2, spawnable_only=False) == [0, 1]
+    assert query(index, NODES, 'lo', limit=3, spawnable_only=False) == [0, 1, 2]
+
+
+def test_matches_rank_name_prefix_first():
+    index = build_search_index(NODES)
+    assert query(index, NODES, 'print') == [2, 1]
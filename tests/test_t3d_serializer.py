@@ -0,0 +1,76 @@
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from t3d_serializer import GuidPool, T3DSerializer, t3d_string
+
+INDEX_HTML = Path(__file__).resolve().parent.parent / 'index.html'
+
+NODES = [
+    {'displayName': 'Set Actor Location', 'className': 'K2Node_CallFunction', 'functionName': 'K2_SetActorLocation',
+     'targetClass': '/Script/Engine.Actor', 'isPure': False,
+     'inputs': [{'name': 'self', 'type': 'object', 'description': 'Target Actor'},
+                {'name': 'NewLocation', 'type': 'struct', 'description': 'The new "world" location'},
+                {'name': 'bSweep', 'type': 'bool', 'description': 'Sweep\nto the destination'}],
+     'outputs': [{'name': 'SweepHitResult', 'type': 'struct', 'description': 'C:\\hit \\ result 100%'},
+                 {'name': 'ReturnValue', 'type': 'bool', 'description': ''}]},
+    {'displayName': 'Get Actor Forward Vector', 'className': 'K2Node_CallFunction', 'isPure': True,
+     'inputs': [{'name': 'self', 'type': 'object', 'description': 'Target Actor',
+                 'pinType': {'category': 'object', 'subCategory': '',
+                             'subCategoryObject': '/Script/CoreUObject.Class\'"/Script/Engine.Actor"\''}}],
+     'outputs': [{'name': 'Actors', 'type': 'Array of Actor Object Reference',
+                  'pinType': {'category': 'object', 'subCategory': '', 'containerType': 'Array',
+                              'subCategoryObject': '/Script/CoreUObject.Class\'"/Script/Engine.Actor"\''}}]},
+    {'displayName': 'Health Points', 'className': 'K2Node_VariableGet'},
+]
+
+# createNodeSerialization() and its helpers from index.html, with fixed names and GUIDs
+HARNESS = '''
+let guidCounter = 0;
+function generateGUID() { return (guidCounter++).toString(16).toUpperCase().padStart(32, '0'); }
+function generateNodeName(className) { return `${className}_Test`; }
+%s
+const nodes = JSON.parse(require('fs').readFileSync(0, 'utf8'));
+console.log(JSON.stringify(nodes.map((node, i) => createNodeSerialization(node, i * 100.5, -i * 40))));
+'''
+
+
+def page_functions(*names):
+    html = INDEX_HTML.read_text(encoding='utf-8').replace('\r\n', '\n')
+    sources = []
+    for name in names:
+        start = html.index(f'        function {name}(')
+        end = html.index('\n        }\n', start) + len('\n        }\n')
+        sources.append(html[start:end])
+    return '\n'.join(sources)
+
+
+class CountingGuids(GuidPool):
+    def __init__(self):
+        super().__init__()
+        self.count = 0
+
+    def take(self, count):
+        guids = [f"{self.count + i:032X}" for i in range(count)]
+        self.count += count
+        return guids
+
+
+def test_t3d_string_escapes_quoted_values():
+    assert t3d_string('say "hi"\n C:\\x') == 'say \\"hi\\"\\n C:\\\\x'
+
+
+@pytest.mark.skipif(shutil.which('node') is None, reason='node is not installed')
+def test_serializer_matches_index_html():
+    script = HARNESS % page_functions('t3dString', 'getPinTypeDetails', 'createNodeSerialization')
+    result = subprocess.run(['node', '-e', script], input=json.dumps(NODES), capture_output=True,
+                            text=True, check=True)
+    expected = json.loads(result.stdout)
+
+    serializer = T3DSerializer(CountingGuids())
+    got = [serializer.serialize(node, i * 100.5, -i * 40, name=f"{node['className']}_Test")
+           for i, node in enumerate(NODES)]
+    assert got == expected